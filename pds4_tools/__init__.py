@@ -5,5 +5,5 @@ __version__ = "0.8"
 __email__ = "lnagdi1@astro.umd.edu"
 __status__ = "Beta"
 
-from .reader import pds4_read
+from .reader import pds4_read, pds4_read_many
 from .viewer import pds4_viewer
@@ -1 +1 @@
-from .core import pds4_read
+from .core import pds4_read, pds4_read_many
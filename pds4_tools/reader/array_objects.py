@@ -4,16 +4,22 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import sys
+import itertools
+import threading
+
+import numpy as np
 
 from .general_objects import Structure, Meta_Class, Meta_Structure
 from .label_objects import get_display_settings_for_lid, get_spectral_characteristics_for_lid
-from .data_types import apply_scaling_and_value_offset
+from .data_types import (apply_scaling_and_value_offset, mask_special_constants, get_scaled_numpy_type,
+                         pds_to_numpy_type)
 
 from ..utils.constants import PDS4_NAMESPACES, PDS4_DATA_FILE_AREAS
 from ..utils.exceptions import PDS4StandardsException
 
 from ..extern import six
 from ..extern.cached_property import threaded_cached_property
+from six.moves import range
 
 # Safe import of OrderedDict
 try:
@@ -21,6 +27,12 @@ try:
 except ImportError:
     from ..extern.ordered_dict import OrderedDict
 
+# Safe import of NDArrayOperatorsMixin (requires NumPy >= 1.13)
+try:
+    from numpy.lib.mixins import NDArrayOperatorsMixin
+except ImportError:
+    NDArrayOperatorsMixin = object
+
 
 class ArrayStructure(Structure):
     """ Stores a single PDS4 array data structure.
@@ -35,9 +47,20 @@ class ArrayStructure(Structure):
     implement it.
     """
 
+    def __init__(self, *args, **kwargs):
+
+        super(ArrayStructure, self).__init__(*args, **kwargs)
+
+        # Controls whether scaling is applied on read-in ('eager') or on access ('lazy') via `from_file`
+        self._scale_mode = 'eager'
+
+        # Controls whether data is converted to native byte order via `from_file`
+        self._native_byteorder = False
+
     @classmethod
     def from_file(cls, data_filename, structure_label, full_label,
-                  lazy_load=False, no_scale=False, decode_strings=None):
+                  lazy_load=False, no_scale=False, decode_strings=None, scale_mode='eager',
+                  native_byteorder=False):
         """ Create an array structure from relevant labels and file for the data.
 
         Parameters
@@ -56,6 +79,15 @@ class ArrayStructure(Structure):
             Defaults to False.
         decode_strings : None, optional
             Has no effect because Arrays may not contain string data. Defaults to None.
+        scale_mode : str or unicode, optional
+            If 'eager', the data is scaled (and its bit mask applied) in full when it is read-in. If
+            'lazy', the data is memory mapped in the data type it is stored in, and is instead scaled,
+            bit masked and has its Special_Constants masked on access (see `LazyScaledArray`).
+            Defaults to 'eager'.
+        native_byteorder : bool, optional
+            If True, data stored in non-native byte order is byteswapped (in-place) to native byte order
+            when read. The byte order it was stored in is recorded in ``meta_data.original_byteorder``.
+            Defaults to False.
 
         Returns
         -------
@@ -63,6 +95,9 @@ class ArrayStructure(Structure):
             An object representing the PDS4 array structure; contains its label, data and meta data.
         """
 
+        if scale_mode not in ('eager', 'lazy'):
+            raise ValueError("Unknown scale_mode '{0}'; must be one of 'eager' or 'lazy'.".format(scale_mode))
+
         # Create the meta data structure for this array
         meta_array_structure = Meta_ArrayStructure.from_label(structure_label, full_label)
 
@@ -71,6 +106,8 @@ class ArrayStructure(Structure):
                               structure_label=structure_label, full_label=full_label,
                               parent_filename=data_filename)
         array_structure._no_scale = no_scale
+        array_structure._scale_mode = scale_mode
+        array_structure._native_byteorder = native_byteorder
 
         # Attempt to access the data property such that the data gets read-in (if not on lazy-load)
         if not lazy_load:
@@ -182,13 +219,15 @@ class ArrayStructure(Structure):
 
         Returns
         -------
-        PDS_ndarray or PDS_marray
+        PDS_ndarray, PDS_marray or LazyScaledArray
             An array (either effectively np.ndarray or np.ma.MaskedArray) representing all the data in
-            this array structure.
+            this array structure. If the structure was read with a *scale_mode* of 'lazy', and the data
+            needs to be scaled or bit masked, then an array-like that does so on access.
         """
 
         from .read_arrays import read_array_data
-        read_array_data(self, no_scale=self._no_scale, memmap=False)
+        read_array_data(self, no_scale=self._no_scale, memmap=False, scale_mode=self._scale_mode,
+                        native_byteorder=self._native_byteorder)
 
         return self.data
 
@@ -204,6 +243,14 @@ class ArrayStructure(Structure):
         ArraySection
             An object that allows access to sections of the array without reading the entire array
             into memory.
+
+        Examples
+        --------
+        >>> array_struct.section[0:100, 0:100]
+
+        Caching (scaled) tiles of the array speeds up repeated access of overlapping regions,
+
+        >>> array_struct.section.set_cache(max_bytes=2**28)
         """
 
         from .read_arrays import read_array_data
@@ -240,6 +287,193 @@ class ArrayStructure(Structure):
 
         return array_structure
 
+    def stats(self, axis=None, chunk_bytes=2**22, bins=256, percentiles=(1, 5, 25, 50, 75, 95, 99),
+              max_workers=None):
+        """ Obtain statistics of the (scaled) data, streaming through it one chunk at a time.
+
+        Unless the data is already loaded, it is read memory mapped, and only one chunk at a time is
+        scaled, such that the entire scaled array is never held in memory. Values that are numeric
+        Special_Constants, and NaN values, are excluded from all statistics but counts. The bit mask is
+        applied.
+
+        Notes
+        -----
+        The data is read twice: once to obtain the count, NaN count, min, max, mean and standard deviation,
+        and (if *bins* or *percentiles* are requested) once more for the histogram. Percentiles are
+        estimated from a finer histogram (a streaming sketch), and are accurate to within about
+        ``(max - min) / 16384`` of the exact percentile (plus the spacing of the values nearest to it).
+
+        Parameters
+        ----------
+        axis : int or None, optional
+            If given, statistics are obtained for each index of this axis, over all other axes. Defaults
+            to None, obtaining statistics over the entire array.
+        chunk_bytes : int, optional
+            Approximate number of bytes of memory used to process each chunk, counting the unscaled and
+            scaled data as well as its float64 working copies. Chunks are blocks along the first axis,
+            split along trailing axes when a single index of the first axis exceeds this. Defaults to 4 MB.
+        bins : int or None, optional
+            Number of bins of the histogram, spanning from the minimum to the maximum. If None, the
+            histogram is not obtained. Defaults to 256.
+        percentiles : array_like[int or float] or None, optional
+            Percentiles, between 0 and 100, to estimate. If None, percentiles are not obtained. Defaults to
+            (1, 5, 25, 50, 75, 95, 99).
+        max_workers : int, optional
+            If larger than 1, chunks are processed in parallel by up to this many threads. Defaults to
+            None, processing chunks serially.
+
+        Returns
+        -------
+        OrderedDict
+            Contains the keys 'count' (number of values included in statistics), 'nan_count',
+            'masked_count' (number of values that are Special_Constants), 'min', 'max', 'mean', 'std',
+            'histogram' (a tuple of counts and bin edges, as from ``np.histogram``) and 'percentiles' (an
+            ``OrderedDict`` of percentile to value). If *axis* is given, each value is an array having
+            the length of that axis. Statistics of arrays without any included values are NaN.
+
+        Examples
+        --------
+        >>> stats = array_struct.stats()
+        >>> stats['mean'], stats['std'], stats['percentiles'][99]
+
+        Statistics of each band of a spectral cube, using 4 threads,
+
+        >>> stats = array_struct.stats(axis=0, max_workers=4)
+        """
+
+        from .read_arrays import read_array_data
+
+        if np.issubdtype(pds_to_numpy_type(self.meta_data['Element_Array']['data_type']), np.complexfloating):
+            raise TypeError('Statistics are not supported for complex data.')
+
+        # Obtain the data, scaled on access
+        if self.data_loaded:
+
+            data = self.data
+
+            if isinstance(data, LazyScaledArray):
+                array = LazyScaledArray(data._data, no_scale=data._no_scale, chunk_size=chunk_bytes)
+            else:
+                array = LazyScaledArray(data, no_scale=True, chunk_size=chunk_bytes)
+
+        else:
+
+            structure = self.__class__(structure_meta_data=self.meta_data, structure_label=self.label,
+                                       full_label=self.full_label, parent_filename=self.parent_filename)
+            read_array_data(structure, no_scale=True, memmap=True, scale_mode='lazy')
+
+            data = structure.data
+            if isinstance(data, LazyScaledArray):
+                data = data._data
+
+            array = LazyScaledArray(data, no_scale=self._no_scale, chunk_size=chunk_bytes)
+
+        # Each chunk is a block of the array. Each of its elements takes up memory for the unscaled and the
+        # scaled value, a float64 working copy and a float64 temporary, as well as two boolean masks.
+        num_rows = 1 if (axis is None) else array.shape[axis]
+        element_bytes = array._data.dtype.itemsize + array.dtype.itemsize + 2 * np.dtype('float64').itemsize + 2
+        chunk_slices = _get_block_slices(array.shape, element_bytes, chunk_bytes) if array.size > 0 else []
+
+        def get_chunk(chunk_slice):
+
+            chunk = array[chunk_slice]
+            values = np.ma.getdata(chunk)
+            valid = ~np.ma.getmaskarray(chunk)
+
+            if axis is None:
+                values = values.reshape(1, -1)
+                valid = valid.reshape(1, -1)
+                rows = slice(None)
+
+            else:
+                values = np.moveaxis(values, axis, 0).reshape(values.shape[axis], -1)
+                valid = np.moveaxis(valid, axis, 0).reshape(valid.shape[axis], -1)
+                rows = chunk_slice[axis % array.ndim]
+
+            return rows, values.astype('float64', copy=False), valid
+
+        def map_chunks(function):
+
+            if (max_workers is None) or (max_workers <= 1) or (len(chunk_slices) <= 1):
+                for chunk_slice in chunk_slices:
+                    yield function(chunk_slice)
+
+            else:
+
+                from multiprocessing.pool import ThreadPool
+
+                pool = ThreadPool(processes=min(max_workers, len(chunk_slices)))
+
+                try:
+                    for result in pool.imap(function, chunk_slices):
+                        yield result
+                finally:
+                    pool.terminate()
+                    pool.join()
+
+        # First pass: counts and moments
+        moments = _ArrayMoments(num_rows)
+
+        for rows, chunk_moments in map_chunks(lambda chunk_slice: _get_chunk_moments(*get_chunk(chunk_slice))):
+            moments.update(rows, chunk_moments)
+
+        std = np.sqrt(moments.m2 / np.where(moments.count > 0, moments.count, 1))
+        std[moments.count == 0] = np.nan
+
+        result = OrderedDict([('count', moments.count),
+                              ('nan_count', moments.nan_count),
+                              ('masked_count', moments.masked_count),
+                              ('min', np.where(moments.count > 0, moments.min, np.nan)),
+                              ('max', np.where(moments.count > 0, moments.max, np.nan)),
+                              ('mean', np.where(moments.count > 0, moments.mean, np.nan)),
+                              ('std', std)])
+
+        # Second pass: histogram (the histogram used to estimate percentiles has finer bins, which are summed
+        # to obtain the requested histogram)
+        if (bins is not None) or (percentiles is not None):
+
+            num_bins = 256 if (bins is None) else bins
+            num_sketch_bins = num_bins * int(np.ceil(2**14 / num_bins))
+
+            low = np.where(moments.count > 0, moments.min, 0)
+            high = np.where(moments.count > 0, moments.max, 1)
+            bin_width = np.where(high > low, (high - low) / num_sketch_bins, 1)
+
+            sketch = np.zeros((num_rows, num_sketch_bins), dtype='int64')
+
+            def get_chunk_histogram(chunk_slice):
+                rows, values, valid = get_chunk(chunk_slice)
+                return rows, _get_chunk_histogram(values, valid, low[rows], bin_width[rows], num_sketch_bins)
+
+            for rows, chunk_histogram in map_chunks(get_chunk_histogram):
+                sketch[rows] += chunk_histogram
+
+            if bins is not None:
+                counts = sketch.reshape(num_rows, num_bins, -1).sum(axis=2)
+                edges = low[:, np.newaxis] + (np.arange(0, num_bins + 1) *
+                                              (bin_width * num_sketch_bins / num_bins)[:, np.newaxis])
+
+                result['histogram'] = (counts, edges)
+
+            if percentiles is not None:
+                result['percentiles'] = OrderedDict(
+                    (percentile, _get_sketch_percentile(sketch, percentile, low, bin_width, moments))
+                    for percentile in percentiles)
+
+        # Obtain scalars for statistics of the entire array
+        if axis is None:
+
+            for key, value in six.iteritems(result):
+
+                if key == 'histogram':
+                    result[key] = (value[0][0], value[1][0])
+                elif key == 'percentiles':
+                    result[key] = OrderedDict((percentile, value[percentile][0]) for percentile in value)
+                else:
+                    result[key] = value[0]
+
+        return result
+
 
 class ArraySection(object):
     """ Stores and allows retrieval of a section of an array.
@@ -252,6 +486,12 @@ class ArraySection(object):
     We use this instead of memory mapping to access extremely large arrays because the latter does not work
     for scaled arrays in which the scaled data type is different from the data type on disk.
 
+    If a tile cache is enabled (see `set_cache`), the array is read and scaled in tiles, and sections
+    selected via integers and slices are assembled from the cached tiles. Repeated access of overlapping
+    regions (e.g. sliding windows or panning) then does not read or scale the same data again. The
+    data type of scaled integer data is determined from the values that are scaled, and therefore may
+    differ depending on whether a cache is used.
+
     Parameters
     ----------
     array_structure : ArrayStructure
@@ -259,13 +499,26 @@ class ArraySection(object):
     no_scale : bool, optional
         If True, returned data will not be adjusted according to the offset and scaling factor.
         Defaults to False.
+    cache_bytes : int, optional
+        Memory budget, in bytes, of the tile cache. Defaults to 0, disabling the cache.
+    tile_shape : array_like[int], optional
+        Shape of each tile in the cache. Defaults to tiles of up to 256 elements along each of the last
+        two axes, and 1 element along all other axes.
+
+    Attributes
+    ----------
+    cache : ArrayTileCache or None
+        The tile cache, if enabled.
     """
 
-    def __init__(self, array_structure, no_scale=False):
+    def __init__(self, array_structure, no_scale=False, cache_bytes=0, tile_shape=None):
 
         self._structure = array_structure
         self._no_scale = no_scale
 
+        self.cache = None
+        self.set_cache(cache_bytes, tile_shape=tile_shape)
+
     def __getitem__(self, idx):
         """ Obtain a portion of the array.
 
@@ -281,6 +534,55 @@ class ArraySection(object):
             The selected portion of the array.
         """
 
+        if self.cache is not None:
+
+            # Only integers and slices can be assembled from tiles, other indexes are read directly
+            tile_selections = self.cache.get_tile_selections(idx)
+
+            if tile_selections is not None:
+                return self._assemble_tiles(tile_selections)
+
+        return self._read(idx)
+
+    def set_cache(self, max_bytes=2**26, tile_shape=None):
+        """ Enable, resize or disable the tile cache.
+
+        Any previously cached tiles are discarded.
+
+        Parameters
+        ----------
+        max_bytes : int, optional
+            Memory budget, in bytes, of the tile cache. Once exceeded, the least recently used tiles are
+            discarded. A value of 0 disables the cache. Defaults to 64 MB.
+        tile_shape : array_like[int], optional
+            Shape of each tile. See class docstring for the default.
+
+        Returns
+        -------
+        None
+        """
+
+        if max_bytes <= 0:
+            self.cache = None
+
+        else:
+            array_shape = self._structure.meta_data.dimensions()
+            self.cache = ArrayTileCache(array_shape, max_bytes, tile_shape=tile_shape)
+
+    def _read(self, idx):
+        """ Read and scale a portion of the array, without the use of any cache.
+
+        Parameters
+        ----------
+        idx : str, slice, array_like
+            See `__getitem__`.
+
+        Returns
+        -------
+        PDS_ndarray, PDS_marray, np.void, np.mvoid, np.record, any np.dtype
+            The selected portion of the array.
+        """
+
         # Obtain data for the key (``.data`` should be memory mapped for this structure), and
         # then copy it so that it can be scaled below
         data = self._structure.data[idx].copy()
@@ -296,6 +598,771 @@ class ArraySection(object):
 
         return data
 
+    def _assemble_tiles(self, tile_selections):
+        """ Assemble a portion of the array from (cached) tiles.
+
+        Parameters
+        ----------
+        tile_selections : tuple
+            See `ArrayTileCache.get_tile_selections`.
+
+        Returns
+        -------
+        PDS_ndarray, PDS_marray or any np.dtype
+            The selected portion of the array.
+        """
+
+        from .data import PDS_array
+
+        axis_selections, output_shape, squeeze_axes = tile_selections
+
+        # Obtain each tile that overlaps the selection, along with the portion of the output it fills
+        tiles = []
+
+        for axis_tiles in itertools.product(*axis_selections):
+
+            tile_idx = tuple(tile_num for tile_num, output_slice, tile_slice in axis_tiles)
+            tile = self.cache.get(tile_idx, self._read)
+
+            output_slices = tuple(output_slice for tile_num, output_slice, tile_slice in axis_tiles)
+            tile_slices = tuple(tile_slice for tile_num, output_slice, tile_slice in axis_tiles)
+
+            tiles.append((tile, output_slices, tile_slices))
+
+        # Fill the output from the tiles
+        dtype = np.result_type(*[tile.dtype for tile, _, _ in tiles])
+        masked = any(isinstance(tile, np.ma.MaskedArray) for tile, _, _ in tiles)
+
+        data = np.empty(output_shape, dtype=dtype)
+        if masked:
+            data = np.ma.MaskedArray(data, mask=np.zeros(output_shape, dtype='bool'))
+
+        for tile, output_slices, tile_slices in tiles:
+            data[output_slices] = tile[tile_slices]
+
+        # Remove axes selected via an integer
+        data = data[tuple(0 if axis in squeeze_axes else slice(None) for axis in range(0, len(output_shape)))]
+
+        if data.ndim == 0:
+            return data[()]
+
+        return PDS_array(data, self._structure.meta_data)
+
+
+class ArrayTileCache(object):
+    """ A least-recently-used cache of (scaled) tiles of an array.
+
+    Parameters
+    ----------
+    array_shape : array_like[int]
+        Shape of the array.
+    max_bytes : int
+        Memory budget, in bytes. Once exceeded, the least recently used tiles are discarded.
+    tile_shape : array_like[int], optional
+        Shape of each tile. Defaults to tiles of up to 256 elements along each of the last two axes, and
+        1 element along all other axes.
+
+    Attributes
+    ----------
+    array_shape : tuple[int]
+        Shape of the array.
+    tile_shape : tuple[int]
+        Shape of each tile.
+    max_bytes : int
+        Memory budget, in bytes.
+    nbytes : int
+        Number of bytes used by the cached tiles.
+    hits : int
+        Number of tiles obtained from the cache.
+    misses : int
+        Number of tiles that had to be read.
+    """
+
+    def __init__(self, array_shape, max_bytes, tile_shape=None):
+
+        self.array_shape = tuple(array_shape)
+        self.max_bytes = max_bytes
+
+        if tile_shape is None:
+            tile_shape = [1] * max(0, len(self.array_shape) - 2) + [256] * min(2, len(self.array_shape))
+
+        if len(tile_shape) != len(self.array_shape):
+            raise ValueError('Tile shape {0} does not have the same number of axes as the array {1}.'
+                             .format(tuple(tile_shape), self.array_shape))
+
+        self.tile_shape = tuple(max(1, min(tile_length, axis_length))
+                                for tile_length, axis_length in zip(tile_shape, self.array_shape))
+
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+        self._tiles = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        """
+        Returns
+        -------
+        int
+            Number of cached tiles.
+        """
+
+        return len(self._tiles)
+
+    def get(self, tile_idx, read):
+        """ Obtain a tile, from the cache if possible.
+
+        Parameters
+        ----------
+        tile_idx : tuple[int]
+            The tile number along each axis.
+        read : callable
+            Called with a ``tuple`` of slices to read the tile, if it is not cached.
+
+        Returns
+        -------
+        np.ndarray or np.ma.MaskedArray
+            The tile. Should not be modified.
+        """
+
+        with self._lock:
+
+            tile = self._tiles.pop(tile_idx, None)
+
+            if tile is not None:
+                self.hits += 1
+                self._tiles[tile_idx] = tile
+
+                return tile
+
+        tile_slices = tuple(slice(tile_num * tile_length, (tile_num + 1) * tile_length)
+                            for tile_num, tile_length in zip(tile_idx, self.tile_shape))
+        tile = read(tile_slices)
+
+        with self._lock:
+
+            self.misses += 1
+
+            if tile_idx not in self._tiles:
+                self._tiles[tile_idx] = tile
+                self.nbytes += self._get_nbytes(tile)
+
+            # Discard the least recently used tiles once the memory budget is exceeded
+            while (self.nbytes > self.max_bytes) and (len(self._tiles) > 1):
+                _, discarded_tile = self._tiles.popitem(last=False)
+                self.nbytes -= self._get_nbytes(discarded_tile)
+
+        return tile
+
+    def clear(self):
+        """ Discard all cached tiles, and reset the hit and miss counters.
+
+        Returns
+        -------
+        None
+        """
+
+        with self._lock:
+            self._tiles.clear()
+            self.nbytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def get_tile_selections(self, idx):
+        """ Determine which portion of each tile is selected by an index.
+
+        Parameters
+        ----------
+        idx : any
+            An index of the array.
+
+        Returns
+        -------
+        tuple or None
+            None if *idx* cannot be assembled from tiles (e.g., it is not made of only integers and slices,
+            or it selects no elements). Otherwise a three-valued tuple of: for each axis, a ``list`` of
+            (tile number, slice of the output, slice of the tile) for each tile that the selection overlaps
+            on that axis; the shape of the output, including axes selected via an integer; and a ``set``
+            of the axes selected via an integer.
+
+        Raises
+        ------
+        IndexError
+            Raised if *idx* contains an integer that is out of bounds.
+        """
+
+        if not isinstance(idx, tuple):
+            idx = (idx, )
+
+        if len(idx) > len(self.array_shape):
+            return None
+
+        idx = idx + (slice(None), ) * (len(self.array_shape) - len(idx))
+
+        axis_selections = []
+        output_shape = []
+        squeeze_axes = set()
+
+        for axis, (axis_idx, axis_length, tile_length) in enumerate(zip(idx, self.array_shape, self.tile_shape)):
+
+            if isinstance(axis_idx, (six.integer_types, np.integer)) and not isinstance(axis_idx, bool):
+
+                axis_idx = int(axis_idx)
+
+                if not (-axis_length <= axis_idx < axis_length):
+                    raise IndexError('Index {0} is out of bounds for axis {1} with size {2}.'
+                                     .format(axis_idx, axis, axis_length))
+
+                start = axis_idx % axis_length
+                positions = range(start, start + 1)
+                squeeze_axes.add(axis)
+
+            elif isinstance(axis_idx, slice):
+                positions = range(*axis_idx.indices(axis_length))
+
+            else:
+                return None
+
+            if len(positions) == 0:
+                return None
+
+            axis_selections.append(self._get_axis_tiles(positions, tile_length))
+            output_shape.append(len(positions))
+
+        return axis_selections, tuple(output_shape), squeeze_axes
+
+    @staticmethod
+    def _get_axis_tiles(positions, tile_length):
+        """ Split the positions selected along a single axis by the tile they are in.
+
+        Parameters
+        ----------
+        positions : range or xrange
+            The selected positions along the axis, in output order.
+        tile_length : int
+            The length of each tile along the axis.
+
+        Returns
+        -------
+        list[tuple]
+            For each tile overlapped, the tile number, the slice of the output and the slice of the tile
+            that correspond to the selected positions in that tile.
+        """
+
+        step = positions[1] - positions[0] if len(positions) > 1 else 1
+        axis_tiles = []
+        output_start = 0
+
+        while output_start < len(positions):
+
+            # Find the output positions in the same tile as the first remaining position
+            tile_num = positions[output_start] // tile_length
+            tile_start = tile_num * tile_length
+
+            if step > 0:
+                tile_edge = tile_start + tile_length
+                num_positions = -(-(tile_edge - positions[output_start]) // step)
+            else:
+                tile_edge = tile_start - 1
+                num_positions = -(-(positions[output_start] - tile_edge) // -step)
+
+            output_stop = min(output_start + num_positions, len(positions))
+
+            # Positions within the tile, as a slice of the tile
+            first_position = positions[output_start] - tile_start
+            last_position = positions[output_stop - 1] - tile_start
+            stop = last_position + (1 if step > 0 else -1)
+
+            tile_slice = slice(first_position, stop if stop >= 0 else None, step)
+            axis_tiles.append((tile_num, slice(output_start, output_stop), tile_slice))
+
+            output_start = output_stop
+
+        return axis_tiles
+
+    @staticmethod
+    def _get_nbytes(tile):
+        """
+        Returns
+        -------
+        int
+            Number of bytes used by *tile*, including its mask.
+        """
+
+        nbytes = tile.nbytes
+
+        if isinstance(tile, np.ma.MaskedArray) and (tile.mask is not np.ma.nomask):
+            nbytes += tile.mask.nbytes
+
+        return nbytes
+
+
+class LazyScaledArray(NDArrayOperatorsMixin):
+    """ An array-like which scales a PDS4 array on access.
+
+    Stores the data of a PDS4 array in the data type it has in the data file (usually memory mapped),
+    and applies its bit mask, scaling_factor and value_offset only to the portion of the array that is
+    accessed. This allows using arrays whose scaled data, which typically has a larger data type (e.g.
+    float64 for scaled int16 data), does not fit in memory.
+
+    Notes
+    -----
+    Indexing returns the scaled portion of the array, which is masked for numeric Special_Constants if
+    there are any. NumPy ufuncs and arithmetic operators (e.g. ``np.sqrt``, ``+``) are applied one chunk
+    at a time, and `min`, `max`, `sum` and `mean` of the entire array are computed one chunk at a time.
+    Any other operation, such as ``np.asarray``, scales the entire array in memory.
+
+    The data type of scaled integer data is large enough to store any possible scaled value of the
+    stored data type, and therefore may be larger than that of data scaled on read-in.
+
+    Parameters
+    ----------
+    data : PDS_ndarray
+        The unscaled data, having the shape and data type of the array in the data file, and valid
+        PDS4 meta data for the array.
+    no_scale : bool, optional
+        If True, data will not be adjusted according to the offset and scaling factor; only the bit
+        mask will be applied. Defaults to False.
+    chunk_size : int, optional
+        Number of bytes of unscaled data that ufuncs and reductions process at a time. Defaults to 4 MB.
+    native_byteorder : bool, optional
+        If True, accessed data is converted to native byte order. Defaults to False.
+
+    Attributes
+    ----------
+    meta_data : Meta_ArrayStructure
+        Meta data of the array.
+    """
+
+    def __init__(self, data, no_scale=False, chunk_size=2**22, native_byteorder=False):
+
+        self._data = data
+        self._no_scale = no_scale
+        self._chunk_size = chunk_size
+        self._native_byteorder = native_byteorder
+
+        self.meta_data = data.meta_data
+
+    def __getitem__(self, idx):
+        """ Obtain a scaled portion of the array.
+
+        Parameters
+        ----------
+        idx : int, slice, array_like
+            Standard ``np.ndarray`` indexes.
+
+        Returns
+        -------
+        PDS_ndarray, PDS_marray or any np.dtype
+            The selected portion of the array, scaled.
+        """
+
+        from .data import PDS_array
+        from .read_arrays import _apply_bitmask
+
+        special_constants = self.meta_data.get('Special_Constants')
+
+        # Copy the selection out of the (memory mapped) data, such that it can be modified in-place below
+        data = np.array(self._data[idx])
+
+        bit_mask = self.meta_data.get('Object_Statistics', {}).get('bit_mask')
+        if bit_mask is not None:
+            bit_mask_string = six.text_type(bit_mask).zfill(data.dtype.itemsize * 8)
+            _apply_bitmask(data.reshape(-1), bit_mask_string, special_constants=special_constants)
+
+        if not self._no_scale:
+            element_array = self.meta_data['Element_Array']
+            data = apply_scaling_and_value_offset(data,
+                                                  element_array.get('scaling_factor'),
+                                                  element_array.get('value_offset'),
+                                                  special_constants=special_constants)
+
+        # Ensure the data type does not depend on the selection
+        if data.dtype != self.dtype:
+            data = data.astype(self.dtype)
+
+        data = mask_special_constants(data, special_constants=special_constants)
+
+        if data.ndim == 0:
+            return data[()]
+
+        return PDS_array(data, self.meta_data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __array__(self, dtype=None):
+        return np.asarray(self[...], dtype=dtype)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+
+        if any(isinstance(output, LazyScaledArray) for output in kwargs.get('out', ())):
+            return NotImplemented
+
+        # Apply element-wise ufuncs one chunk at a time, when no broadcasting against other arrays is needed
+        chunkable = (method == '__call__') and (ufunc.nout == 1) and ('out' not in kwargs) and all(
+            input.shape == self.shape if isinstance(input, LazyScaledArray) else np.ndim(input) == 0
+            for input in inputs)
+
+        if chunkable and self.size > 0:
+
+            result = None
+
+            for chunk in self._get_chunk_slices():
+
+                chunk_inputs = [input[chunk] if isinstance(input, LazyScaledArray) else input for input in inputs]
+                chunk_result = ufunc(*chunk_inputs, **kwargs)
+
+                if result is None:
+                    result = np.empty(self.shape, dtype=chunk_result.dtype)
+
+                    if isinstance(chunk_result, np.ma.MaskedArray):
+                        result = np.ma.MaskedArray(result, mask=np.zeros(self.shape, dtype='bool'))
+
+                result[chunk] = chunk_result
+
+            return result
+
+        # Otherwise scale all data
+        inputs = [input[...] if isinstance(input, LazyScaledArray) else input for input in inputs]
+
+        return getattr(ufunc, method)(*inputs, **kwargs)
+
+    @property
+    def shape(self):
+        """
+        Returns
+        -------
+        tuple
+            Shape of the array.
+        """
+        return self._data.shape
+
+    @property
+    def ndim(self):
+        """
+        Returns
+        -------
+        int
+            Number of dimensions of the array.
+        """
+        return self._data.ndim
+
+    @property
+    def size(self):
+        """
+        Returns
+        -------
+        int
+            Number of elements in the array.
+        """
+        return self._data.size
+
+    @threaded_cached_property
+    def dtype(self):
+        """
+        Returns
+        -------
+        np.dtype
+            Data type of the scaled array.
+        """
+
+        dtype = self._data.dtype
+
+        if not self._no_scale:
+
+            scaling_factor = self.meta_data['Element_Array'].get('scaling_factor')
+            value_offset = self.meta_data['Element_Array'].get('value_offset')
+
+            # Integers are scaled into a data type that can store their entire range, such that it does not
+            # depend on the values in the data
+            data = np.array([], dtype=dtype)
+
+            if np.issubdtype(dtype, np.integer):
+                data = np.array([np.iinfo(dtype).min, np.iinfo(dtype).max], dtype=dtype)
+
+            dtype = get_scaled_numpy_type(data=data, scaling_factor=scaling_factor, value_offset=value_offset)
+
+        if self._native_byteorder:
+            dtype = dtype.newbyteorder('=')
+
+        return dtype
+
+    def min(self, axis=None, **kwargs):
+        """ Minimum of the scaled array. See ``np.ndarray.min``. """
+        return self._reduce('min', axis, **kwargs)
+
+    def max(self, axis=None, **kwargs):
+        """ Maximum of the scaled array. See ``np.ndarray.max``. """
+        return self._reduce('max', axis, **kwargs)
+
+    def sum(self, axis=None, **kwargs):
+        """ Sum of the scaled array. See ``np.ndarray.sum``. """
+        return self._reduce('sum', axis, **kwargs)
+
+    def mean(self, axis=None, **kwargs):
+        """ Mean of the scaled array. See ``np.ndarray.mean``. """
+
+        if (axis is not None) or kwargs:
+            return self[...].mean(axis=axis, **kwargs)
+
+        total = self._reduce('sum', None)
+        count = sum(np.ma.count(self[chunk]) for chunk in self._get_chunk_slices())
+
+        return total / count if count > 0 else np.ma.masked
+
+    def _reduce(self, method, axis=None, **kwargs):
+        """ Reduce the scaled array, one chunk at a time if reducing all of it.
+
+        Parameters
+        ----------
+        method : str or unicode
+            Name of the ``np.ndarray`` reduction method (e.g. 'min', 'sum').
+        axis : int, tuple or None, optional
+            Axis to reduce. Defaults to None, reducing all of the array.
+        kwargs : dict, optional
+            Keywords passed to the reduction method. Given keywords disable chunking.
+
+        Returns
+        -------
+        any np.dtype, PDS_ndarray or PDS_marray
+            The reduced value(s), or ``np.ma.masked`` if all values are masked.
+        """
+
+        if (axis is not None) or kwargs or (self.size == 0):
+            return getattr(self[...], method)(axis=axis, **kwargs)
+
+        results = [getattr(self[chunk], method)() for chunk in self._get_chunk_slices()]
+        results = [result for result in results if result is not np.ma.masked]
+
+        if len(results) == 0:
+            return np.ma.masked
+
+        return getattr(np.array(results), method)()
+
+    def _get_chunk_slices(self):
+        """
+        Returns
+        -------
+        list[slice]
+            Slices of the first axis, each selecting up to *chunk_size* bytes of the unscaled data.
+        """
+
+        row_size = self._data.dtype.itemsize * int(np.prod(self.shape[1:]))
+        num_rows = max(1, self._chunk_size // max(1, row_size))
+
+        return [slice(start, start + num_rows) for start in range(0, self.shape[0], num_rows)]
+
+
+class _ArrayMoments(object):
+    """ Accumulates the counts, extrema, mean and sum of squared deviations of rows of values.
+
+    Chunks of values are combined via the parallel algorithm of Chan et al., which is numerically stable.
+
+    Parameters
+    ----------
+    num_rows : int
+        Number of rows (independent sets of values) to accumulate statistics for.
+    """
+
+    def __init__(self, num_rows):
+
+        self.count = np.zeros(num_rows, dtype='int64')
+        self.nan_count = np.zeros(num_rows, dtype='int64')
+        self.masked_count = np.zeros(num_rows, dtype='int64')
+        self.min = np.full(num_rows, np.inf)
+        self.max = np.full(num_rows, -np.inf)
+        self.mean = np.zeros(num_rows)
+        self.m2 = np.zeros(num_rows)
+
+    def update(self, rows, chunk_moments):
+        """ Combine the moments of a chunk into the accumulated moments.
+
+        Parameters
+        ----------
+        rows : slice
+            Rows to which the chunk contributes.
+        chunk_moments : _ArrayMoments
+            Moments of the chunk, having the same number of rows as selected by *rows*.
+
+        Returns
+        -------
+        None
+        """
+
+        count = self.count[rows]
+        total_count = count + chunk_moments.count
+        safe_count = np.where(total_count > 0, total_count, 1)
+
+        delta = chunk_moments.mean - self.mean[rows]
+
+        self.mean[rows] += delta * chunk_moments.count / safe_count
+        self.m2[rows] += chunk_moments.m2 + delta**2 * count * chunk_moments.count / safe_count
+
+        self.count[rows] = total_count
+        self.nan_count[rows] += chunk_moments.nan_count
+        self.masked_count[rows] += chunk_moments.masked_count
+        self.min[rows] = np.minimum(self.min[rows], chunk_moments.min)
+        self.max[rows] = np.maximum(self.max[rows], chunk_moments.max)
+
+
+def _get_block_slices(shape, element_bytes, max_bytes):
+    """ Split an array into blocks, each taking up at most a given number of bytes where possible.
+
+    Blocks span the first axis when possible. Otherwise, each block is a single index of each leading axis,
+    and spans the first trailing axis along which a single index fits within *max_bytes* (or a single
+    element, if even that does not fit).
+
+    Parameters
+    ----------
+    shape : tuple[int]
+        Shape of the array.
+    element_bytes : int
+        Number of bytes taken up by each element.
+    max_bytes : int
+        Maximum number of bytes taken up by each block.
+
+    Returns
+    -------
+    list[tuple[slice]]
+        A slice of each axis for each block. Together, the blocks cover the entire array once.
+    """
+
+    ndim = len(shape)
+
+    if ndim == 0:
+        return [()]
+
+    # Find the first axis along which a block containing a single index fits
+    axis = 0
+    while (axis < ndim - 1) and (element_bytes * int(np.prod(shape[axis + 1:])) > max_bytes):
+        axis += 1
+
+    step = max(1, max_bytes // (element_bytes * int(np.prod(shape[axis + 1:]))))
+
+    block_slices = []
+
+    for leading_idx in itertools.product(*[range(0, length) for length in shape[:axis]]):
+        leading_slices = tuple(slice(i, i + 1) for i in leading_idx)
+
+        for start in range(0, shape[axis], step):
+            block_slices.append(leading_slices + (slice(start, start + step), ) +
+                                (slice(None), ) * (ndim - axis - 1))
+
+    return block_slices
+
+
+def _get_chunk_moments(rows, values, valid):
+    """ Obtain the moments of a chunk of values.
+
+    Parameters
+    ----------
+    rows : slice
+        Rows to which the chunk contributes. Passed through to the output.
+    values : np.ndarray
+        2D float array, where each row is a set of values.
+    valid : np.ndarray
+        Boolean array of the same shape as *values*, True where the value is not masked.
+
+    Returns
+    -------
+    tuple[slice, _ArrayMoments]
+        *rows*, and the moments of each row of *values*, excluding masked and NaN values.
+    """
+
+    moments = _ArrayMoments(len(values))
+
+    is_nan = np.isnan(values) & valid
+    valid = valid & ~is_nan
+
+    moments.count = valid.sum(axis=1)
+    moments.nan_count = is_nan.sum(axis=1)
+    moments.masked_count = values.shape[1] - moments.count - moments.nan_count
+
+    moments.min = np.where(valid, values, np.inf).min(axis=1)
+    moments.max = np.where(valid, values, -np.inf).max(axis=1)
+
+    moments.mean = np.where(valid, values, 0).sum(axis=1) / np.where(moments.count > 0, moments.count, 1)
+    moments.m2 = (np.where(valid, values - moments.mean[:, np.newaxis], 0)**2).sum(axis=1)
+
+    return rows, moments
+
+
+def _get_chunk_histogram(values, valid, low, bin_width, num_bins):
+    """ Obtain the histogram of each row of a chunk of values.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        2D float array, where each row is a set of values.
+    valid : np.ndarray
+        Boolean array of the same shape as *values*, True where the value is not masked.
+    low : np.ndarray
+        Lower edge of the first bin, for each row.
+    bin_width : np.ndarray
+        Width of the bins, for each row.
+    num_bins : int
+        Number of bins.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (number of rows, *num_bins*), the count of valid, non-NaN, values in each bin.
+    """
+
+    valid = valid & ~np.isnan(values)
+
+    with np.errstate(invalid='ignore'):
+        bin_idx = np.floor((values - low[:, np.newaxis]) / bin_width[:, np.newaxis])
+
+    bin_idx = np.clip(np.where(valid, bin_idx, 0), 0, num_bins - 1).astype('int64')
+    bin_idx += np.arange(0, len(values))[:, np.newaxis] * num_bins
+
+    histogram = np.bincount(bin_idx[valid], minlength=len(values) * num_bins)
+
+    return histogram.reshape(len(values), num_bins)
+
+
+def _get_sketch_percentile(sketch, percentile, low, bin_width, moments):
+    """ Estimate a percentile of each row from its (fine) histogram.
+
+    Parameters
+    ----------
+    sketch : np.ndarray
+        Array of shape (number of rows, number of bins), the histogram of each row.
+    percentile : int or float
+        Percentile, between 0 and 100, to estimate.
+    low : np.ndarray
+        Lower edge of the first bin, for each row.
+    bin_width : np.ndarray
+        Width of the bins, for each row.
+    moments : _ArrayMoments
+        Moments of each row.
+
+    Returns
+    -------
+    np.ndarray
+        The estimated percentile of each row, interpolated linearly within the bin it falls in.
+    """
+
+    if not (0 <= percentile <= 100):
+        raise ValueError('Percentiles must be between 0 and 100.')
+
+    cumulative = sketch.cumsum(axis=1)
+    target = percentile / 100 * moments.count
+
+    bin_idx = np.argmax(cumulative >= target[:, np.newaxis], axis=1)
+    rows = np.arange(0, len(sketch))
+
+    previous = np.where(bin_idx > 0, cumulative[rows, bin_idx - 1], 0)
+    in_bin = np.where(sketch[rows, bin_idx] > 0, sketch[rows, bin_idx], 1)
+
+    value = low + (bin_idx + (target - previous) / in_bin) * bin_width
+    value = np.clip(value, moments.min, moments.max)
+
+    return np.where(moments.count > 0, value, np.nan)
+
 
 class Meta_ArrayStructure(Meta_Structure):
     """ Meta data about a PDS4 array data structure.
@@ -311,6 +1378,9 @@ class Meta_ArrayStructure(Meta_Structure):
         Meta data about the Display Settings for this array data structure.
     spectral_characteristics : Meta_SpectralCharacteristics
         Meta data about the Spectral Characteristics for this array data structure.
+    original_byteorder : str, unicode or None
+        If the data was converted to native byte order on read-in, the byte order ('<' or '>') it is
+        stored in. Otherwise None.
 
     Inherits all Attributes, Parameters and Properties from `Meta_Structure`.
 
@@ -348,6 +1418,9 @@ class Meta_ArrayStructure(Meta_Structure):
         self.display_settings = None
         self.spectral_characteristics = None
 
+        # Set if the data has been converted from this byte order to native byte order
+        self.original_byteorder = None
+
     @classmethod
     def from_label(cls, xml_array, full_label):
         """ Create a Meta_ArrayStructure from XML originating from a label.
@@ -3,12 +3,18 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import io
 import os
 import sys
+import itertools
+import multiprocessing
+from multiprocessing.pool import ThreadPool
+
+import numpy as np
 
 from .label_objects import Label
 from .read_headers import read_header
-from .read_arrays import read_array
+from .read_arrays import read_array, _get_array_byte_range
 from .read_tables import read_table
 from .general_objects import StructureList
 
@@ -17,13 +23,24 @@ from ..utils.logging import logger_init
 
 from ..extern import six
 
+# Safe import of SimpleQueue (only available from multiprocessing.queues in Python 2)
+try:
+    from multiprocessing import SimpleQueue
+except ImportError:
+    from multiprocessing.queues import SimpleQueue
+
 # Initialize the logger
 logger = logger_init()
 
+# Queue on which a worker process of `pds4_read_many` reports each product it starts reading, set by
+# `_init_read_product_worker`
+_started_products = None
+
 #################################
 
 
-def pds4_read(filename, quiet=False, lazy_load=False, no_scale=False, decode_strings=True):
+def pds4_read(filename, quiet=False, lazy_load=False, no_scale=False, decode_strings=True, stream=False,
+              fields=None, max_workers=None, scale_mode='eager', native_byteorder=False):
     """ Reads PDS4 compliant data into a `StructureList`.
 
         Given a PDS4 label, reads the PDS4 data described in the label and
@@ -58,6 +75,43 @@ def pds4_read(filename, quiet=False, lazy_load=False, no_scale=False, decode_str
             decoded to the a unicode in Python 2, and to the str type in
             Python 3. If False, leaves string types as byte strings.
             Defaults to True.
+        stream : bool, optional
+            If True, no data is read-in when the label is read (implying
+            *lazy_load*), and the data of each table is intended to be
+            read one chunk of records at a time via `TableStructure.iter_chunks`,
+            such that memory usage remains bounded regardless of table size.
+            Defaults to False.
+        fields : dict, optional
+            If given, only the specified fields are read for the specified
+            tables. Keys are the ID (local identifier, name, or e.g. 'TABLE_0')
+            of each table, and values are a list of field names (full or
+            partial) to read for that table. All other fields of that table are
+            skipped entirely. Tables not in *fields* are read in full.
+            Defaults to None.
+        max_workers : int, optional
+            If larger than 1, the data of the PDS4 data structures is read
+            concurrently by up to this many threads. The structures keep
+            the order in which they appear in the label, and a structure
+            whose data cannot be read is logged as an error, without
+            preventing the reading of other structures. If only a single
+            structure is read, then instead the records of a large
+            delimited table are split into chunks that are parsed in
+            parallel by up to this many processes. Defaults to None,
+            reading serially.
+        scale_mode : str or unicode, optional
+            If 'eager', the data of arrays is scaled according to the offset
+            and scaling values when it is read-in. If 'lazy', the data of
+            arrays that need to be scaled is kept in the data type it is
+            stored in (memory mapped), and is instead scaled for only the
+            portion of the array that is accessed, see `LazyScaledArray`.
+            Defaults to 'eager'.
+        native_byteorder : bool, optional
+            If True, data (of arrays and table fields) stored in non-native
+            byte order is byteswapped in-place to native byte order when
+            it is read, which speeds up subsequent NumPy operations on it.
+            The byte order it was stored in is recorded in the
+            ``original_byteorder`` attribute of its meta data. Defaults to
+            False.
 
         Returns
         -------
@@ -131,6 +185,31 @@ def pds4_read(filename, quiet=False, lazy_load=False, no_scale=False, decode_str
             PDS4 Table records
             >>> obs_table[0:1000]
 
+            PDS4 Table records, reading only those records from the data file
+            >>> obs_table.section[-1000:]
+
+        Streaming Example tables:
+
+            To process tables larger than available memory, the label may be
+            read in stream mode and each table read in chunks of records.
+
+            >>> struct_list = pds4_read('/path/to/Example_Label.xml', stream=True)
+            >>> for chunk in struct_list['Observations'].iter_chunks(100000):
+            >>>     chunk['wavelength'].max()
+
+            Only some of the fields of a table may also be read,
+
+            >>> struct_list = pds4_read('/path/to/Example_Label.xml',
+            >>>                         fields={'Observations': ['order', 'wavelength']})
+            >>> obs_table.read_fields(['wavelength'])
+
+            Arrays whose scaled data does not fit in memory may be scaled
+            only once accessed,
+
+            >>> struct_list = pds4_read('/path/to/Example_Label.xml', scale_mode='lazy')
+            >>> unnamed_array.data[0:100, 0:100]
+            >>> unnamed_array.data.max()
+
         Accessing Example Label meta data:
 
             You can access all meta data in the label for a given PDS4 data
@@ -179,9 +258,11 @@ def pds4_read(filename, quiet=False, lazy_load=False, no_scale=False, decode_str
     logger.info('Processing label: ' + filename)
     label = Label.from_file(filename)
 
-    # Read and extract all the PDS4 data structures specified in this label
-    structures = read_structures(label, filename, lazy_load=lazy_load, no_scale=no_scale,
-                                 decode_strings=decode_strings)
+    # Read and extract all the PDS4 data structures specified in this label (in stream mode, data
+    # is only read on request)
+    structures = read_structures(label, filename, lazy_load=lazy_load or stream, no_scale=no_scale,
+                                 decode_strings=decode_strings, fields=fields, max_workers=max_workers,
+                                 scale_mode=scale_mode, native_byteorder=native_byteorder)
 
     # Save the log recording
     log = logger.get_handler('log_handler').get_recording(reset=False)
@@ -201,7 +282,302 @@ def pds4_read(filename, quiet=False, lazy_load=False, no_scale=False, decode_str
     return structure_list
 
 
-def read_structures(label, label_filename, lazy_load=False, no_scale=False, decode_strings=False):
+def pds4_read_many(paths, max_workers=None, lazy_load=False, no_scale=False, decode_strings=True,
+                   fields=None, on_error='raise', max_pending=None):
+    """ Reads many PDS4 products in parallel, using a pool of processes.
+
+    Each product is read by `pds4_read` in a worker process (whose logging is quiet), and a compact
+    form of its structures, containing only the data and meta data but not the label, is returned
+    to this process.
+
+    Notes
+    -----
+    At most *max_pending* products are read (or waiting to be retrieved) at once, such that memory
+    usage remains bounded even if results are consumed slower than they are read.
+
+    Products whose result cannot be returned (e.g. because it cannot be pickled), or whose worker process
+    exits while reading them (e.g. because it is killed), are treated as products that cannot be read.
+
+    Parameters
+    ----------
+    paths : iterable[str or unicode]
+        The filenames, including full or relative path if necessary, of the PDS4 labels to read.
+    max_workers : int, optional
+        Number of processes to read products with. If 1, products are read serially by this process.
+        Defaults to the number of CPUs.
+    lazy_load : bool, optional
+        If True, the data of structures is not read, and None is returned in its place. Defaults
+        to False.
+    no_scale : bool, optional
+        See `pds4_read`. Defaults to False.
+    decode_strings : bool, optional
+        See `pds4_read`. Defaults to True.
+    fields : dict, optional
+        See `pds4_read`. Applied to every product. Defaults to None.
+    on_error : str or unicode, optional
+        Action to take if a product cannot be read. If 'raise', the exception is raised (and no further
+        products are read). If 'skip', a warning is logged and the product is skipped. If 'return', the
+        exception is returned in place of the product's structures. Defaults to 'raise'.
+    max_pending : int, optional
+        Maximum number of products being read, or read but not yet retrieved, at any one time. Defaults
+        to twice *max_workers*.
+
+    Yields
+    ------
+    tuple[str or unicode, list[tuple] or Exception]
+        For each product, in the order in which products finish being read, its path and a list
+        containing a tuple (ID, type, data, meta data) for each of its data structures. Data is as
+        given by the ``data`` attribute of each structure returned by `pds4_read`.
+
+    Examples
+    --------
+    >>> for path, structures in pds4_read_many(label_paths, max_workers=8, on_error='skip'):
+    >>>     for structure_id, structure_type, data, meta_data in structures:
+    >>>         ...
+    """
+
+    if on_error not in ('raise', 'skip', 'return'):
+        raise ValueError("Unknown on_error '{0}'; must be one of 'raise', 'skip' or 'return'.".format(on_error))
+
+    if max_workers is None:
+        max_workers = multiprocessing.cpu_count()
+
+    if max_pending is None:
+        max_pending = 2 * max_workers
+
+    read_kwargs = {'lazy_load': lazy_load, 'no_scale': no_scale, 'decode_strings': decode_strings,
+                   'fields': fields}
+
+    # Read products serially
+    if max_workers <= 1:
+        results = (_read_product(path, read_kwargs) for path in paths)
+
+        for result in _handle_product_results(results, on_error):
+            yield result
+
+        return
+
+    # Read products in parallel, submitting a new product whenever a result is retrieved. Each task is
+    # identified by its index, with workers reporting the index and their process ID when starting a task.
+    completed = six.moves.queue.Queue()
+    started = SimpleQueue()
+    pool = multiprocessing.Pool(processes=max_workers, initializer=_init_read_product_worker,
+                                initargs=(started, ))
+
+    try:
+
+        paths = iter(paths)
+        task_idxs = itertools.count()
+        pending = {}
+        worker_pids = {}
+
+        def submit_next():
+
+            for path in paths:
+                task_idx = next(task_idxs)
+
+                # The callback is not called for tasks that raise (e.g. if their result cannot be pickled).
+                # Such tasks are reported immediately where supported (Python 3), and otherwise are
+                # found by `find_failed`.
+                callbacks = {'callback': lambda result, task_idx=task_idx: completed.put((task_idx, result))}
+
+                if six.PY3:
+                    callbacks['error_callback'] = lambda error, task_idx=task_idx, path=path: \
+                        completed.put((task_idx, (path, None, error)))
+
+                pending[task_idx] = (path, pool.apply_async(_read_product_task, (task_idx, path, read_kwargs),
+                                                            **callbacks))
+                return
+
+        def record_started():
+
+            # Workers block when reporting started tasks if the queue is not emptied. Tasks that have
+            # already completed are not recorded.
+            while not started.empty():
+                task_idx, pid = started.get()
+
+                if task_idx in pending:
+                    worker_pids[task_idx] = pid
+
+        def find_failed():
+
+            record_started()
+            live_pids = _get_live_worker_pids(pool)
+
+            for task_idx, (path, async_result) in list(six.iteritems(pending)):
+
+                if async_result.ready() and (not async_result.successful()):
+
+                    try:
+                        async_result.get()
+                    except Exception as e:
+                        completed.put((task_idx, (path, None, e)))
+
+                elif (task_idx in worker_pids) and (worker_pids[task_idx] not in live_pids) and \
+                        (not async_result.ready()):
+                    error = RuntimeError("Worker process exited unexpectedly while reading '{0}'.".format(path))
+                    completed.put((task_idx, (path, None, error)))
+
+        for _ in range(0, max_pending):
+            submit_next()
+
+        def iter_completed():
+
+            while pending:
+
+                record_started()
+
+                # Check for failed tasks whenever no result has been retrieved for a while
+                try:
+                    task_idx, result = completed.get(timeout=1)
+                except six.moves.queue.Empty:
+                    find_failed()
+                    continue
+
+                worker_pids.pop(task_idx, None)
+
+                # Tasks may be reported as failed more than once
+                if pending.pop(task_idx, None) is None:
+                    continue
+
+                submit_next()
+
+                yield result
+
+        for result in _handle_product_results(iter_completed(), on_error):
+            yield result
+
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def _get_live_worker_pids(pool):
+    """ Obtain the process IDs of the live worker processes of a pool.
+
+    Notes
+    -----
+    ``multiprocessing.Pool`` has no public means of listing its worker processes, therefore this relies on
+    its private ``_pool`` attribute (a list of ``Process``), which is present in Python 2.7 and 3.
+
+    Parameters
+    ----------
+    pool : multiprocessing.Pool
+        The pool of worker processes.
+
+    Returns
+    -------
+    set[int]
+        The process ID of each worker process that has not exited.
+    """
+
+    return set(process.pid for process in pool._pool if process.exitcode is None)
+
+
+def _init_read_product_worker(started_products):
+    """ Initializes a worker process of `pds4_read_many`, quieting its logging.
+
+    Parameters
+    ----------
+    started_products : SimpleQueue
+        Queue on which to report each product the worker starts reading, see `_read_product_task`.
+    """
+
+    global _started_products
+    _started_products = started_products
+
+    logger.quiet()
+    logger.quiet('log_handler')
+
+
+def _read_product_task(task_idx, path, read_kwargs):
+    """ Reads a PDS4 product into a compact form, in a worker process of `pds4_read_many`.
+
+    Parameters
+    ----------
+    task_idx : int
+        Index of the task. Reported, along with the ID of this process, before the product is read, such
+        that the task can be found to have failed if this process exits while reading it.
+    path : str or unicode
+        The filename of the PDS4 label.
+    read_kwargs : dict
+        Keywords passed to `pds4_read`.
+
+    Returns
+    -------
+    tuple[str or unicode, list[tuple] or None, Exception or None]
+        See `_read_product`.
+    """
+
+    _started_products.put((task_idx, os.getpid()))
+
+    return _read_product(path, read_kwargs)
+
+
+def _read_product(path, read_kwargs):
+    """ Reads a PDS4 product into a compact form. Used by `pds4_read_many`.
+
+    Parameters
+    ----------
+    path : str or unicode
+        The filename of the PDS4 label.
+    read_kwargs : dict
+        Keywords passed to `pds4_read`.
+
+    Returns
+    -------
+    tuple[str or unicode, list[tuple] or None, Exception or None]
+        *path*, the structures of the product (see `pds4_read_many`) and None, or, if the product
+        could not be read, *path*, None and the exception raised.
+    """
+
+    try:
+
+        structure_list = pds4_read(path, quiet=True, **read_kwargs)
+
+        structures = [(structure.id, structure.type,
+                       None if read_kwargs['lazy_load'] else structure.data, structure.meta_data)
+                      for structure in structure_list]
+
+    except Exception as e:
+        return path, None, e
+
+    return path, structures, None
+
+
+def _handle_product_results(results, on_error):
+    """ Applies *on_error* to the results of `_read_product`. Used by `pds4_read_many`.
+
+    Parameters
+    ----------
+    results : iterable[tuple]
+        Results of `_read_product`.
+    on_error : str or unicode
+        See `pds4_read_many`.
+
+    Yields
+    ------
+    tuple
+        See `pds4_read_many`.
+    """
+
+    for path, structures, error in results:
+
+        if error is None:
+            yield path, structures
+
+        elif on_error == 'raise':
+            raise error
+
+        elif on_error == 'skip':
+            logger.warning("Skipping '{0}', which could not be read: {1}".format(path, error))
+
+        else:
+            yield path, error
+
+
+def read_structures(label, label_filename, lazy_load=False, no_scale=False, decode_strings=False,
+                    fields=None, max_workers=None, scale_mode='eager', native_byteorder=False):
     """ Reads PDS4 data structures described in label into a ``list`` of `Structure`'s.
 
     Parameters
@@ -220,6 +596,18 @@ def read_structures(label, label_filename, lazy_load=False, no_scale=False, deco
         If True, strings data types contained in the returned data will be decoded to
         the ``unicode`` type in Python 2, and to the ``str`` type in Python 3. If
         false, leaves string types as byte strings. Defaults to False.
+    fields : dict, optional
+        Keys are the IDs of tables, and values a list of the field names to read for that table.
+        Tables not specified are read in full. Defaults to None.
+    max_workers : int, optional
+        If larger than 1, and more than one structure is read-in, the data of structures is read-in
+        concurrently by up to this many threads, and errors reading any one structure are logged
+        rather than raised. Otherwise, large delimited tables are parsed in parallel by up to this many
+        processes. Defaults to None, reading serially.
+    scale_mode : str or unicode, optional
+        If 'lazy', arrays are scaled on access rather than on read-in. Defaults to 'eager'.
+    native_byteorder : bool, optional
+        If True, data is converted to native byte order when read. Defaults to False.
 
     Returns
     -------
@@ -228,6 +616,10 @@ def read_structures(label, label_filename, lazy_load=False, no_scale=False, deco
     """
     structures = []
 
+    # Structures whose data is read-in once all structures have been found (when reading concurrently)
+    pending_structures = []
+    concurrent = (not lazy_load) and (max_workers is not None) and (max_workers > 1)
+
     # Storage for number of structures types added
     num_structures = {'header': 0, 'array': 0, 'table': 0}
 
@@ -272,25 +664,58 @@ def read_structures(label, label_filename, lazy_load=False, no_scale=False, deco
                 structure = read_header(*args, lazy_load=True, decode_strings=decode_strings)
 
             if structure_type == 'array':
-                structure = read_array(*args, lazy_load=True, no_scale=no_scale)
+                structure = read_array(*args, lazy_load=True, no_scale=no_scale, scale_mode=scale_mode,
+                                       native_byteorder=native_byteorder)
 
             elif structure_type == 'table':
-                structure = read_table(*args, lazy_load=True, no_scale=no_scale, decode_strings=decode_strings)
+                structure = read_table(*args, lazy_load=True, no_scale=no_scale, decode_strings=decode_strings,
+                                       max_workers=max_workers, native_byteorder=native_byteorder)
 
             # Set an ID for the structure if it has neither a local identifier or name in the label
             if structure.id is None:
                 structure.id = '{0}_{1}'.format(structure_type.upper(), num_structures[structure_type] - 1)
 
+            # Restrict the fields to read for a table if requested
+            if (structure_type == 'table') and (fields is not None) and (structure.id in fields):
+                structure._fields = fields[structure.id]
+
             # Output that structure has been found
             if lazy_load:
                 logger.info('Found a {0} structure: {1}'.format(structure.type, structure.id))
 
-            # Attempt to access the data property such that the data gets read-in (if not on lazy-load)
+            # Read-in the data once all structures have been found (if not on lazy-load)
             else:
+                pending_structures.append(structure)
+
+            structures.append(structure)
+
+    # Attempt to access the data property such that the data gets read-in, concurrently if requested. The
+    # byte data of structures in the same data file is read-in together, rather than each separately.
+    concurrent = concurrent and (len(pending_structures) > 1)
+
+    if concurrent:
+
+        for structure in pending_structures:
+            logger.info('Now processing a {0} structure: {1}'.format(structure.type, structure.id))
+
+        _read_structures_data(pending_structures, max_workers)
+
+    else:
+
+        for block in _iter_coalesced_byte_data(pending_structures):
+
+            for structure in block:
                 logger.info('Now processing a {0} structure: {1}'.format(structure.type, structure.id))
                 structure.data
 
-            structures.append(structure)
+    # Warn if fields were requested for a table that was not found
+    if fields is not None:
+
+        structure_ids = [structure.id for structure in structures]
+
+        for structure_id in fields:
+            if structure_id not in structure_ids:
+                logger.warning("Fields requested for structure '{0}', which was not found.".format(structure_id))
 
     return structures
 
@@ -344,6 +769,266 @@ def read_byte_data(data_filename, start_byte, stop_byte):
                                      "' found in label - {0}".format(e)), None)
 
 
+def _get_structure_byte_range(structure):
+    """ Obtain the location of the byte data of a structure in its data file.
+
+    Parameters
+    ----------
+    structure : Structure
+        The PDS4 data structure, containing the required meta data.
+
+    Returns
+    -------
+    tuple[int, int] or None
+        The start and stop bytes of the structure's data in its data file. None if the data of the
+        structure is not read-in from a known byte range in full (e.g., it is memory mapped).
+    """
+
+    meta_data = structure.meta_data
+    start_byte = meta_data['offset']
+
+    if structure.is_header():
+        return start_byte, start_byte + meta_data['object_length']
+
+    elif structure.is_array():
+
+        # Arrays scaled on access are memory mapped
+        if structure._scale_mode == 'lazy':
+            return None
+
+        start_byte, num_bytes = _get_array_byte_range(structure)
+        return start_byte, start_byte + num_bytes
+
+    elif structure.is_table():
+
+        # Tables for which only some fields are read are memory mapped, and delimited tables parsed by
+        # multiple processes are read by each process
+        if structure._fields is not None:
+            return None
+
+        if meta_data.is_delimited() and (structure._max_workers is not None) and (structure._max_workers > 1):
+            return None
+
+        if meta_data.is_fixed_width():
+            return start_byte, start_byte + meta_data['records'] * meta_data.record['record_length']
+
+        elif meta_data.get('object_length') is not None:
+            return start_byte, start_byte + meta_data['object_length']
+
+    return None
+
+
+def _get_coalesced_blocks(structures, max_block_size=2**26, max_gap_size=2**16):
+    """ Groups structures whose byte data is near each other in the same data file into blocks.
+
+    The byte ranges of the structures in each data file are sorted, and adjacent, overlapping or nearby
+    ranges are merged into blocks, such that the byte data of each block can be read-in in a single
+    sequential pass over its data file (see `_read_block_byte_data`).
+
+    Notes
+    -----
+    Structures larger than *max_block_size* are already read with a single sequential read, and are
+    therefore each placed in a block of their own.
+
+    Parameters
+    ----------
+    structures : list[Structure]
+        The structures to group.
+    max_block_size : int, optional
+        Maximum size, in bytes, of each block. Defaults to 64 MB.
+    max_gap_size : int, optional
+        Byte ranges separated by at most this many bytes are merged. Defaults to 64 KB.
+
+    Returns
+    -------
+    list[list[Structure]]
+        The structures in each block. Blocks, and the structures in each, are ordered by their first
+        appearance in *structures*.
+    """
+
+    # Group byte ranges by data file. Structures whose byte range is unknown are in blocks of their own.
+    file_byte_ranges = {}
+    blocks = []
+
+    for idx, structure in enumerate(structures):
+
+        byte_range = _get_structure_byte_range(structure)
+
+        if (byte_range is not None) and (byte_range[1] - byte_range[0] <= max_block_size):
+            file_byte_ranges.setdefault(structure.parent_filename, []).append(byte_range + (idx, ))
+        else:
+            blocks.append([idx])
+
+    for data_filename, byte_ranges in six.iteritems(file_byte_ranges):
+
+        # Merge adjacent, overlapping and nearby byte ranges into blocks
+        byte_ranges.sort()
+        file_blocks = []
+
+        for start_byte, stop_byte, idx in byte_ranges:
+
+            if (file_blocks and (start_byte <= file_blocks[-1][1] + max_gap_size) and
+                    (stop_byte - file_blocks[-1][0] <= max_block_size)):
+                file_blocks[-1][1] = max(file_blocks[-1][1], stop_byte)
+                file_blocks[-1][2].append(idx)
+            else:
+                file_blocks.append([start_byte, stop_byte, [idx]])
+
+        blocks.extend(sorted(block[2]) for block in file_blocks)
+
+    return [[structures[idx] for idx in block] for block in sorted(blocks)]
+
+
+def _read_block_byte_data(structures):
+    """ Reads-in the byte data of a block of structures with a single read of their data file.
+
+    The byte range spanned by the block is read into a single buffer. Each structure is given a view of
+    the portion of this buffer containing its byte data, in its ``_byte_data`` attribute. This is used in
+    place of reading from the data file when its data is read-in, without copying it where possible (such
+    that the data of the structure may be a view of the buffer).
+
+    Notes
+    -----
+    Blocks of a single structure are left to be read-in as usual. An error while reading the data file is
+    ignored, such that it is raised by each structure as usual.
+
+    The data of a structure may be modified in-place when it is read-in (e.g. converted to native byte
+    order). Therefore structures whose byte ranges overlap are each given a copy of their byte data.
+
+    Parameters
+    ----------
+    structures : list[Structure]
+        A block of structures, see `_get_coalesced_blocks`.
+
+    Returns
+    -------
+    None
+    """
+
+    if len(structures) < 2:
+        return
+
+    data_filename = structures[0].parent_filename
+    byte_ranges = [_get_structure_byte_range(structure) for structure in structures]
+
+    block_start = min(start_byte for start_byte, stop_byte in byte_ranges)
+    block_stop = max(stop_byte for start_byte, stop_byte in byte_ranges)
+    buffer = np.empty(block_stop - block_start, dtype='uint8')
+
+    try:
+
+        with io.open(data_filename, 'rb') as file_handler:
+            file_handler.seek(block_start)
+            num_bytes_read = file_handler.readinto(memoryview(buffer))
+
+    except IOError:
+        return
+
+    for i, structure in enumerate(structures):
+
+        start_byte, stop_byte = byte_ranges[i]
+        is_overlapping = any((start_byte < other_stop) and (other_start < stop_byte)
+                             for j, (other_start, other_stop) in enumerate(byte_ranges) if i != j)
+
+        # Data past the end-of-file is left out, such that each structure handles it as usual
+        byte_data = buffer[start_byte - block_start:min(stop_byte - block_start, num_bytes_read)]
+        structure._byte_data = byte_data.copy() if is_overlapping else byte_data
+
+
+def _iter_coalesced_byte_data(structures, max_block_size=2**26, max_gap_size=2**16):
+    """ Reads-in the byte data of structures sharing a data file together, one block at a time.
+
+    The byte data of each block of structures (see `_get_coalesced_blocks`) is read-in just before the block
+    is yielded, and is released once the next block is requested, such that the byte data of at most one
+    block is held in memory (aside from any retained by the data of its structures).
+
+    Parameters
+    ----------
+    structures : list[Structure]
+        The structures whose byte data should be read-in.
+    max_block_size : int, optional
+        Maximum size, in bytes, of each block. Defaults to 64 MB.
+    max_gap_size : int, optional
+        Byte ranges separated by at most this many bytes are read-in together. Defaults to 64 KB.
+
+    Yields
+    ------
+    list[Structure]
+        The structures in a block, whose byte data (if read-in together) is in their ``_byte_data``
+        attribute, see `_read_block_byte_data`.
+    """
+
+    for block in _get_coalesced_blocks(structures, max_block_size=max_block_size, max_gap_size=max_gap_size):
+
+        _read_block_byte_data(block)
+
+        try:
+            yield block
+
+        finally:
+            for structure in block:
+                structure._byte_data = None
+
+
+def _read_structures_data(structures, max_workers):
+    """ Reads-in the data of structures concurrently, using a pool of threads.
+
+    Notes
+    -----
+    The byte data of each block of structures (see `_get_coalesced_blocks`) is read-in once, after which
+    the structures in the block are read-in concurrently from it, and the byte data is released. Delimited
+    tables are parsed by a single thread each (see *max_workers* of `read_table`), rather than by
+    additional processes. An error while reading-in a structure is logged, and does not prevent other
+    structures from being read-in. The data of such a structure is left unread, such that the error is
+    raised again on access of its data.
+
+    Parameters
+    ----------
+    structures : list[Structure]
+        The structures whose data should be read-in.
+    max_workers : int
+        Maximum number of threads used to read-in the structures.
+
+    Returns
+    -------
+    None
+    """
+
+    def read_data(structure):
+
+        try:
+            structure.data
+
+        except Exception as e:
+            return e
+
+        finally:
+            structure._byte_data = None
+
+        return None
+
+    for structure in structures:
+        if structure.is_table():
+            structure._max_workers = None
+
+    pool = ThreadPool(processes=max(1, min(max_workers, len(structures))))
+
+    try:
+
+        for block in _iter_coalesced_byte_data(structures):
+
+            errors = pool.map(read_data, block)
+
+            for structure, error in zip(block, errors):
+                if error is not None:
+                    logger.error("Unable to read-in the data of {0} structure '{1}': {2}"
+                                 .format(structure.type, structure.id, error))
+
+    finally:
+        pool.terminate()
+        pool.join()
+
+
 def _handle_exception(exc_type, exc_value, exc_traceback):
     """
     Passed to sys.excepthook. This function logs all uncaught exceptions while reading the data
@@ -407,15 +407,26 @@ def data_type_convert_table_ascii(data_type, data, mask_numeric_nulls=False, dec
             # Fill any empty values with a 0, if requested
             if mask_numeric_nulls:
 
-                mask_array = np.zeros(len(data), dtype='bool')
-                data = np.array(data, dtype='object', copy=True)
+                data = np.array(data, copy=True)
 
                 # Assign mask to True where necessary (so that we remember which values need to be masked),
-                # then set value in data array to 0 (this value will be masked). The syntax here is used
-                # to speed up operations.
-                for i, datum in enumerate(data):
-                    if datum.strip() == b'':
-                        mask_array[i] = True
+                # then set value in data array to 0 (this value will be masked). For byte strings, a value
+                # is empty if every byte is whitespace (or NULL padding).
+                if data.dtype.char == 'S':
+
+                    matrix = data.view('uint8').reshape(len(data), data.dtype.itemsize)
+                    is_blank = (matrix == ord(' ')) | ((matrix >= ord('\t')) & (matrix <= ord('\r'))) | \
+                               (matrix == 0)
+                    mask_array = is_blank.all(axis=1)
+
+                else:
+
+                    data = np.array(data, dtype='object')
+                    mask_array = np.zeros(len(data), dtype='bool')
+
+                    for i, datum in enumerate(data):
+                        if datum.strip() == b'':
+                            mask_array[i] = True
 
                 data[mask_array] = b'0'
 
@@ -430,8 +441,8 @@ def data_type_convert_table_ascii(data_type, data, mask_numeric_nulls=False, dec
             # We can use NumPy to convert floats to a numeric type, but not integers. The latter is because
             # in case an integer does not fit into a NumPy C-type (since all ascii integer types are unbounded
             # in PDS4), there appears to be no method to tell NumPy to convert each string to be a numeric
-            # Python object. Therefore we use pure Python to convert to numeric Python objects (i.e, int),
-            # and then later convert the list into a NumPy array of numeric Python objects.
+            # Python object. Therefore integers are parsed digit-by-digit (see `_parse_ascii_integers`),
+            # and only those that do not fit into 64-bits are converted to numeric Python objects (i.e, int).
             if np.issubdtype(dtype, np.float):
 
                 # Convert ASCII_Reals to numeric type
@@ -439,17 +450,8 @@ def data_type_convert_table_ascii(data_type, data, mask_numeric_nulls=False, dec
 
             else:
 
-                # Make a copy such that original data is unmodified (if we did not already make a copy above)
-                if not mask_numeric_nulls:
-                    data = np.array(data, dtype='object', copy=True)
-
-                # Convert ASCII_Integers to numeric type. The syntax here is used to speed up operations,
-                # especially for delimited tables with many empty values, by explicitly looping over and
-                # casting only non-zero values.
-                for i in np.nditer(np.where(data != '0'), flags=['zerosize_ok']):
-                    data[i] = int(data[i], numeric_base)
-
-                data[data == '0'] = 0
+                # Convert ASCII_Integers to numeric type
+                data = _parse_ascii_integers(data, numeric_base, dtype)
 
                 # Cast down numeric base integers if possible
                 if numeric_base != 10:
@@ -474,6 +476,146 @@ def data_type_convert_table_ascii(data_type, data, mask_numeric_nulls=False, dec
     return data
 
 
+def _parse_ascii_integers(data, numeric_base, dtype):
+    """ Convert byte strings containing ASCII integers into an integer array.
+
+    The digits of each integer are parsed, and its value accumulated, via vectorized NumPy operations
+    on the byte matrix of *data*. Only values that cannot be parsed this way (e.g. because they overflow
+    64-bit integers, or because they are invalid) are parsed by Python's ``int``, such that the result
+    (and any exception raised) is identical to converting each value via ``int(value, numeric_base)``.
+
+    Parameters
+    ----------
+    data : array_like[str or bytes]
+        Flat array of byte strings, each containing an integer. Leading and trailing whitespace is ignored.
+    numeric_base : int
+        The base of the integers in *data*. One of 2, 8, 10 or 16.
+    dtype : np.dtype
+        The dtype that the integers will be cast to. If the parsed values cannot be represented by
+        this dtype without overflow, an object array of Python integers is returned instead, such that
+        the cast fails as it would for any integer too large for *dtype*.
+
+    Returns
+    -------
+    np.ndarray
+        An int64 or uint64 array, if every value fits into the respective type, or otherwise an
+        object array of Python integers.
+
+    Raises
+    ------
+    ValueError
+        Raised if any value in *data* is not an integer in *numeric_base*.
+    """
+
+    data = np.asarray(data)
+
+    # Obtain the byte matrix, with first dimension being the value and second dimension the byte within
+    # the value. Non-byte-string data (e.g. an object array) is converted if possible.
+    if data.dtype.char != 'S':
+
+        try:
+            data = data.astype('S')
+        except (UnicodeError, ValueError, TypeError):
+            return np.array([int(datum, numeric_base) for datum in data.tolist()], dtype='object')
+
+    num_values = len(data)
+    value_length = data.dtype.itemsize
+
+    matrix = np.ascontiguousarray(data).view('uint8').reshape(num_values, value_length)
+
+    # Value of each byte as a digit, and whether it is a valid digit in *numeric_base*
+    if numeric_base <= 10:
+        digits = matrix - np.uint8(ord('0'))
+
+    else:
+        digit_values = np.full(256, 255, dtype='uint8')
+        digit_values[ord('0'):ord('9') + 1] = np.arange(0, 10)
+        digit_values[ord('A'):ord('F') + 1] = np.arange(10, 16)
+        digit_values[ord('a'):ord('f') + 1] = np.arange(10, 16)
+        digits = digit_values[matrix]
+
+    is_digit = digits < numeric_base
+    digits *= is_digit
+
+    # Locate the start and end of each value (excluding whitespace, and any trailing NULL padding)
+    is_blank = (matrix == ord(' ')) | ((matrix >= ord('\t')) & (matrix <= ord('\r')))
+    is_content = ~is_blank
+    start = np.argmax(is_content, axis=1)
+
+    is_content &= (matrix != 0)
+    has_content = is_content.any(axis=1)
+    end = value_length - np.argmax(is_content[:, ::-1], axis=1)
+
+    # Extract the sign of each value
+    first_char = matrix[np.arange(num_values), start]
+    is_negative = has_content & (first_char == ord('-'))
+    start = start + (has_content & ((first_char == ord('-')) | (first_char == ord('+'))))
+
+    # Values that cannot be parsed here (e.g. empty, containing non-digits inside the value, or overflowing)
+    # are afterward parsed by Python. Outside of each value there are only whitespace and sign characters,
+    # therefore a value is valid only if all its characters are digits.
+    unparsed = ~has_content | (start >= end) | (is_digit.sum(axis=1) != (end - start))
+
+    # Accumulate the value of each integer, one digit position at a time. Values having more digits
+    # than is guaranteed to fit into 64-bits are checked for overflow.
+    magnitude = np.zeros(num_values, dtype='uint64')
+    base = np.uint64(numeric_base)
+    max_magnitude = np.uint64(2**64 - 1)
+
+    check_overflow = (num_values > 0) and ((end - start).max() > int(64 / np.log2(numeric_base)))
+    min_end = end.min() if num_values > 0 else 0
+
+    for i in range(value_length):
+
+        digit = digits[:, i]
+
+        if check_overflow:
+            unparsed |= (i < end) & (magnitude > (max_magnitude - digit) // base)
+
+        # Values that have ended (only those followed by trailing whitespace) must not be accumulated
+        if i < min_end:
+            magnitude *= base
+            magnitude += digit
+
+        else:
+            active = i < end
+            magnitude[active] = magnitude[active] * base + digit[active]
+
+    is_negative &= (magnitude != 0)
+
+    # Determine whether the values fit into a 64-bit integer dtype
+    max_signed = np.uint64(2**63 - 1)
+    fits_signed = (magnitude[~is_negative] <= max_signed).all() and \
+                  (magnitude[is_negative] <= max_signed + np.uint64(1)).all()
+
+    if unparsed.any():
+        fits = False
+
+    elif not is_negative.any():
+        fits = (np.dtype(dtype) != np.dtype('int64')) or fits_signed
+
+    else:
+        fits = (np.dtype(dtype) != np.dtype('uint64')) and fits_signed
+
+    if fits:
+
+        if not is_negative.any():
+            return magnitude
+
+        # Negate values via two's complement (which is also correct for -2**63)
+        magnitude[is_negative] = ~magnitude[is_negative] + np.uint64(1)
+        return magnitude.view('int64')
+
+    # Otherwise create Python integers, parsing via Python only those values that were not parsed above
+    values = magnitude.astype('object')
+    values[is_negative] = -values[is_negative]
+
+    for i in np.flatnonzero(unparsed):
+        values[i] = int(data[i], numeric_base)
+
+    return values
+
+
 def data_type_convert_table_binary(data_type, data, decode_strings=False):
     """
     Cast data originating from a PDS4 Table_Binary data structure in the form of an
@@ -485,8 +627,9 @@ def data_type_convert_table_binary(data_type, data, decode_strings=False):
     ----------
     data_type : str or unicode
         The PDS4 data type that the data should be cast to.
-    data : array_like[str or bytes]
-        Flat array of PDS4 byte strings from a Table_Binary data structure.
+    data : array_like[str or bytes] or np.ndarray
+        Flat array of PDS4 byte strings from a Table_Binary data structure. May be a ``bytes`` dtype
+        NumPy array, in which case its itemsize must match the size of *data_type*.
     decode_strings : bool, optional
         If True, and the returned dtype is a form of character, then the obtained dtype will be a form of
         unicode. If False, then for character data the obtained dtype will remain byte strings. Defaults to
@@ -501,8 +644,14 @@ def data_type_convert_table_binary(data_type, data, decode_strings=False):
     # Convert binary data types
     if (data_type in PDS_NUMERIC_TYPES) and ('ASCII' not in data_type):
 
+        # Byte string arrays (e.g. as extracted from a table's record matrix) already contain contiguous
+        # data, which we can cast directly (a copy is made if necessary to ensure mutability)
+        if isinstance(data, np.ndarray):
+            byte_string = np.require(data, requirements=['C', 'W'])
+
         # Join data array-like back into a byte_string, then cast to bytearray to ensure mutability
-        byte_string = bytearray(b''.join(data))
+        else:
+            byte_string = bytearray(b''.join(data))
 
         data = data_type_convert_array(data_type, byte_string)
 
@@ -680,8 +829,13 @@ def get_scaled_numpy_type(data_type=None, data=None, scaling_factor=None, value_
 
             # Find min and max data (so we do not have to multiply all data, which is slower)
             # Note: cast to int must stay, otherwise NumPy integers may overflow
-            min_data = int(data.view(np.ndarray).min()) * scaling_factor + value_offset
-            max_data = int(data.view(np.ndarray).max()) * scaling_factor + value_offset
+            if data.size > 0:
+                min_data = int(data.view(np.ndarray).min()) * scaling_factor + value_offset
+                max_data = int(data.view(np.ndarray).max()) * scaling_factor + value_offset
+
+            # Empty data (e.g. an empty section of a table) has no min or max
+            else:
+                min_data = max_data = value_offset
 
             # Obtain type necessary to store all integers
             new_dtype = get_min_integer_numpy_type([min_data, max_data])
@@ -709,6 +863,81 @@ def decode_bytes_to_unicode(array):
     return np.char.decode(array, 'utf-8')
 
 
+def convert_to_native_byteorder(data):
+    """ Converts data to native byte order, byteswapping it in-place.
+
+    Parameters
+    ----------
+    data : np.ndarray or subclass
+        Numeric or structured data. Must be writeable if any of it is not in native byte order.
+
+    Returns
+    -------
+    np.ndarray or subclass
+        A view of *data* having a dtype in native byte order. The values are unchanged, however the
+        underlying bytes of *data* will have been swapped for any data not in native byte order.
+        Structured data containing objects is instead copied.
+    """
+
+    dtype = data.dtype
+    native_dtype = _get_native_dtype(dtype)
+
+    # Structured dtypes report being native even when the base dtype of a subarray field is not, therefore
+    # the byte order of each field is checked via the dtype it will be converted to
+    if dtype == native_dtype:
+        return data
+
+    # NumPy does not allow views of data containing objects, therefore it must be copied
+    if dtype.hasobject:
+        return data.astype(native_dtype)
+
+    values = np.ma.getdata(data)
+
+    # Swap each field of structured data separately, since fields may differ in byte order
+    if dtype.names is None:
+        values.byteswap(True)
+
+    else:
+        for name in dtype.names:
+            convert_to_native_byteorder(values[name])
+
+    return data.view(native_dtype)
+
+
+def _get_native_dtype(dtype):
+    """ Obtain the native byte order equivalent of a dtype.
+
+    ``np.dtype.newbyteorder`` does not change the byte order of the base dtype of subarray fields in
+    structured dtypes, therefore the dtype of each field is converted separately.
+
+    Parameters
+    ----------
+    dtype : np.dtype
+        A dtype, which may be structured or a subarray dtype.
+
+    Returns
+    -------
+    np.dtype
+        A dtype equal to *dtype*, except that it (and any of its fields) is in native byte order.
+    """
+
+    base = dtype.base
+
+    if base.names is None:
+        native_dtype = base.newbyteorder('=')
+
+    else:
+        native_dtype = np.dtype({'names': base.names,
+                                 'formats': [_get_native_dtype(base.fields[name][0]) for name in base.names],
+                                 'offsets': [base.fields[name][1] for name in base.names],
+                                 'itemsize': base.itemsize})
+
+    if dtype.shape:
+        native_dtype = np.dtype((native_dtype, dtype.shape))
+
+    return native_dtype
+
+
 def mask_special_constants(data, special_constants, mask_strings=False, copy=False):
     """ Mask out special constants in an array.
 
@@ -324,6 +324,10 @@ class Structure(object):
         self._no_scale = None
         self._decode_strings = None
 
+        # Byte data of this structure, if it was read-in ahead of its data together with that of other
+        # structures in the same data file (see `read_structures`)
+        self._byte_data = None
+
     def __repr__(self):
         """
         Returns
@@ -4,10 +4,11 @@ from __future__ import print_function
 from __future__ import unicode_literals
 
 import re
+import sys
 from itertools import chain
 from xml.etree import ElementTree as ET
 
-from .read_label import read_label
+from .read_label import read_label, make_convenient_label
 
 from ..utils.constants import PDS4_NAMESPACES
 from ..utils.helpers import xml_to_dict
@@ -46,6 +47,11 @@ class Label(object):
             Specifies whether the root element used by default when calling methods and attributes
             in this object will be the convenient_root or unmodified_root. Must be one of
             'convenient' or 'unmodified'. Defaults to convenient.
+        element_map : dict, optional
+            Keys are the elements of either root (and their subelements), and values the corresponding
+            elements of the other root. Built on first use if not given.
+        match_cache : dict, optional
+            Cache of search strings with resolved namespace prefixes, see `_resolve_match`.
 
         Examples
         --------
@@ -71,7 +77,8 @@ class Label(object):
     """
 
     def __init__(self, convenient_root=None, unmodified_root=None,
-                 convenient_namespace_map=None, unmodified_namespace_map=None, default_root='convenient'):
+                 convenient_namespace_map=None, unmodified_namespace_map=None, default_root='convenient',
+                 element_map=None, match_cache=None):
 
         # ElementTree root containing read-in XML which was modified before storage
         # (see options set in from_file() below)
@@ -85,6 +92,14 @@ class Label(object):
         self._convenient_namespace_map = convenient_namespace_map if convenient_namespace_map else {}
         self._unmodified_namespace_map = unmodified_namespace_map if unmodified_namespace_map else {}
 
+        # Dictionary with keys being the elements of either root and values being the corresponding
+        # elements of the other root (shared by all Labels that are portions of the same label)
+        self._element_map = element_map
+
+        # Dictionary with keys being searches, and values being the search string with namespace prefixes
+        # resolved (shared by all Labels that are portions of the same label)
+        self._match_cache = match_cache if (match_cache is not None) else {}
+
         # Set default root (running it through setter)
         self._default_root = None
         self.default_root = default_root
@@ -105,7 +120,8 @@ class Label(object):
 
         return Label(self._convenient_root[key], self._unmodified_root[key],
                      self._convenient_namespace_map, self._unmodified_namespace_map,
-                     default_root=self.default_root)
+                     default_root=self.default_root, element_map=self._element_map,
+                     match_cache=self._match_cache)
 
     def __repr__(self):
         """
@@ -131,7 +147,7 @@ class Label(object):
         return len(self.getroot())
 
     @classmethod
-    def from_file(cls, filename, default_root='convenient'):
+    def from_file(cls, filename, default_root='convenient', parser_backend='auto'):
         """ Create Label from a PDS4 XML label file.
 
         Parameters
@@ -142,6 +158,9 @@ class Label(object):
             Specifies whether the root element used by default when calling methods and attributes in
             this object will be the convenient_root or unmodified_root. Must be one of convenient|unmodified.
             Defaults to convenient.
+        parser_backend : str or unicode, optional
+            The XML parser used to parse the label. Must be one of etree|lxml|auto. The resulting Label
+            is identical for either parser. Defaults to auto, see ``read_label.get_parser_backend``.
 
         Returns
         -------
@@ -149,19 +168,21 @@ class Label(object):
             Instance, with the contents being taken from *filename*.
         """
 
-        convenient_root, convenient_namespace_map = read_label(filename,
-                                            strip_extra_whitespace=True, enforce_default_prefixes=True,
-                                            include_namespace_map=True, decode_py2=True)
-
+        # The label is parsed once, and the convenient root is derived from the unmodified root
         unmodified_root, unmodified_namespace_map = read_label(filename,
                                             strip_extra_whitespace=False, enforce_default_prefixes=False,
-                                            include_namespace_map=True, decode_py2=True)
+                                            include_namespace_map=True, decode_py2=True,
+                                            parser_backend=parser_backend)
+
+        convenient_root, convenient_namespace_map, element_map = make_convenient_label(
+            unmodified_root, unmodified_namespace_map, include_element_map=True)
 
         obj = cls(convenient_root=convenient_root,
                   unmodified_root=unmodified_root,
                   convenient_namespace_map=convenient_namespace_map,
                   unmodified_namespace_map=unmodified_namespace_map,
-                  default_root=default_root)
+                  default_root=default_root,
+                  element_map=element_map)
 
         return obj
 
@@ -320,22 +341,11 @@ class Label(object):
         # Select the proper XML root to look in
         root = self.getroot(unmodified)
 
-        # Append known namespaces if search contains them
-        namespaces = self._append_known_namespaces(match, namespaces,  unmodified)
+        # Resolve namespace prefixes in the search to their URIs
+        match = self._resolve_match(match, namespaces, unmodified)
 
         # Find the matching element
-        try:
-            found_element = root.find(match, namespaces=namespaces)
-
-        # Implement namespaces support and unicode searching for Python 2.6
-        except TypeError:
-
-            if namespaces is not None:
-                match = self._add_namespaces_to_match(match, namespaces)
-
-            match = self._unicode_match_to_str(match)
-
-            found_element = root.find(match)
+        found_element = root.find(match)
 
         # If return_ET is not used, find the other matching element
         if not return_ET and found_element is not None:
@@ -343,7 +353,8 @@ class Label(object):
             unmodified = self._resolve_unmodified(unmodified)
 
             other_element = self._find_other_element(found_element, unmodified)
-            args = [self._convenient_namespace_map, self._unmodified_namespace_map, self._default_root]
+            args = [self._convenient_namespace_map, self._unmodified_namespace_map, self._default_root,
+                    self._element_map, self._match_cache]
 
             if unmodified:
                 label = Label(other_element, found_element, *args)
@@ -386,22 +397,11 @@ class Label(object):
         # Select the proper XML root to look in
         root = self.getroot(unmodified)
 
-        # Append known namespaces if search contains them
-        namespaces = self._append_known_namespaces(match, namespaces, unmodified)
+        # Resolve namespace prefixes in the search to their URIs
+        match = self._resolve_match(match, namespaces, unmodified)
 
         # Find the matching elements
-        try:
-            found_elements = root.findall(match, namespaces=namespaces)
-
-        # Implement namespaces support and unicode searching for Python 2.6
-        except TypeError:
-
-            if namespaces is not None:
-                match = self._add_namespaces_to_match(match, namespaces)
-
-            match = self._unicode_match_to_str(match)
-
-            found_elements = root.findall(match)
+        found_elements = root.findall(match)
 
         # If return_ET is not used, find the other matching elements
         if not return_ET and found_elements is not None:
@@ -412,7 +412,8 @@ class Label(object):
             for element in found_elements:
 
                 other_element = self._find_other_element(element, unmodified)
-                args = [self._convenient_namespace_map, self._unmodified_namespace_map, self._default_root]
+                args = [self._convenient_namespace_map, self._unmodified_namespace_map, self._default_root,
+                        self._element_map, self._match_cache]
 
                 if unmodified:
                     label = Label(other_element, element, *args)
@@ -717,14 +718,24 @@ class Label(object):
             Matched element.
         """
 
-        other_element = None
+        # Build the element map on first use, by matching elements in the order they appear in each root
+        if self._element_map is None:
 
-        if was_unmodified:
-            root = self.getroot(unmodified=True)
-            other_root = self.getroot(unmodified=None)
-        else:
-            root = self.getroot(unmodified=None)
-            other_root = self.getroot(unmodified=True)
+            self._element_map = {}
+
+            for element1, element2 in zip(self._convenient_root.getiterator(),
+                                          self._unmodified_root.getiterator()):
+                self._element_map[element1] = element2
+                self._element_map[element2] = element1
+
+        other_element = self._element_map.get(element)
+
+        if other_element is not None:
+            return other_element
+
+        # Search for elements not in the map (e.g. added to the label after the map was built)
+        root = self.getroot(unmodified=was_unmodified)
+        other_root = self.getroot(unmodified=not was_unmodified)
 
         # Loop over all elements in root of element to find its number
         node_number = -1
@@ -828,6 +839,56 @@ class Label(object):
 
         return namespaces
 
+    def _resolve_match(self, match, namespaces, unmodified):
+        """
+        Resolves namespace prefixes in *match*, by replacing each prefix with the URI for that prefix
+        contained in brackets, using the known namespaces (see `_append_known_namespaces`). Resolved search
+        strings are cached, such that repeated searches do not need to merge namespaces and rewrite the
+        search string again, and ``ElementTree`` does not need to do so either.
+
+        Parameters
+        ----------
+        match : str or unicode
+            XPATH search string.
+        namespaces : dict or None
+            Dictionary with keys corresponding to prefix and values corresponding to URI for namespaces.
+        unmodified : bool or None
+            If True, uses namespace map created from the unmodified root, instead of the convenient root,
+            as part of the known namespaces. If None, uses `Label.default_root` to decide.
+
+        Returns
+        -------
+        str or unicode
+            A new XPATH search string, with prefixes replaced by {URI}.
+        """
+
+        unmodified = self._resolve_unmodified(unmodified)
+        namespaces_key = None if (namespaces is None) else tuple(sorted(six.iteritems(namespaces)))
+        cache_key = (match, namespaces_key, unmodified)
+
+        resolved_match = self._match_cache.get(cache_key)
+
+        if resolved_match is not None:
+            return resolved_match
+
+        resolved_match = match
+
+        if ':' in match:
+            namespaces = self._append_known_namespaces(match, namespaces, unmodified)
+            resolved_match = self._add_namespaces_to_match(match, namespaces)
+
+        # Implement unicode searching for Python 2.6
+        if sys.version_info[0:2] == (2, 6):
+            resolved_match = self._unicode_match_to_str(resolved_match)
+
+        # Limit the size of the cache (e.g. for labels searched with many generated search strings)
+        if len(self._match_cache) >= 1000:
+            self._match_cache.clear()
+
+        self._match_cache[cache_key] = resolved_match
+
+        return resolved_match
+
     @classmethod
     def _add_namespaces_to_match(cls, match, namespaces):
         """
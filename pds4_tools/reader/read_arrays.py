@@ -3,12 +3,14 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import io
+
 import numpy as np
 
-from .array_objects import ArrayStructure, Meta_ArrayStructure
+from .array_objects import ArrayStructure, Meta_ArrayStructure, LazyScaledArray
 from .data import PDS_array
 from .data_types import (data_type_convert_array, pds_to_numpy_type, apply_scaling_and_value_offset,
-                         mask_special_constants)
+                         mask_special_constants, get_scaled_numpy_type, convert_to_native_byteorder)
 
 from ..utils.logging import logger_init
 from ..extern import six
@@ -44,16 +46,7 @@ def _read_array_byte_data(array_structure, as_string=True, memmap=False):
     """
 
     data_filename = array_structure.parent_filename
-    meta_data = array_structure.meta_data
-
-    num_elements = np.prod([axis_array['elements'] for axis_array in meta_data.get_axis_arrays()])
-    data_type = meta_data['Element_Array']['data_type']
-    element_size = pds_to_numpy_type(data_type).itemsize
-
-    start_byte = meta_data['offset']
-    stop_byte = start_byte + num_elements * element_size
-
-    num_int8_elements = stop_byte - start_byte
+    start_byte, num_int8_elements = _get_array_byte_range(array_structure)
 
     # Read byte data from file
     try:
@@ -81,7 +74,151 @@ def _read_array_byte_data(array_structure, as_string=True, memmap=False):
     return data
 
 
-def _apply_bitmask(data, bit_mask_string, special_constants=None):
+def _get_array_byte_range(array_structure):
+    """ Obtain the location of the data for a PDS4 Array in its data file.
+
+    Parameters
+    ----------
+    array_structure : ArrayStructure
+        The PDS4 Array data structure, containing the required meta data.
+
+    Returns
+    -------
+    tuple[int, int]
+        The start byte of the data in the data file, and the number of bytes of data.
+    """
+
+    meta_data = array_structure.meta_data
+
+    num_elements = int(np.prod([axis_array['elements'] for axis_array in meta_data.get_axis_arrays()]))
+    data_type = meta_data['Element_Array']['data_type']
+    element_size = pds_to_numpy_type(data_type).itemsize
+
+    return meta_data['offset'], num_elements * element_size
+
+
+def _read_array_data_into(array_structure, no_scale, native_byteorder=False, chunk_size=2**20):
+    """ Reads the data for a PDS4 Array directly into an array having its final data type.
+
+    A single buffer is allocated for the data, which the data file is read into. The bit mask is then
+    applied and, if necessary, the data is scaled in-place, with the buffer reallocated to the size of the
+    scaled data type (which usually does not involve a copy for large buffers). Peak memory usage is
+    therefore about the size of the larger of the unscaled and scaled data, rather than several copies
+    of it.
+
+    Parameters
+    ----------
+    array_structure : ArrayStructure
+        The PDS4 Array data structure for which the data needs to be read.
+    no_scale : bool
+        Returned data will not be adjusted according to the offset and scaling factor.
+    native_byteorder : bool, optional
+        If True, the data is byteswapped in-place to native byte order (prior to any scaling).
+        Defaults to False.
+    chunk_size : int, optional
+        Number of elements to scale at a time. Defaults to 2**20.
+
+    Returns
+    -------
+    np.ndarray
+        The data of the array, bit masked and scaled, having the array's shape.
+    """
+
+    data_filename = array_structure.parent_filename
+    meta_data = array_structure.meta_data
+    element_array = meta_data['Element_Array']
+    special_constants = meta_data.get('Special_Constants')
+
+    start_byte, num_bytes = _get_array_byte_range(array_structure)
+    dtype = pds_to_numpy_type(element_array['data_type'])
+    num_elements = num_bytes // dtype.itemsize
+
+    # Use byte data read-in together with that of other structures, if available, as the buffer. The buffer
+    # is modified and may be reallocated below, therefore it is taken from the structure (and copied out of
+    # the block it was read-in with).
+    if array_structure._byte_data is not None:
+        buffer = np.require(array_structure._byte_data, requirements=['O', 'W'])
+        num_bytes_read = buffer.size
+        array_structure._byte_data = None
+
+    # Read byte data from file directly into the buffer
+    else:
+
+        buffer = np.empty(num_bytes, dtype='uint8')
+
+        try:
+
+            with io.open(data_filename, 'rb') as file_handler:
+                file_handler.seek(start_byte)
+                num_bytes_read = file_handler.readinto(memoryview(buffer))
+
+        except IOError as e:
+            raise six.raise_from(IOError("Unable to read data from file '" + data_filename +
+                                         "' found in label - {0}".format(e)), None)
+
+    if num_bytes_read != num_bytes:
+        raise IOError("Unable to read data from file '{0}' found in label - expected {1} bytes, "
+                      "but only {2} are present.".format(data_filename, num_bytes, num_bytes_read))
+
+    data = buffer.view(dtype)
+
+    # Convert to native byte order if requested
+    if native_byteorder:
+        data = convert_to_native_byteorder(data)
+        dtype = data.dtype
+
+    # Apply the bit mask if necessary
+    bit_mask = meta_data.get('Object_Statistics', {}).get('bit_mask')
+    if bit_mask is not None:
+        bit_mask_string = six.text_type(bit_mask).zfill(dtype.itemsize * 8)
+        _apply_bitmask(data, bit_mask_string, special_constants=special_constants)
+
+    # Obtain data type needed to store the scaled data
+    scaling_factor = None if no_scale else element_array.get('scaling_factor')
+    value_offset = None if no_scale else element_array.get('value_offset')
+    scaled_dtype = get_scaled_numpy_type(data=data, scaling_factor=scaling_factor, value_offset=value_offset)
+
+    # Scale data (in-place, if possible)
+    if scaled_dtype != dtype:
+
+        # Object data cannot be stored in the buffer
+        if scaled_dtype.hasobject:
+            data = apply_scaling_and_value_offset(data, scaling_factor, value_offset,
+                                                  special_constants=special_constants)
+            return np.ma.getdata(data).reshape(meta_data.dimensions())
+
+        del data
+
+        # Grow the buffer to fit the scaled data. When it grows, data is scaled starting from the end, and
+        # otherwise from the start, such that each chunk of data is read before it is overwritten.
+        itemsize, scaled_itemsize = dtype.itemsize, scaled_dtype.itemsize
+
+        if scaled_itemsize > itemsize:
+            buffer.resize(num_elements * scaled_itemsize, refcheck=False)
+
+        chunk_starts = range(0, num_elements, chunk_size)
+        if scaled_itemsize > itemsize:
+            chunk_starts = reversed(chunk_starts)
+
+        for start in chunk_starts:
+
+            stop = min(start + chunk_size, num_elements)
+
+            chunk = buffer[start * itemsize:stop * itemsize].view(dtype).copy()
+            chunk = apply_scaling_and_value_offset(chunk, scaling_factor, value_offset,
+                                                   special_constants=special_constants)
+
+            buffer[start * scaled_itemsize:stop * scaled_itemsize].view(scaled_dtype)[:] = np.ma.getdata(chunk)
+
+        if scaled_itemsize < itemsize:
+            buffer.resize(num_elements * scaled_itemsize, refcheck=False)
+
+        data = buffer.view(scaled_dtype)
+
+    return data.reshape(meta_data.dimensions())
+
+
+def _apply_bitmask(data, bit_mask_string, special_constants=None, chunk_size=2**20):
     """ Apply bitmask to *data*, modifying it in-place.
 
     Parameters
@@ -90,6 +227,11 @@ def _apply_bitmask(data, bit_mask_string, special_constants=None):
         Flat array-like integer data, byteswapped to be correct for endianness of current system if necessary
     bit_mask_string : str or unicode
         String of 1's and 0's, same length as number of bits in each *data* datum
+    special_constants : dict, optional
+        Special_Constants of *data*. Values matching a special constant are not modified.
+    chunk_size : int, optional
+        Number of elements to process at a time, such that temporary arrays (e.g. for data that is
+        memory mapped) remain small. Defaults to 2**20.
 
     Returns
     -------
@@ -101,21 +243,33 @@ def _apply_bitmask(data, bit_mask_string, special_constants=None):
         return
 
     # Convert bit mask to binary (python assumes the input is a string describing the integer in MSB format,
-    # which is what the PDS4 standard specifies.)
-    bit_mask = int(bit_mask_string, 2)
+    # which is what the PDS4 standard specifies.) Casting via an unsigned integer preserves its bits for
+    # data having a signed data type.
+    bit_mask = np.array(int(bit_mask_string, 2), dtype='uint64').astype(data.dtype)
 
-    # Mask Special_Constants values so that bit mask application does not affect them
-    non_masked = np.arange(0, len(data))
+    # Values of Special_Constants are excluded, so that bit mask application does not affect them
+    special_values = []
     if special_constants is not None:
+        special_values = [value for key, value in six.iteritems(special_constants) if 'valid_' not in key]
+
+    # Apply bit mask to each datum
+    data = np.asarray(data)
 
-        masked_data = mask_special_constants(data, special_constants=special_constants)
-        non_masked = np.where(masked_data.mask == False)
+    for start in range(0, len(data), chunk_size):
 
-        del masked_data
+        chunk = data[start:start + chunk_size]
 
-    # Apply bit mask to each datum
-    for i in np.nditer(non_masked, flags=['zerosize_ok']):
-        data[i] &= bit_mask
+        if special_values:
+
+            is_special = np.zeros(chunk.shape, dtype='bool')
+
+            for value in special_values:
+                is_special |= (chunk == value)
+
+            np.bitwise_and(chunk, bit_mask, out=chunk, where=~is_special)
+
+        else:
+            np.bitwise_and(chunk, bit_mask, out=chunk)
 
 
 def new_array(input, no_scale=False, no_bitmask=False, masked=None, copy=True, **structure_kwargs):
@@ -238,7 +392,7 @@ def new_array(input, no_scale=False, no_bitmask=False, masked=None, copy=True, *
     return array_structure
 
 
-def read_array_data(array_structure, no_scale, memmap=False):
+def read_array_data(array_structure, no_scale, memmap=False, scale_mode='eager', native_byteorder=False):
     """
     Reads and properly formats the data for a single PDS4 array structure, modifies *array_structure* to
     contain all extracted fields for said table.
@@ -252,6 +406,13 @@ def read_array_data(array_structure, no_scale, memmap=False):
     memmap : bool, optional
         If True, extracted data is memory mapped. Only guaranteed for unscaled data or for *no_scale*;
         otherwise returned data maybe a copy. Defaults to False.
+    scale_mode : str or unicode, optional
+        If 'lazy', and the data needs to be scaled or bit masked, the data is memory mapped and set as
+        a `LazyScaledArray`, which does so on access. Defaults to 'eager'.
+    native_byteorder : bool, optional
+        If True, data stored in non-native byte order is converted to native byte order, byteswapping it
+        in-place, and the stored byte order is recorded in the ``original_byteorder`` attribute of the
+        structure's meta data. Defaults to False.
 
     Returns
     -------
@@ -263,6 +424,19 @@ def read_array_data(array_structure, no_scale, memmap=False):
     element_array = meta_data['Element_Array']
     data_type = element_array['data_type']
 
+    # Record the byte order the data is stored in, if it is to be converted
+    dtype = pds_to_numpy_type(data_type)
+    if native_byteorder and (not dtype.isnative):
+        meta_data.original_byteorder = dtype.byteorder
+
+    # Read the data directly into an array of its final data type, unless it is to be memory mapped
+    memmap = memmap or (scale_mode == 'lazy')
+
+    if not memmap:
+        data = _read_array_data_into(array_structure, no_scale, native_byteorder=native_byteorder)
+        array_structure.data = PDS_array(data, meta_data)
+        return
+
     # Read the data in, and transform it to the necessary data type
     extracted_data = _read_array_byte_data(array_structure, as_string=False, memmap=memmap)
     extracted_data = data_type_convert_array(data_type, extracted_data)
@@ -270,12 +444,35 @@ def read_array_data(array_structure, no_scale, memmap=False):
     # Merge data and meta_data into a PDS_ndarray
     extracted_data = PDS_array(extracted_data, meta_data)
 
+    # Keep the data unscaled (and memory mapped) in lazy mode, deferring scaling and bit masking to access.
+    # Data that needs neither is left as a plain memory mapped array.
+    if scale_mode == 'lazy':
+
+        extracted_data = extracted_data.reshape(meta_data.dimensions())
+
+        needs_scaling = (not no_scale) and ((element_array.get('scaling_factor', 1) != 1) or
+                                            (element_array.get('value_offset', 0) != 0))
+        needs_bitmask = '0' in six.text_type(meta_data.get('Object_Statistics', {}).get('bit_mask', '1'))
+        needs_byteswap = native_byteorder and (not dtype.isnative)
+
+        if needs_scaling or needs_bitmask or needs_byteswap:
+            array_structure.data = LazyScaledArray(extracted_data, no_scale=no_scale,
+                                                   native_byteorder=native_byteorder)
+        else:
+            array_structure.data = extracted_data
+
+        return
+
     # Finish processing (scale and applying bit mask), then set obtained data
     array_structure.data = new_array(extracted_data, no_scale=no_scale, no_bitmask=False,
                                      masked=None, copy=False).data
 
+    if native_byteorder:
+        array_structure.data = convert_to_native_byteorder(array_structure.data)
+
 
-def read_array(full_label, array_label, data_filename, lazy_load=False, no_scale=False):
+def read_array(full_label, array_label, data_filename, lazy_load=False, no_scale=False, scale_mode='eager',
+               native_byteorder=False):
     """ Create the `ArrayStructure`, containing label, data and meta data for a PDS4 Array from a file.
 
     Used for all forms of PDS4 Arrays (e.g., Array, Array_2D_Image, Array_3D_Spectrum, etc).
@@ -294,6 +491,11 @@ def read_array(full_label, array_label, data_filename, lazy_load=False, no_scale
     no_scale : bool, optional
         If True, returned data will not be adjusted according to the offset and scaling factor.
         Defaults to False.
+    scale_mode : str or unicode, optional
+        If 'eager', the data is scaled when it is read-in. If 'lazy', the data is kept in its stored
+        data type (memory mapped) and is scaled on access. Defaults to 'eager'.
+    native_byteorder : bool, optional
+        If True, data is converted to native byte order when read. Defaults to False.
 
     Returns
     -------
@@ -312,6 +514,7 @@ def read_array(full_label, array_label, data_filename, lazy_load=False, no_scale
 
     # Create the data structure for this array
     array_structure = ArrayStructure.from_file(data_filename, array_label, full_label,
-                                               lazy_load=lazy_load, no_scale=no_scale)
+                                               lazy_load=lazy_load, no_scale=no_scale, scale_mode=scale_mode,
+                                               native_byteorder=native_byteorder)
 
     return array_structure
@@ -26,6 +26,10 @@ def _read_header_byte_data(header_structure):
 
     from .core import read_byte_data
 
+    # Use byte data read-in together with that of other structures, if available
+    if header_structure._byte_data is not None:
+        return header_structure._byte_data.tostring()
+
     meta_data = header_structure.meta_data
 
     start_byte = meta_data['offset']
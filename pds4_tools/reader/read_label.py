@@ -3,6 +3,7 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import re
 import xml.etree.ElementTree as ET
 from xml.parsers.expat import ExpatError
 
@@ -18,14 +19,27 @@ try:
 except ImportError:
     ParseError = None
 
+# Safe import of lxml (optional parser backend), and of the exception it raises for invalid XML
+try:
+    from lxml import etree as lxml_etree
+    lxml_errors = (lxml_etree.XMLSyntaxError, )
+
+except ImportError:
+    lxml_etree = None
+    lxml_errors = ()
+
 # Initialize the logger
 logger = logger_init()
 
+# Matches the characters on which ``splitlines`` splits lines, for unicode and for byte strings
+_LINE_BOUNDARY_RE = re.compile('[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]')
+_BYTES_LINE_BOUNDARY_RE = re.compile(b'[\n\r]')
+
 #################################
 
 
 def read_label(filename, strip_extra_whitespace=True, enforce_default_prefixes=False,
-               include_namespace_map=False, decode_py2=False):
+               include_namespace_map=False, decode_py2=False, parser_backend='auto'):
 
     """ Reads a PDS4 XML Label into an ``ElementTree`` Element object.
 
@@ -51,6 +65,11 @@ def read_label(filename, strip_extra_whitespace=True, enforce_default_prefixes=F
         decode_py2 : bool, optional
             If True, decodes UTF-8 byte strings (``str``) into ``unicode``
             strings in Python 2. Option is ignored in Python 3. Defaults to False.
+        parser_backend : str or unicode, optional
+            The XML parser used to parse the label, one of 'etree' (``ElementTree``),
+            'lxml' or 'auto'. The label is returned as an ``ElementTree`` Element
+            regardless. If 'auto', uses lxml if it is installed and faster (see
+            `get_parser_backend`). Defaults to 'auto'.
 
         Returns
         -------
@@ -59,9 +78,18 @@ def read_label(filename, strip_extra_whitespace=True, enforce_default_prefixes=F
 
     """
 
-    # Read-in XML tree
+    parser_backend = get_parser_backend(parser_backend)
+
+    # Read-in XML tree. Comments and processing instructions are removed by lxml, as they are by
+    # ElementTree. Entities are not resolved, and large text nodes are allowed, as by ElementTree.
     try:
-        xml_tree = ET.iterparse(filename, events=('start-ns', 'end'))
+
+        if parser_backend == 'lxml':
+            xml_tree = lxml_etree.iterparse(filename, events=('start-ns', 'end'), remove_comments=True,
+                                            remove_pis=True, resolve_entities=False, huge_tree=True)
+        else:
+            xml_tree = ET.iterparse(filename, events=('start-ns', 'end'))
+
     except IOError:
         raise IOError('Unable to locate or read label file: ' + filename)
 
@@ -75,18 +103,12 @@ def read_label(filename, strip_extra_whitespace=True, enforce_default_prefixes=F
             # Add namespace to the namespace map
             if event == 'start-ns':
 
-                if enforce_default_prefixes:
-
-                    for prefix, uri in six.iteritems(PDS4_NAMESPACES):
-
-                        # Ensure the PDS4 namespace is the default prefix
-                        if elem[1] == PDS4_NAMESPACES['pds']:
-                            elem = ('', elem[1])
+                # In Python 2, ElementTree gives non-empty prefixes as ``unicode``, lxml gives ASCII as ``str``
+                if six.PY2 and (parser_backend == 'lxml') and elem[0]:
+                    elem = (six.text_type(elem[0]), elem[1])
 
-                        # Ensure that dictionaries which are referred to in code
-                        # by prefix (such as disp and sp) have the expected prefix
-                        elif uri == elem[1]:
-                            elem = (prefix, elem[1])
+                if enforce_default_prefixes:
+                    elem = (_get_default_prefix(*elem), elem[1])
 
                 # Add namespace to map (different prefixes for an existing namespace URI are skipped)
                 # Technical note: this map is stored dict[URI] = prefix for two reasons:
@@ -101,29 +123,20 @@ def read_label(filename, strip_extra_whitespace=True, enforce_default_prefixes=F
 
                 continue
 
-            # Strip PDS4 namespace tag (a continuation of ensuring default prefix is PDS4 namespace)
-            if (enforce_default_prefixes) and (PDS4_NAMESPACES['pds'] in elem.tag):
-                elem.tag = elem.tag.split('{', 1)[0] + elem.tag.split('}', 1)[1]
-
-            # Strip whitespace in elements and attributes if requested
-            if strip_extra_whitespace:
-
-                subiter = ET.ElementTree(elem).getiterator()
-                attribs = six.iteritems(elem.attrib)
+            # Elements parsed by lxml are adjusted once converted to ElementTree Elements below
+            if parser_backend == 'etree':
+                _adjust_element(elem, strip_extra_whitespace, enforce_default_prefixes)
 
-                # Strip whitespaces at beginning and end of value in elements that do not have children
-                if len(elem) == 0:
-                    for elem_content in subiter:
-
-                        if (elem_content.text) and (_non_blank_line_count(elem_content.text) == 1):
-                            elem_content.text = _normalize(elem_content.text)
+        label_xml_root = xml_tree.root
 
-                # Strip whitespaces at beginning and end of attribute values
-                for name, value in attribs:
-                    if _non_blank_line_count(value) == 1:
-                        elem.attrib[name] = _normalize(value)
+        # Convert lxml Elements into ElementTree Elements. The elements are adjusted only after conversion
+        # because, in Python 2, lxml changes ``unicode`` set on its elements back into ``str`` if ASCII.
+        if parser_backend == 'lxml':
+            label_xml_root = _lxml_to_etree(label_xml_root)
 
-        label_xml_root = xml_tree.root
+            if strip_extra_whitespace or enforce_default_prefixes:
+                for elem in label_xml_root.getiterator():
+                    _adjust_element(elem, strip_extra_whitespace, enforce_default_prefixes)
 
         # For Python 2, we can decode all ``str`` to ``unicode``, such that all meta data strings
         # are consistently unicode.
@@ -131,10 +144,14 @@ def read_label(filename, strip_extra_whitespace=True, enforce_default_prefixes=F
             label_xml_root = _decode_tree(label_xml_root)
 
     # Raise exception if XML cannot be parsed. In Python 3 we raise from None to avoid confusing re-raise
-    except (ExpatError, ParseError):
+    except (ExpatError, ParseError) + lxml_errors:
         six.raise_from(
             ExpatError('The requested PDS4 label file does not appear contain valid XML: ' + filename), None)
 
+    # lxml opens the label file only once parsing begins
+    except IOError:
+        six.raise_from(IOError('Unable to locate or read label file: ' + filename), None)
+
     if include_namespace_map:
         return label_xml_root, namespace_map
 
@@ -142,6 +159,259 @@ def read_label(filename, strip_extra_whitespace=True, enforce_default_prefixes=F
         return label_xml_root
 
 
+def get_parser_backend(parser_backend='auto'):
+    """ Resolve the XML parser backend used to read labels.
+
+    Notes
+    -----
+    Labels are always returned as ``ElementTree`` Elements. When lxml is used, the parsed label is
+    therefore converted, which on Python 3 (where ``ElementTree`` is implemented in C) is slower than
+    parsing with ``ElementTree`` directly. On Python 2 (where it is implemented in Python), lxml is
+    faster even with the conversion. Therefore 'auto' uses lxml only on Python 2.
+
+    Parameters
+    ----------
+    parser_backend : str or unicode, optional
+        One of 'etree', 'lxml' or 'auto'. Defaults to 'auto'.
+
+    Returns
+    -------
+    str or unicode
+        Either 'etree' or 'lxml'.
+
+    Raises
+    ------
+    ValueError
+        Raised if *parser_backend* is unknown, or is 'lxml' but lxml is not installed.
+    """
+
+    if parser_backend == 'auto':
+        return 'lxml' if (six.PY2 and lxml_etree is not None) else 'etree'
+
+    elif parser_backend not in ('etree', 'lxml'):
+        raise ValueError("Unknown parser backend '{0}'; must be one of 'etree', 'lxml' or 'auto'."
+                         .format(parser_backend))
+
+    elif (parser_backend == 'lxml') and (lxml_etree is None):
+        raise ValueError("The lxml parser backend requires lxml, which is not installed.")
+
+    return parser_backend
+
+
+def make_convenient_label(label_xml_root, namespace_map, include_element_map=False):
+    """ Derive the convenient form of a PDS4 label from its unmodified form.
+
+    The convenient form is that returned by `read_label` when both *strip_extra_whitespace* and
+    *enforce_default_prefixes* are set. Deriving it from the unmodified form, which is a single linear
+    pass over the elements of the label, avoids having to read and parse the label a second time.
+
+    Parameters
+    ----------
+    label_xml_root : ``ElementTree`` Element
+        Root element for a PDS4 label, as read-in by `read_label` without modification. Not modified.
+    namespace_map : dict
+        Keys are the namespace URIs and values are the namespace prefixes in the label, as read-in by
+        `read_label` without modification.
+    include_element_map : bool, optional
+        If True, changes method return to include a third value, a ``dict`` mapping each element in
+        the unmodified form to its corresponding element in the convenient form, and vice versa.
+        Defaults to False.
+
+    Returns
+    -------
+    tuple[``ElementTree`` Element, dict]
+        Root element for the convenient form of the PDS4 label, and its namespace map.
+    """
+
+    convenient_namespace_map = dict((uri, _get_default_prefix(prefix, uri))
+                                    for uri, prefix in six.iteritems(namespace_map))
+
+    # Labels repeat a small number of tags many times, so each distinct tag is converted only once
+    convenient_tags = {}
+    element_map = {}
+
+    def convert(elem):
+
+        tag = elem.tag
+        convenient_tag = convenient_tags.get(tag)
+
+        if convenient_tag is None:
+            convenient_tag = convenient_tags[tag] = _strip_default_namespace(tag)
+
+        text, attrib = _strip_element_whitespace(elem)
+
+        convenient_elem = ET.Element(convenient_tag, attrib)
+        convenient_elem.text = text
+        convenient_elem.tail = elem.tail
+
+        element_map[elem] = convenient_elem
+        element_map[convenient_elem] = elem
+
+        return convenient_elem
+
+    convenient_root = convert(label_xml_root)
+    elems = [(label_xml_root, convenient_root)]
+
+    while elems:
+
+        elem, convenient_elem = elems.pop()
+
+        for child in elem:
+            convenient_child = convert(child)
+            convenient_elem.append(convenient_child)
+
+            if len(child) > 0:
+                elems.append((child, convenient_child))
+
+    if include_element_map:
+        return convenient_root, convenient_namespace_map, element_map
+
+    return convenient_root, convenient_namespace_map
+
+
+def _get_default_prefix(prefix, uri):
+    """ Obtain the prefix to use for a namespace when enforcing default prefixes.
+
+    Parameters
+    ----------
+    prefix : str or unicode
+        The prefix of the namespace in the label.
+    uri : str or unicode
+        The URI of the namespace.
+
+    Returns
+    -------
+    str or unicode
+        An empty prefix for the PDS4 namespace (such that it is the default namespace), the expected
+        prefix for other known namespaces (PDS4_NAMESPACES), and otherwise *prefix*.
+    """
+
+    # Ensure the PDS4 namespace is the default prefix
+    if uri == PDS4_NAMESPACES['pds']:
+        return ''
+
+    # Ensure that dictionaries which are referred to in code by prefix (such as disp and sp) have
+    # the expected prefix
+    for default_prefix, default_uri in six.iteritems(PDS4_NAMESPACES):
+        if uri == default_uri:
+            return default_prefix
+
+    return prefix
+
+
+def _strip_default_namespace(tag):
+    """
+    Parameters
+    ----------
+    tag : str or unicode
+        Tag of an element, in ``ElementTree`` notation.
+
+    Returns
+    -------
+    str or unicode
+        The tag, with the namespace stripped if it is the PDS4 namespace.
+    """
+
+    if PDS4_NAMESPACES['pds'] in tag:
+        tag = tag.split('{', 1)[0] + tag.split('}', 1)[1]
+
+    return tag
+
+
+def _strip_element_whitespace(elem):
+    """ Strip whitespace in the value and the attribute values of an element.
+
+    Parameters
+    ----------
+    elem : ``ElementTree`` Element
+        The element. Not modified.
+
+    Returns
+    -------
+    tuple[str or unicode or None, dict]
+        The text of the element and its attributes, with whitespace normalized (see `_normalize_value`).
+        Text is only normalized for elements without children.
+    """
+
+    text = elem.text
+    attrib = elem.attrib
+
+    # Strip whitespaces at beginning and end of value in elements that do not have children
+    if text and (len(elem) == 0):
+        text = _normalize_value(text)
+
+    # Strip whitespaces at beginning and end of attribute values
+    if attrib:
+        attrib = dict((name, _normalize_value(value)) for name, value in six.iteritems(attrib))
+
+    return text, attrib
+
+
+def _adjust_element(elem, strip_extra_whitespace, enforce_default_prefixes):
+    """ Adjust an element of a label as requested by `read_label`.
+
+    Parameters
+    ----------
+    elem : ``ElementTree`` Element
+        The element to adjust, in-place.
+    strip_extra_whitespace : bool
+        If True, whitespace in the element's text and attribute values is stripped.
+    enforce_default_prefixes : bool
+        If True, the PDS4 namespace is stripped from the element's tag.
+
+    Returns
+    -------
+    None
+    """
+
+    # Strip PDS4 namespace tag (a continuation of ensuring default prefix is PDS4 namespace)
+    if enforce_default_prefixes:
+        elem.tag = _strip_default_namespace(elem.tag)
+
+    # Strip whitespace in elements and attributes if requested
+    if strip_extra_whitespace:
+        elem.text, elem.attrib = _strip_element_whitespace(elem)
+
+
+def _lxml_to_etree(lxml_root):
+    """ Convert an lxml tree into an ``ElementTree`` tree.
+
+    Parameters
+    ----------
+    lxml_root : ``lxml.etree`` Element
+        Root element of the tree to convert. Must not contain comments or processing instructions.
+
+    Returns
+    -------
+    ``ElementTree`` Element
+        Root element of the converted tree, having the same tags, text, tails and attributes.
+    """
+
+    def convert(lxml_elem):
+
+        elem = ET.Element(lxml_elem.tag, dict(lxml_elem.attrib))
+        elem.text = lxml_elem.text
+        elem.tail = lxml_elem.tail
+
+        return elem
+
+    root = convert(lxml_root)
+    elems = [(lxml_root, root)]
+
+    while elems:
+
+        lxml_elem, elem = elems.pop()
+
+        for lxml_child in lxml_elem:
+            child = convert(lxml_child)
+            elem.append(child)
+
+            if len(lxml_child) > 0:
+                elems.append((lxml_child, child))
+
+    return root
+
+
 def _decode_tree(xml_tree):
     """ Decode an XML tree from UTF-8 encoded ``str`` to ``unicode``.
 
@@ -200,27 +470,38 @@ def _decode_tree(xml_tree):
     return xml_tree
 
 
-def _non_blank_line_count(string):
-    """
+def _normalize_value(value):
+    """ Normalize whitespace in a value if it contains a single non-blank line.
+
+    Notes
+    -----
+    A value has a single non-blank line if, once its leading and trailing whitespace is removed, it is
+    non-empty and contains no line boundaries. Checking this with a compiled regular expression scans the
+    value once, rather than splitting it into lines and stripping each.
+
     Parameters
     ----------
-    string : str or unicode
-        String (potentially multi-line) to search in.
+    value : str or unicode
+        Value (potentially multi-line) to normalize.
 
     Returns
     -------
-    int
-        Number of non-blank lines in string.
+    str or unicode
+        The value whitespace-collapsed (see `_normalize`) if it contains a single non-blank line,
+        otherwise the value unchanged.
     """
 
-    non_blank_counter = 0
+    stripped = value.strip()
 
-    for line in string.splitlines():
+    if isinstance(value, six.text_type):
+        line_boundary_re = _LINE_BOUNDARY_RE
+    else:
+        line_boundary_re = _BYTES_LINE_BOUNDARY_RE
 
-        if line.strip():
-            non_blank_counter += 1
+    if (not stripped) or line_boundary_re.search(stripped):
+        return value
 
-    return non_blank_counter
+    return _normalize(stripped)
 
 
 def _normalize(string):
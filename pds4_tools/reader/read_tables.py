@@ -3,18 +3,19 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
-import itertools
 from functools import reduce
 from math import log10
 
 import numpy as np
+from numpy.lib.stride_tricks import as_strided
 
 from .read_arrays import apply_scaling_and_value_offset
 from .table_objects import (TableStructure, TableManifest, Meta_Field)
 from .data import PDS_array
-from .data_types import (data_type_convert_table_ascii, data_type_convert_table_binary,
+from .data_types import (PDS_NUMERIC_TYPES, data_type_convert_table_ascii, data_type_convert_table_binary,
                          decode_bytes_to_unicode, pds_to_numpy_type, pds_to_numpy_name,
-                         mask_special_constants, get_min_integer_numpy_type)
+                         mask_special_constants, get_min_integer_numpy_type, get_scaled_numpy_type,
+                         convert_to_native_byteorder, is_pds_integer_data)
 
 from ..utils.constants import PDS4_TABLE_TYPES
 from ..utils.logging import logger_init
@@ -25,6 +26,10 @@ from six.moves import range
 # Initialize the logger
 logger = logger_init()
 
+# The table structure, manifest and requested fields used by a worker process of
+# `_extract_delimited_fields_parallel`, set by `_init_delimited_worker`
+_delimited_worker_table = None
+
 #################################
 
 
@@ -43,13 +48,19 @@ def _read_table_byte_data(table_structure):
 
     Returns
     -------
-    str or bytes
-        The byte data for the table.
+    str, bytes or np.ndarray
+        The byte data for the table. For tables whose byte data was read-in together with that of other
+        structures, the uint8 array containing said data.
     """
 
     from .core import read_byte_data
 
     meta_data = table_structure.meta_data
+
+    # Use byte data read-in together with that of other structures, if available
+    if table_structure._byte_data is not None:
+        return table_structure._byte_data
+
     num_records = meta_data['records']
     start_byte = meta_data['offset']
 
@@ -78,8 +89,91 @@ def _read_table_byte_data(table_structure):
     return read_byte_data(table_structure.parent_filename, start_byte, stop_byte)
 
 
-def _make_uniformly_sampled_field(table_structure, uni_sampled_field):
-    """ Create/obtain data for a Uniformly_Sampled field.
+def _iter_delimited_records(table_structure, records_per_chunk, block_size=2**22):
+    """ Iterate over the records of a PDS4 Table_Delimited, reading the data file in blocks.
+
+    Parameters
+    ----------
+    table_structure : TableStructure
+        The PDS4 Table data structure for which the records need to be read. Should have been
+        initialized via `TableStructure.from_file` method, or contain the required meta data.
+    records_per_chunk : int
+        Number of records in each yielded chunk. The last chunk may contain fewer records.
+    block_size : int, optional
+        Number of bytes read from the data file at a time. Defaults to 4 MB.
+
+    Yields
+    ------
+    list[str or bytes]
+        The byte data for each record in a chunk of records, excluding the record delimiters.
+    """
+
+    data_filename = table_structure.parent_filename
+    meta_data = table_structure.meta_data
+
+    num_records = meta_data['records']
+    bytes_remaining = meta_data.get('object_length')
+
+    records = []
+    remainder = b''
+    num_yielded_records = 0
+    end_of_data = False
+
+    try:
+
+        with open(data_filename, 'rb') as file_handler:
+
+            file_handler.seek(meta_data['offset'])
+
+            while num_yielded_records < num_records:
+
+                # Read the next block, splitting it into records. The last (possibly partial) record
+                # in each block is kept until the following block is read.
+                read_size = block_size if (bytes_remaining is None) else min(block_size, bytes_remaining)
+                block = file_handler.read(read_size) if (read_size > 0) else b''
+
+                if bytes_remaining is not None:
+                    bytes_remaining -= len(block)
+
+                if block:
+                    records += (remainder + block).split(b'\r\n')
+                    remainder = records.pop()
+
+                else:
+                    end_of_data = True
+
+                    if remainder:
+                        records.append(remainder)
+
+                # Yield all available full chunks (or all remaining records once there is no more data). The
+                # records yielded are removed from the front of the list only once per block, rather than once
+                # per chunk, since each removal moves all remaining records.
+                start = 0
+
+                while (start < len(records)) and (end_of_data or len(records) - start >= records_per_chunk):
+
+                    chunk_size = min(records_per_chunk, num_records - num_yielded_records)
+                    chunk = records[start:start + chunk_size]
+                    start += len(chunk)
+
+                    num_yielded_records += len(chunk)
+                    yield chunk
+
+                    if num_yielded_records >= num_records:
+                        break
+
+                del records[0:start]
+
+                if end_of_data:
+                    break
+
+    except IOError as e:
+        raise six.raise_from(IOError("Unable to read data from file '" + data_filename +
+                                     "' found in label - {0}".format(e)), None)
+
+
+def _get_uniformly_sampled_dtype(uni_sampled_field, quiet=False):
+    """ Determine the data type of the data for a Uniformly_Sampled field.
 
     Notes
     -----
@@ -91,12 +185,56 @@ def _make_uniformly_sampled_field(table_structure, uni_sampled_field):
     for each built-in Python numeric type. Therefore we instead almost assume that the data will
     be floats and require 64-bit precision, and leave it to a user to cast the data if desired.
 
+    Parameters
+    ----------
+    uni_sampled_field : Meta_FieldUniformlySampled
+        Meta data of a single Uniformly Sampled field.
+    quiet : bool, optional
+        If True, suppresses the warning emitted for integer data exceeding 8 bytes. Defaults to False.
+
+    Returns
+    -------
+    np.dtype
+        Either float64 or, for integer data exceeding 8 bytes, object.
+    """
+
+    first_value = uni_sampled_field['first_value']
+    last_value = uni_sampled_field['last_value']
+
+    # If the first and last value (one of which should contain the largest possible value) are integers,
+    # there is a chance that the uniformly sampled field contains integers larger than even double supports
+    # (without Inf). Therefore we check this, and use 'object' dtype in such a case.
+    if isinstance(first_value, six.integer_types) and isinstance(last_value, six.integer_types):
+
+        if get_min_integer_numpy_type([first_value, last_value]) == 'object':
+
+            if not quiet:
+                logger.warning('Detected numeric data exceeding 8 bytes in Uniformly Sampled field. For '
+                               'integer data this precision exceeds memory efficient case. For decimal data, '
+                               'the data will be downcast to 8-byte floats.')
+
+            return np.dtype('object')
+
+    return np.dtype('float64')
+
+
+def _make_uniformly_sampled_field(table_structure, uni_sampled_field, record_idx=None):
+    """ Create/obtain data for a Uniformly_Sampled field.
+
+    Notes
+    -----
+    See `_get_uniformly_sampled_dtype` for the data type of the returned data. For float64 data, the
+    values of all records are computed at once; only integer data exceeding 8 bytes is computed one
+    value at a time (as exact integers).
+
     Parameters
     ----------
     table_structure : TableStructure
         The PDS4 Table data structure which contains the *uni_sampled_field*.
-    uni_sampled_field : Label
-        Portion of label that defines a single Uniformly Sampled field.
+    uni_sampled_field : Meta_FieldUniformlySampled
+        Meta data of a single Uniformly Sampled field.
+    record_idx : array_like[int], optional
+        If given, the data is created only for these record numbers. Defaults to all records.
 
     Returns
     -------
@@ -117,32 +255,28 @@ def _make_uniformly_sampled_field(table_structure, uni_sampled_field):
     last_value = uni_sampled_field['last_value']
     interval = uni_sampled_field['interval']
 
-    # If the first and last value (one of which should contain the largest possible value) are integers,
-    # there is a chance that the uniformly sampled field contains integers larger than even double supports
-    # (without Inf). Therefore we check this, and use 'object' dtype in such a case.
-    if isinstance(first_value, six.integer_types) and isinstance(last_value, six.integer_types):
-        dtype = get_min_integer_numpy_type([first_value, last_value])
+    # Obtain the record numbers (j - 1, for j = 1 ... n, in the formulas below) to create data for
+    is_section = record_idx is not None
+    dtype = _get_uniformly_sampled_dtype(uni_sampled_field, quiet=is_section)
 
-        if dtype == 'object':
-            logger.warning('Detected numeric data exceeding 8 bytes in Uniformly Sampled field. For integer '
-                           'data this precision exceeds memory efficient case. For decimal data, the data'
-                           'will be downcast to 8-byte floats.')
+    if is_section:
+        record_idx = np.asarray(record_idx, dtype='int64').reshape(-1)
     else:
-        dtype = None
+        record_idx = np.arange(0, num_records, dtype='int64')
 
-    # Create an array_like to contain the data for this field
-    dtype = 'object' if dtype == 'object' else 'float64'
-    data = np.empty(num_records, dtype=dtype)
+    # Integers exceeding 8 bytes are computed exactly, one value at a time
+    if dtype == 'object':
+        j = [int(record_num) for record_num in record_idx]
+    else:
+        j = record_idx.astype('float64')
 
     # Calculate field's data for Linear sampling
     if scale == 'linear':
 
-        current_value = first_value
-
-        for j in range(0, num_records):
-
-            data[j] = current_value
-            current_value += interval
+        if dtype == 'object':
+            data = [first_value + record_num * interval for record_num in j]
+        else:
+            data = first_value + j * interval
 
     # Calculate field's data for Logarithmic sampling
     elif scale == 'logarithmic':
@@ -152,10 +286,10 @@ def _make_uniformly_sampled_field(table_structure, uni_sampled_field):
 
         x1 = first_value
 
-        for j in range(0, num_records):
-
-            current_value = x1 * (interval ** j)
-            data[j] = current_value
+        if dtype == 'object':
+            data = [x1 * (interval ** record_num) for record_num in j]
+        else:
+            data = x1 * np.power(float(interval), j)
 
     # Calculate field's data for Exponential sampling
     elif scale == 'exponential':
@@ -168,42 +302,158 @@ def _make_uniformly_sampled_field(table_structure, uni_sampled_field):
         log_x1 = base ** first_value
         log_base = log10(base)
 
-        for j in range(0, num_records):
+        if dtype == 'object':
+            data = [log10(log_x1 + record_num * interval) / log_base for record_num in j]
+        else:
+            data = np.log10(log_x1 + j * interval) / log_base
+
+    else:
+        data = np.empty(len(record_idx))
+
+    # Create an array_like to contain the data for this field
+    if dtype == 'object':
+        created_data = np.empty(len(record_idx), dtype='object')
+        created_data[:] = data
 
-            current_value = log10(log_x1 + j * interval) / log_base
-            data[j] = current_value
+    else:
+        created_data = np.asarray(data, dtype='float64')
 
     # Function to compare closeness of two floating point numbers, based on PEP-0485 with larger tolerance
     def is_close_num(a, b, rel_tol=1e-3, abs_tol=0.0):
         return abs(a-b) <= max(rel_tol * max(abs(a), abs(b)), abs_tol)
 
     # Warn if last calculated value for Uniformly Sampled does not match indicated last value in label
-    if not is_close_num(last_value, data[-1]):
+    if (not is_section) and (num_records > 0) and (not is_close_num(last_value, created_data[-1])):
         logger.warning("Last value in Uniformly Sampled field, '{0}', does not match expected '{1}'."
-                       .format(data[-1], last_value))
+                       .format(created_data[-1], last_value))
 
-    return data
+    return created_data
+
+
+def _get_group_locations(table_manifest, field):
+    """ Obtain the location and repetition length of each group a field is inside of.
+
+    Parameters
+    ----------
+    table_manifest : TableManifest
+        A manifest describing the structure of the PDS4 table containing *field*.
+    field : Meta_Field
+        The field to obtain group locations for.
+
+    Returns
+    -------
+    list[int], list[int]
+        A two-valued tuple of: the location of the first element of the first repetition (i.e.,
+        group_location - 1), in bytes, of each group; and the group_length divided by the number of
+        repetitions, in bytes, for each group. Both are ordered from the outermost to the innermost
+        group, and are empty if *field* is not inside any group.
+    """
+
+    group_locations = []
+    repetition_lengths = []
+
+    parent_idx = table_manifest.index(field)
+    for parent_group in table_manifest.get_parents_by_idx(parent_idx):
+        group_locations.insert(0, parent_group['location'] - 1)
+        repetition_lengths.insert(0, parent_group['length'] // parent_group['repetitions'])
+
+    return group_locations, repetition_lengths
+
+
+def _has_contiguous_repetitions(field_length, array_shape, group_locations, repetition_lengths):
+    """ Determine if all elements of a field in a single record are contiguous.
+
+    Fields that are not inside group fields are always contiguous. For a field inside group fields, we
+    check that all group locations (except possibly the first) start from the first byte, and that the
+    group_length/group_repetitions of each group is equal to the group_length of its child group. Finally,
+    we check that the group_length/group_repetitions for the last group is equal to the field length.
+
+    Parameters
+    ----------
+    field_length : int
+        Length of each element in the field, in bytes.
+    array_shape : array_like[int]
+        Sequence of dimensions for the field. First element is the number of records, all other
+        elements are the number of repetitions for each GROUP the field is inside of, if any.
+    group_locations : array_like[int]
+        The location of the first element of the first repetition, in bytes, of each group.
+    repetition_lengths : array_like[int]
+        The group length divided by the number of repetitions, in bytes, for each group.
+
+    Returns
+    -------
+    bool
+        True if all elements of the field in a single record are one after the other, False otherwise.
+    """
+
+    if len(array_shape) == 1:
+        return True
+
+    has_contiguous_locations = list(group_locations[1:]) == [0] * (len(group_locations) - 1)
+    has_contiguous_end_bytes = field_length == repetition_lengths[-1]
+
+    for i, length in enumerate(repetition_lengths[1:]):
+
+        if length * array_shape[i+2] != repetition_lengths[i]:
+            has_contiguous_end_bytes = False
+
+    return has_contiguous_locations and has_contiguous_end_bytes
+
+
+def _make_record_matrix(table_byte_data, num_records, record_length):
+    """ Create a 2D view of the byte data for a fixed-width (Character or Binary) table.
+
+    Parameters
+    ----------
+    table_byte_data : str, bytes, bytearray or buffer
+        Byte data for the entire table.
+    num_records : int
+        Number of records in the table.
+    record_length : int
+        Length of each record in the table, in bytes.
+
+    Returns
+    -------
+    np.ndarray
+        A uint8 array of shape (num_records, record_length), which is a view of *table_byte_data*. Each
+        row contains the byte data of a single record.
+
+    Raises
+    ------
+    ValueError
+        Raised if *table_byte_data* is too short to contain all records.
+    """
+
+    byte_data = np.frombuffer(table_byte_data, dtype='uint8')
+    expected_size = num_records * record_length
 
+    if byte_data.size < expected_size:
+        raise ValueError('Table data is shorter ({0} bytes) than expected from its label ({1} bytes).'
+                         .format(byte_data.size, expected_size))
 
-def _extract_fixed_width_field_data(extracted_data, table_byte_data,
-                                    field_length, field_location, record_length,
+    return byte_data[0:expected_size].reshape(num_records, record_length)
+
+
+def _extract_fixed_width_field_data(record_matrix, field_length, field_location,
                                     array_shape, group_locations=(), repetition_lengths=()):
     """
     Extracts data for a single field in a fixed-width (Character or Binary) table.
 
+    Notes
+    -----
+    The data for the field is extracted via strided views of *record_matrix*, such that the data for all
+    records is extracted at once, without creating any Python objects for each record.
+
     Parameters
     ----------
-    extracted_data : list[str or bytes]
-        The extracted byte data for each element the table. Should be an empty list on initial call.
-        Modified in-place.
-    table_byte_data : str or bytes
-        Byte data for the entire table.
+    record_matrix : np.ndarray
+        A uint8 array of shape (num_records, record_length), containing the byte data of the entire
+        table. See `_make_record_matrix`.
     field_length : int
         Length of each element in the field, in bytes.
     field_location : int
-        Location of the first element in the field, in bytes, from the beginning of the table.
-    record_length : int
-        Length of each record in the table, in bytes.
+        Location of the first element in the field, in bytes, from the beginning of the record (or
+        from the beginning of the group repetition, for fields inside group fields).
     array_shape : array_like[int]
         Sequence of dimensions for the field. First element is the number of records, all other
         elements are the number of repetitions for each GROUP the field is inside of, if any.
@@ -216,103 +466,78 @@ def _extract_fixed_width_field_data(extracted_data, table_byte_data,
 
     Returns
     -------
-    None
+    np.ndarray
+        A flat, writable, array of byte strings (each of *field_length*) containing the extracted byte
+        data for each element of the field. Elements are ordered by record, then by group repetition(s).
     """
 
-    # Simplified, sped up, case for fields that are not inside group fields
-    if len(array_shape) == 1:
-
-        # Loop over each record, extracting the datum for this field
-        for record_num in range(0, array_shape[0]):
+    dtype = 'S{0}'.format(field_length)
 
-            start_byte = (record_num * record_length) + field_location
-            stop_byte = start_byte + field_length
-
-            extracted_data.append(table_byte_data[start_byte:stop_byte])
-
-        return
-
-    # Determine if the data for a field inside group fields is contiguous. If it is, we can significantly
-    # speed operations up. To determine if contiguous, we check that all group locations (except possibly
-    # the first) start from the first byte, and that the group_length/group_repetitions of each group is
-    # equal to the group_length of its child group. Finally, we check that the group_length/group_repetitions
-    # for the last group is equal to the field length.
-    has_contiguous_locations = group_locations[1:] == [0] * (len(group_locations) - 1)
-    has_contiguous_end_bytes = field_length == repetition_lengths[-1]
+    # Simplified, sped up, case for fields that are not inside group fields. A column slice of the record
+    # matrix is a strided view of the data for this field, which we copy to obtain contiguous bytes.
+    if len(array_shape) == 1:
 
-    for i, length in enumerate(repetition_lengths[1:]):
+        field_bytes = record_matrix[:, field_location:field_location + field_length]
 
-        if length * array_shape[i+2] != repetition_lengths[i]:
-            has_contiguous_end_bytes = False
+        return np.array(field_bytes, copy=True).view(dtype).reshape(-1)
 
     # Simplified, sped up, case for fields inside group fields that are contiguous. Principle of
-    # operation is that we can effectively read one element after the other, as we would in an array,
-    # where the only thing we need to know is the element length. A slight complication is that we
-    # need to take into account the byte jump between end of the field for one record and start of it
-    # for the next record.
-    if has_contiguous_locations and has_contiguous_end_bytes:
+    # operation is that all elements of the field in a single record are one after the other, as they
+    # would be in an array, therefore they make up a single column slice of the record matrix.
+    if _has_contiguous_repetitions(field_length, array_shape, group_locations, repetition_lengths):
 
-        group_start_byte = group_locations[0]
         num_elements = reduce(lambda x, y: x*y, array_shape[1:])
+        start_byte = group_locations[0] + field_location
+        stop_byte = start_byte + field_length * num_elements
 
-        # Loop over each record
-        for record_num in range(0, array_shape[0]):
-
-            record_start_byte = (record_num * record_length) + group_start_byte + field_location
-
-            # Loop over each element (multiple due to group field) in the record for this field,
-            # extracting them
-            for element_num in range(0, num_elements):
-                start_byte = record_start_byte + field_length * element_num
-                stop_byte = start_byte + field_length
-
-                extracted_data.append(table_byte_data[start_byte:stop_byte])
+        field_bytes = record_matrix[:, start_byte:stop_byte]
 
-        return
+        return np.array(field_bytes, copy=True).view(dtype).reshape(-1)
 
     # If we've reached this point then our field is inside group fields, and those group fields are not
-    # contiguous. Therefore we will need to calculate each and every position.
-
-    # Create a list of positions, where each position is one of every possible valid combination of the
-    # dimension values in *array_shape*. E.g., if the shape of the field (due to a GROUP) is [100, 50], then
-    # the positions created by itertools.product will have values [0, 0], [0, 1], ... [0, 49], [1, 0], ...
-    # [1, 49], [2, 0] ... [99, 49]. Each position therefore contains the record number and the group
-    # repetition numbers for each GROUP the field is in. In case of field that is not inside any groups, this
-    # simplifies to a single for-loop which loops over each record in the field.
-    product_list = [range(0, repetitions) for repetitions in array_shape]
-    positions = itertools.product(*product_list)
-
-    # Extract each element's byte data if we have its full position in array_shape, via the formula:
-    # start_byte = record_length * i_current_record_number
-    # + first_group_location + (first_group_length/first_group_repetitions) * j_current_first_group_repetition
+    # contiguous. The start byte of each element is given by the formula:
+    # start_byte = first_group_location + (first_group_length/first_group_repetitions) * j_current_first_group_repetition
     # + (repeat) n_group_location + (n_group_length/n_group_repetitions) * k_current_n_group_repetition
     # + field_location
-    # stop_byte = start_byte + field_length
-    for current_position in positions:
+    # Since this is linear in each repetition number, the elements of all records form a strided view of the
+    # record matrix, having a stride of group_length/repetitions for each group, which we copy at once.
+    start_byte = field_location + sum(group_locations)
+    stop_byte = start_byte + field_length
+
+    for repetitions, repetition_length in zip(array_shape[1:], repetition_lengths):
+        stop_byte += repetition_length * (repetitions - 1)
 
-        start_byte = record_length * current_position[0] + field_location
+    if stop_byte > record_matrix.shape[1]:
+        raise ValueError('Field extends beyond the end of the record ({0} bytes) to byte {1}.'
+                         .format(record_matrix.shape[1], stop_byte))
 
-        for i in range(0, len(group_locations)):
-            start_byte += group_locations[i] + repetition_lengths[i] * current_position[i + 1]
+    record_stride, byte_stride = record_matrix.strides
+    strides = (record_stride, ) + tuple(length * byte_stride for length in repetition_lengths) + (byte_stride, )
 
-        stop_byte = start_byte + field_length
-        extracted_data.append(table_byte_data[start_byte:stop_byte])
+    field_bytes = as_strided(record_matrix[:, start_byte:], shape=tuple(array_shape) + (field_length, ),
+                             strides=strides)
 
+    return np.array(field_bytes, copy=True).view(dtype).reshape(-1)
 
-def _extract_delimited_field_data(extracted_data, table_byte_data, start_bytes, current_column, array_shape):
+
+def _extract_delimited_field_data(table_byte_data, record_starts, start_bytes, stop_bytes,
+                                  current_column, array_shape):
     """
     Extracts data for a single field in a delimited table.
 
     Parameters
     ----------
-    extracted_data : list[str or bytes]
-        The extracted byte data for each element the table. Should be an empty list on initial call.
-        Modified in-place.
-    table_byte_data : array_like[str or bytes]
-        Byte data for the entire table, split into records.
-    start_bytes : array_like
-        The start byte for each element in the table. Two-dimensional, where the first dimension specifies
-        which column (if the record were split by delimiter) and the second dimension specifies which record.
+    table_byte_data : np.ndarray
+        Byte data for the entire table, as a uint8 array. See `_tokenize_delimited_records`.
+    record_starts : np.ndarray
+        The start byte of each record in *table_byte_data*.
+    start_bytes : np.ndarray
+        The start byte, relative to the start of its record, for each element in the table. Two-dimensional,
+        where the first dimension specifies which column (if the record were split by delimiter) and the
+        second dimension specifies which record.
+    stop_bytes : np.ndarray
+        The stop byte (exclusive), relative to the start of its record, for each element in the table.
+        Same dimensions as *start_bytes*.
     current_column : int
         Specifies which column (if the record were split by delimiter) to extract the data for. For fields
         that are inside GROUPs, this is the first column and columns up until the number of repetitions
@@ -323,287 +548,686 @@ def _extract_delimited_field_data(extracted_data, table_byte_data, start_bytes,
 
     Returns
     -------
-    None
+    np.ndarray
+        Flat byte string array containing the value of each element of the field, ordered by record and
+        then by repetition.
     """
 
-    num_records = array_shape[0]
-    num_group_columns = 0 if (len(array_shape) == 1) else reduce(lambda x, y: x*y, array_shape[1:]) - 1
-
-    # Extract data from GROUP fields. This can also be used for non-GROUP fields but because of the
-    # setup time for the inner loop (which would only loop once) it is approximately 25% slower than
-    # the non-GROUP version below.
-    if num_group_columns > 0:
+    num_group_columns = reduce(lambda x, y: x*y, array_shape[1:], 1)
+    last_column = current_column + num_group_columns
 
-        # Pre-extract necessary variables to speed up computation time
-        last_column = current_column + num_group_columns + 1
+    # Obtain the absolute start byte and the length of each value, ordered by record and then by column
+    value_starts = (record_starts[:, np.newaxis] +
+                    start_bytes[current_column:last_column].T.astype('int64')).reshape(-1)
+    value_lengths = (stop_bytes[current_column:last_column].T.astype('int64') -
+                     start_bytes[current_column:last_column].T).reshape(-1)
 
-        # Extract the byte data for this specific column from byte_data
-        for record_num in range(0, num_records):
+    # Gather the bytes of each value into a fixed-width byte matrix (values shorter than the longest value
+    # are padded by NULL bytes, which NumPy strips from byte strings), one byte position at a time
+    value_length = max(1, value_lengths.max()) if (len(value_lengths) > 0) else 1
+    max_byte = max(0, len(table_byte_data) - 1)
 
-            for column_num in range(current_column, last_column):
+    extracted_data = np.zeros((len(value_starts), value_length), dtype='uint8')
 
-                start_idx = start_bytes[column_num][record_num]
-                end_idx = start_bytes[column_num + 1][record_num] - 1
+    for i in range(0, value_length):
 
-                extracted_data.append(table_byte_data[record_num][start_idx:end_idx])
+        has_byte = value_lengths > i
 
-        # Remove start_bytes for no-longer needed columns to save memory
-        start_bytes[current_column:last_column] = [None] * (num_group_columns + 1)
+        if len(table_byte_data) > 0:
+            extracted_data[:, i] = table_byte_data[np.minimum(value_starts + i, max_byte)]
 
-    # Extract data from non-GROUP fields
-    else:
+        extracted_data[:, i] *= has_byte
 
-        # Pre-extract necessary variables to speed up computation time
-        field_start_bytes = start_bytes[current_column]
-        next_field_start_bytes = start_bytes[current_column + 1]
+    return extracted_data.view('S{0}'.format(value_length)).reshape(-1)
 
-        # Extract the byte data for this specific column from byte_data
-        for record_num in range(0, num_records):
-            start_idx = field_start_bytes[record_num]
-            end_idx = next_field_start_bytes[record_num] - 1
 
-            extracted_data.append(table_byte_data[record_num][start_idx:end_idx])
+def _get_delimited_record_offsets(table_byte_data, max_records, block_size=2**24):
+    """ Locate the records in the byte data of a delimited table.
 
-        # Remove start_bytes for no-longer needed columns to save memory
-        start_bytes[current_column] = None
+    Records are delimited by carriage-return line-feed, per the PDS4 Standard.
 
+    Parameters
+    ----------
+    table_byte_data : np.ndarray
+        Byte data for the table, as a uint8 array.
+    max_records : int
+        Maximum number of records to locate. Any data past the record delimiter of the last record
+        located is ignored.
+    block_size : int, optional
+        Number of bytes scanned at a time. Defaults to 16 MB.
 
-def _get_delimited_records_and_start_bytes(records, table_structure, table_manifest):
+    Returns
+    -------
+    np.ndarray, np.ndarray
+        A two-valued tuple of: the start byte of each record; and the stop byte (exclusive, and
+        excluding the record delimiter) of each record.
     """
-    For a delimited table, we obtain the start byte of each field (and each repetition of field)
-    for each record, and adjust the records themselves such that any field value starts at its start byte
-    and ends at the start byte of the next field value.
 
-    In principle there are a number of ways to read a delimited table. The built-in Python delimited table
-    reader does not support specifying line-endings as solely those allowed by PDS4. NumPy's delimited table
-    reader was found to be much slower than the technique below, though this should be retested periodically.
-    For manual reading (i.e., without using above tools), one could read a delimited table in row by row:
-    however when converting each value to a data type, there is CPU overhead in determining what that data
-    type should be and the conversion itself. If we read a row, and then convert each value for that row one
-    at a time then we have that overhead each time and that becomes extremely costly for large numbers of
-    records. If we could read an entire column at a time and convert it then we avoid said overhead. One
-    easy approach to the latter is to store a 2D array_like[record, field], thus splitting the data first
-    into records and then each record by delimiter (adjusting to account for double quote where needed).
-    However in general this approach is often very memory intensive because the strings, especially with
-    overhead, require more memory to store than once the data is converted to its desired type. Instead, we
-    take a similar approach where we use a 2D array_like[field, record] to record the start bytes of the data
-    for each field but do not actually split each record into fields. We try to use the memory efficient
-    ``array.array`` and minimal size required to store each start byte, this will nearly always result in
-    significantly less memory than would be required to actually split each field into a string since the
-    start bytes will nearly always be 1 or 2 bytes each because records are rarely longer than 65535
-    characters.
-
-    Parameters
-    ----------
-    records : list[str or bytes]
-        The data for the delimited table, split into records.
-    table_structure : TableStructure
-        The PDS4 Table data structure for the delimited table.
-    table_manifest : TableDelimitedManifest
-        A manifest describing the structure of the PDS4 delimited table.
+    record_delimiters = []
+    num_record_delimiters = 0
+
+    # Scan for the record delimiter in blocks, such that temporary arrays remain small. Each block
+    # overlaps the next by one byte, such that a record delimiter spanning two blocks is found.
+    for block_start in range(0, len(table_byte_data), block_size):
+
+        block = table_byte_data[block_start:block_start + block_size + 1]
+        is_record_delimiter = (block[:-1] == ord('\r')) & (block[1:] == ord('\n'))
+
+        record_delimiters.append(np.flatnonzero(is_record_delimiter) + block_start)
+        num_record_delimiters += len(record_delimiters[-1])
+
+        if num_record_delimiters >= max_records:
+            break
+
+    if record_delimiters:
+        record_delimiters = np.concatenate(record_delimiters)
+    else:
+        record_delimiters = np.empty(0, dtype='int64')
+
+    record_starts = np.append(0, record_delimiters + 2)[0:max_records]
+    record_stops = np.append(record_delimiters, len(table_byte_data))[0:max_records]
+
+    return record_starts.astype('int64'), record_stops.astype('int64')
+
+
+def _pair_delimited_quotes(byte_data, quotes, delimiters, field_delimiter, record_starts, record_stops):
+    """ Locate the pairs of double quotes that enclose values in a block of records in a delimited table.
+
+    A value is enclosed by double quotes if it starts with a double quote, and the value (after ignoring
+    any field delimiters) containing the next double quote in the record ends with a double quote.
+    Any field delimiters between such quotes are part of the value.
+
+    Parameters
+    ----------
+    byte_data : np.ndarray
+        Byte data for the block of records, as a uint8 array.
+    quotes : np.ndarray
+        Position of each double quote in *byte_data*, in ascending order.
+    delimiters : np.ndarray
+        Position of each field delimiter in *byte_data*, in ascending order.
+    field_delimiter : int
+        Byte value of the field delimiter.
+    record_starts : np.ndarray
+        The start byte of each record in *byte_data*.
+    record_stops : np.ndarray
+        The stop byte (exclusive) of each record in *byte_data*.
 
     Returns
     -------
-    list[str or bytes], list[array.array or list]
-        A two-valued tuple of: the records for the table, modified to remove quotes; and a 2D array_like,
-        where the first dimension is the field and the second dimension is the record, with the value being
-        the start byte of the data in the first tuple value for those parameters.
+    np.ndarray, np.ndarray
+        A two-valued tuple of: the position of each opening quote; and the position of the matching
+        closing quote.
     """
 
-    # Extract the proper record delimiter (as bytes, for compatibility with Python 3)
-    delimiter_name = table_structure.meta_data['field_delimiter'].lower()
-    field_delimiter = {'comma': b',',
-                       'horizontal tab': b'\t',
-                       'semicolon': b':',
-                       'vertical bar': b'|'
-                      }.get(delimiter_name, None)
+    num_quotes = len(quotes)
+    quote_records = np.searchsorted(record_starts, quotes, side='right') - 1
+    max_byte = len(byte_data) - 1
 
-    # Determine total number of columns (if we split the record by record delimiter) in each record.
-    # A column is either a field or if there's a GROUP then it's one of the repetitions of a field.
-    # This number, as are other references to this number in the code, are corrected for cases where
-    # we ignore the record delimiter as its effectively escaped by being between bounding double quotes.
-    num_columns = 0
+    # Quotes that are the first character of a value, and quotes that are the last character of a value
+    is_opening = (quotes == record_starts[quote_records]) | \
+                 (byte_data[np.maximum(quotes - 1, 0)] == field_delimiter)
+    is_closing = (quotes + 1 == record_stops[quote_records]) | \
+                 (byte_data[np.minimum(quotes + 1, max_byte)] == field_delimiter)
 
-    for field in table_manifest.fields():
+    # In well-formed data, each quote opening a value is immediately followed by the quote closing it
+    if num_quotes % 2 == 0:
 
-        repetitions = []
-        parent_idx = table_manifest.index(field)
+        opening_quotes = quotes[0::2]
+        closing_quotes = quotes[1::2]
 
-        for j in range(0, field.group_level):
-            parent_idx = table_manifest.get_parent_by_idx(parent_idx, return_idx=True)
-            repetitions.append(table_manifest[parent_idx]['repetitions'])
+        if is_opening[0::2].all() and is_closing[1::2].all() and \
+                (quote_records[0::2] == quote_records[1::2]).all():
+            return opening_quotes, closing_quotes
 
-        num_columns += 1 if (not repetitions) else reduce(lambda x, y: x*y, repetitions)
+    # Otherwise (e.g. quotes inside a quoted value), pair the quotes one at a time
+    opening_quotes = []
+    closing_quotes = []
+    i = 0
 
-    # Pre-allocate ``list``, which will store either ``array.array``s or other ``list``s that contain the
-    # start byte of each field for each record. Thus `start_bytes` is a two-dimensional array_like, where
-    # the first dimension is the field and the second dimension is the record, with the value being the
-    # start byte of the data for those parameters.
-    start_bytes = [None] * (num_columns + 1)
+    while i < num_quotes - 1:
 
-    longest_record = len(max(records, key=len))
-    array_dtype = get_min_integer_numpy_type([longest_record + 1])
+        record_num = quote_records[i]
 
-    for i in range(0, num_columns + 1):
-        start_bytes[i] = np.empty(len(records), dtype=array_dtype)
+        if is_opening[i] and (quote_records[i + 1] == record_num):
 
-    # In Python 3, when checking for the first and last character below, we need to convert the value
-    # to a ``str``, since obtaining first character of a ``bytes`` returns a byte value. In Python 2, no
-    # action needs to be taken since the value is ``str`` by default.
-    if six.PY2:
-        str_args = ()
-    else:
-        str_args = ('utf-8', )
+            # Find the end of the value (as split by field delimiter) containing the next quote
+            delimiter_idx = np.searchsorted(delimiters, quotes[i + 1])
 
-    # Obtain start bytes for each field in each record, and adjust the record itself such that only the
-    # start byte is required to obtain the entire value (to save RAM). The latter is needed due to the
-    # requirement to ignore delimiters found inside enclosing quotes and that such enclosing quotes themselves
-    # are not part of the value: i.e., a record consisting of '"value1", value2' would want to use the start
-    # byte of 'value2' as the end byte of '"value1"', but this would include the extra quote at the end,
-    # therefore we remove such quotes after recording the proper start byte.
-    for record_idx, record in enumerate(records):
+            if (delimiter_idx < len(delimiters)) and (delimiters[delimiter_idx] < record_stops[record_num]):
+                value_stop = delimiters[delimiter_idx]
+            else:
+                value_stop = record_stops[record_num]
 
-        # Split the record by delimiter
-        split_record = record.split(field_delimiter)
-        next_start_byte = 0
+            # Enclosed by quotes if said value ends in a quote
+            if byte_data[value_stop - 1] == ord('"'):
+                opening_quotes.append(quotes[i])
+                closing_quotes.append(value_stop - 1)
 
-        # Look for field values bounded by a double quotes. Inside such values any delimiter found should be
-        # ignored, but ``split`` above will not ignore it. Therefore we have to join the value back.
-        if b'"' in record:
+                i = np.searchsorted(quotes, value_stop)
+                continue
 
-            split_record_len = len(split_record)
-            field_idx = 0
+        i += 1
 
-            # Loop over each field value (may turn out to only be part of a field)
-            while field_idx < split_record_len:
-                value = split_record[field_idx]
-                value_length = len(value)
-                first_character = str(value, *str_args)[0] if value_length > 0 else None
+    return np.asarray(opening_quotes, dtype='int64'), np.asarray(closing_quotes, dtype='int64')
 
-                # If field value starts with a quote then we need to check if there is a matching closing
-                # quote somewhere further.
-                if first_character == '"':
 
-                    next_quote_idx = -1
+def _tokenize_delimited_block(byte_data, record_starts, record_stops, field_delimiter, num_columns):
+    """ Obtain the start and stop byte of each value in a block of records in a delimited table.
 
-                    # Find the index of the field value containing the next quote in the record
-                    if b'"' in value[1:]:
-                        next_quote_idx = field_idx
+    Parameters
+    ----------
+    byte_data : np.ndarray
+        Byte data for the block of records, as a uint8 array.
+    record_starts : np.ndarray
+        The start byte of each record in *byte_data*.
+    record_stops : np.ndarray
+        The stop byte (exclusive) of each record in *byte_data*.
+    field_delimiter : int
+        Byte value of the field delimiter.
+    num_columns : int
+        Number of columns (if the record were split by delimiter), from the start of each record, to
+        obtain start and stop bytes for.
 
-                    else:
+    Returns
+    -------
+    np.ndarray, np.ndarray
+        A two-valued tuple of: the start byte, and the stop byte (exclusive) of each value in *byte_data*.
+        Both are two-dimensional, with the first dimension the column and the second dimension the record.
+        Values enclosed by double quotes exclude said quotes.
+    """
 
-                        for k, next_value in enumerate(split_record[field_idx + 1:]):
-                            if b'"' in next_value:
-                                next_quote_idx = field_idx + 1 + k
-                                break
+    num_records = len(record_starts)
 
-                    # If a latter or same field value contained a quote, check whether it was the last
-                    # character in the value (and thus the two quotes enclosed a single value)
-                    if next_quote_idx >= 0:
-                        next_value = split_record[next_quote_idx]
-                        last_character = str(next_value, *str_args)[-1] if len(next_value) > 0 else None
+    delimiters = np.flatnonzero(byte_data == field_delimiter)
+    quotes = np.flatnonzero(byte_data == ord('"'))
 
-                        if last_character == '"':
+    opening_quotes = closing_quotes = np.empty(0, dtype='int64')
 
-                            # Reconstruct the original value prior to ``split``
-                            original_value = field_delimiter.join(split_record[field_idx:next_quote_idx+1])
+    # Ignore field delimiters enclosed by double quotes
+    if len(quotes) > 0:
 
-                            # Remove the quote at the start and end of the original value
-                            original_value = original_value[1:-1]
+        opening_quotes, closing_quotes = _pair_delimited_quotes(byte_data, quotes, delimiters, field_delimiter,
+                                                                record_starts, record_stops)
 
-                            # Insert the joined value back into split_record (and remove its split components)
-                            split_record = split_record[0:field_idx] + [original_value] + \
-                                           split_record[next_quote_idx+1:]
+        if len(opening_quotes) > 0:
+            quote_idx = np.searchsorted(opening_quotes, delimiters, side='right') - 1
+            is_quoted = (quote_idx >= 0) & (delimiters < closing_quotes[np.maximum(quote_idx, 0)])
+            delimiters = delimiters[~is_quoted]
 
-                            # We've joined several values into one, therefore split_record_len has shrunk
-                            split_record_len -= next_quote_idx - field_idx
+    # Determine the record and the column that each field delimiter ends
+    delimiter_records = np.searchsorted(record_starts, delimiters, side='right') - 1
+    first_record_delimiter = np.searchsorted(delimiter_records, np.arange(num_records))
+    delimiter_columns = np.arange(len(delimiters)) - first_record_delimiter[delimiter_records]
 
-                            # Record the start byte of this field, and adjust the next start byte to account
-                            # for the entire length of the joined field
-                            start_bytes[field_idx][record_idx] = next_start_byte
-                            next_start_byte += len(original_value) + 1
+    is_required = delimiter_columns < num_columns
+    delimiters = delimiters[is_required]
+    delimiter_records = delimiter_records[is_required]
+    delimiter_columns = delimiter_columns[is_required]
 
-                            field_idx += 1
-                            continue
+    # Values start after the previous field delimiter and stop at the next one. Values missing from
+    # a record (because the record has too few field delimiters) are empty.
+    start_bytes = np.empty((num_columns, num_records), dtype='int64')
+    stop_bytes = np.empty((num_columns, num_records), dtype='int64')
 
-                # If the record had a quote somewhere but not in this field or it was not an enclosing quote
-                # for the field then we simply record its start byte and set the next start byte as usual
-                start_bytes[field_idx][record_idx] = next_start_byte
-                next_start_byte += value_length + 1
+    start_bytes[:] = record_stops
+    stop_bytes[:] = record_stops
 
-                field_idx += 1
+    if num_columns > 0:
+        start_bytes[0] = record_starts
 
-            # Join (the potentially) adjusted record back into a single string to save ``str`` overhead memory
-            records[record_idx] = field_delimiter.join(split_record)
+    stop_bytes[delimiter_columns, delimiter_records] = delimiters
 
-        # If there were no quotes in the record then we can simply record the start bytes of each value
-        # (surprisingly splitting the record and doing this via length of each value appears to be the
-        # fastest way to accomplish this since ``str.split`` is written in C.)
-        else:
+    has_next_column = delimiter_columns + 1 < num_columns
+    start_bytes[delimiter_columns[has_next_column] + 1,
+                delimiter_records[has_next_column]] = delimiters[has_next_column] + 1
 
-            for field_idx, value in enumerate(split_record):
-                start_bytes[field_idx][record_idx] = next_start_byte
-                next_start_byte += len(value) + 1
+    # Exclude the enclosing quotes of values enclosed by double quotes
+    if len(opening_quotes) > 0:
 
-        # Add an extra start byte, which actually acts only as the end byte for the last field
-        start_bytes[-1][record_idx] = next_start_byte
+        quote_idx = np.minimum(np.searchsorted(opening_quotes, start_bytes), len(opening_quotes) - 1)
+        is_quoted = (opening_quotes[quote_idx] == start_bytes) & (closing_quotes[quote_idx] == stop_bytes - 1)
 
-    return records, start_bytes
+        start_bytes += is_quoted
+        stop_bytes -= is_quoted
 
+    return start_bytes, stop_bytes
 
-def new_table(fields, no_scale=False, decode_strings=False, masked=None, copy=True, **structure_kwargs):
-    """ Create a `TableStructure` from PDS-compliant data or meta data.
 
-    Notes
-    -----
-    The data attribute will not be a view of the original *fields* (if they are data arrays), but rather
-    a new array. However, the *fields* passed into this method may still be modified in-place to save
-    memory, see *copy*. If *fields* originated from a single structured ndarray, then a method to get
-    a view of the original data, if conditions are satisfied, is to also pass that single structured
-    ndarray as a kwarg of the name``structure_data``.
+def _tokenize_delimited_records(table_byte_data, table_structure, num_columns, block_size=2**24):
+    """
+    For a delimited table, we obtain the start and stop byte of each field (and each repetition of field)
+    for each record.
+
+    In principle there are a number of ways to read a delimited table. The built-in Python delimited table
+    reader does not support specifying line-endings as solely those allowed by PDS4, nor does it provide
+    the location of each value. If we read a row, and then convert each value for that row one at a time
+    then we have the overhead of determining the data type and converting each value, which becomes
+    extremely costly for large numbers of records. If we could read an entire column at a time and convert
+    it then we avoid said overhead. Splitting each record into a string for each value, however, is both
+    slow and memory intensive. Instead, we scan the byte data for record delimiters, field delimiters and
+    double quotes using NumPy, and record only the start and stop byte of each value (relative to its
+    record, such that the minimal integer type can nearly always be 1 or 2 bytes each). Each column can
+    then be extracted and converted at once via `_extract_delimited_field_data`.
 
     Parameters
     ----------
-    fields : list[PDS_ndarray, PDS_marray or Meta_Field]
-        A list of either fields with data, which each must contain a valid PDS4 meta_data attribute
-        defining the field, or a list of valid Meta_Field's. If input is data, the base data type will
-        be taken from its actual dtype, rather than from the meta data it must still contain.
-    no_scale : bool, optional
-        If True, and input is a list of fields with data, then the data will scaled according to the
-        scaling_factor and value_offset meta data. If the *fields* is meta data only, then the output
-        data type will be large enough to store the scaled values. If False, no scaling or data type
-        conversions will be done. Defaults to False.
-    decode_strings : bool, optional
-        If True, then fields containing character byte data will be converted to a dtype of unicode.
-        If False, then for character data the obtained dtype will remain byte strings. Defaults to
-        False.
-    masked : bool or None, optional
-        If True, and input is a list of fields with data, then the data will retain any masked values and
-        in additional have numeric Special_Constants values masked. If False, any masked values in the
-        input fields will be unmasked and data assignments will not preserve masked values. If None,
-        masked values in the input will be retained only if any are present. Defaults to None.
-    copy: bool, optional
-        If True, a copy of *fields* is made, ensuring that they do not get modified during processing.
-        If False, then the fields may change if each is an array of data. In either case, the output data
-        will not be a view. Defaults to True.
-    structure_kwargs : dict, optional
-        Keywords that are passed directly to the `TableStructure` constructor.
+    table_byte_data : str, bytes or np.ndarray
+        The byte data for the delimited table, with each record terminated by the record delimiter.
+    table_structure : TableStructure
+        The PDS4 Table data structure for the delimited table.
+    num_columns : int
+        Number of columns (if the record were split by delimiter), from the start of each record, to
+        obtain start bytes for. A column is either a field or, if there's a GROUP, one of the repetitions
+        of a field. Any further columns are not split.
+    block_size : int, optional
+        Approximate number of bytes tokenized at a time. Defaults to 16 MB.
 
     Returns
     -------
-    TableStructure
-        An object representing the PDS4 table structure. The data will contain a structured array that
-        can store values for *fields* (or does store it, if input is a list of fields with data). Other
-        attributes may be specified via *structure_kwargs*.
+    np.ndarray, np.ndarray, np.ndarray, np.ndarray
+        A four-valued tuple of: *table_byte_data* as a uint8 array; the start byte of each record;
+        and the start byte and the stop byte (exclusive) of each value relative to the start of its record.
+        The latter two are two-dimensional, with the first dimension the column and the second dimension
+        the record. Values enclosed by double quotes exclude said quotes. At most the number of records
+        in the label are tokenized.
     """
 
-    # For each field in the record array, create the dtype needed to initialize it. For each said field,
-    # this will be either a two valued tuple (unique_field_name, numpy_dtype) or a three valued tuple, with
-    # the third value being the shape when the data for that field is non-flat (e.g. for group fields).
-    dtypes = []
-    array_shapes = []
-
-    # Determine and validate that input is a sequence of all Meta_Field, PDS_ndarray or PDS_marray
+    # Extract the proper field delimiter
+    delimiter_name = table_structure.meta_data['field_delimiter'].lower()
+    field_delimiter = {'comma': b',',
+                       'horizontal tab': b'\t',
+                       'semicolon': b';',
+                       'vertical bar': b'|'
+                      }.get(delimiter_name, None)
+
+    if field_delimiter is None:
+        raise ValueError('Unknown field delimiter: {0}'.format(delimiter_name))
+
+    if not isinstance(table_byte_data, np.ndarray):
+        table_byte_data = np.frombuffer(table_byte_data, dtype='uint8')
+
+    # Locate each record
+    record_starts, record_stops = _get_delimited_record_offsets(table_byte_data,
+                                                                table_structure.meta_data['records'])
+    num_records = len(record_starts)
+
+    # Store start and stop bytes in the smallest integer type that can hold the longest record
+    longest_record = (record_stops - record_starts).max() if (num_records > 0) else 0
+    array_dtype = get_min_integer_numpy_type([longest_record + 1])
+
+    start_bytes = np.empty((num_columns, num_records), dtype=array_dtype)
+    stop_bytes = np.empty((num_columns, num_records), dtype=array_dtype)
+
+    # Tokenize the records in blocks, such that temporary arrays remain small
+    block_record_idxs = np.searchsorted(record_starts, np.arange(0, len(table_byte_data), block_size))
+    block_record_idxs = np.unique(np.concatenate(([0], block_record_idxs, [num_records])))
+
+    for block_start, block_stop in zip(block_record_idxs[:-1], block_record_idxs[1:]):
+
+        byte_offset = record_starts[block_start]
+        byte_data = table_byte_data[byte_offset:record_stops[block_stop - 1]]
+
+        block_starts, block_stops = _tokenize_delimited_block(byte_data,
+                                                              record_starts[block_start:block_stop] - byte_offset,
+                                                              record_stops[block_start:block_stop] - byte_offset,
+                                                              ord(field_delimiter), num_columns)
+
+        relative_offset = record_starts[block_start:block_stop] - byte_offset
+        start_bytes[:, block_start:block_stop] = block_starts - relative_offset
+        stop_bytes[:, block_start:block_stop] = block_stops - relative_offset
+
+    return table_byte_data, record_starts, start_bytes, stop_bytes
+
+
+def _get_binary_record_dtype(table_structure, table_manifest, no_scale, fields=None):
+    """ Obtain a structured dtype describing an entire record of a Table_Binary, if possible.
+
+    Such a dtype exists when every (requested) field in the table is a fixed-size binary numeric type
+    (i.e., its value can be used exactly as stored), all fields inside groups are contiguous, and there
+    are no Uniformly_Sampled fields. Additionally, unless *no_scale* is set, no field may have a
+    scaling_factor or value_offset, since applying these may require changing the data type.
+
+    Parameters
+    ----------
+    table_structure : TableStructure
+        The PDS4 Table data structure to obtain the record dtype for.
+    table_manifest : TableManifest
+        A manifest describing the structure of the PDS4 table.
+    no_scale : bool
+        If True, data will not be adjusted according to the offset and scaling factor.
+    fields : list[Meta_Field], optional
+        If given, the dtype will describe only these fields (which must be from *table_manifest*).
+        Defaults to all fields.
+
+    Returns
+    -------
+    np.dtype or None
+        A structured dtype, with itemsize equal to the record length and the offsets of each field
+        set to its location inside the record. None if the table cannot be described by such a dtype.
+    """
+
+    if table_structure.type != 'Table_Binary':
+        return None
+
+    if fields is None:
+        fields = table_manifest.fields()
+
+    names = []
+    formats = []
+    offsets = []
+
+    for field in fields:
+
+        if field in table_manifest.uniformly_sampled_fields():
+            return None
+
+        data_type = field['data_type']
+        array_shape = field.shape
+
+        # Only binary numeric fields can be viewed directly (e.g. ASCII and bit strings need conversion)
+        if (data_type not in PDS_NUMERIC_TYPES) or ('ASCII' in data_type):
+            return None
+
+        dtype = pds_to_numpy_type(data_type)
+        if dtype.itemsize != field['length']:
+            return None
+
+        # Scaling may require a larger data type, and thus a copy
+        if (not no_scale) and ((field.get('scaling_factor') is not None) or
+                               (field.get('value_offset') is not None)):
+            return None
+
+        group_locations, repetition_lengths = _get_group_locations(table_manifest, field)
+        if not _has_contiguous_repetitions(field['length'], array_shape, group_locations, repetition_lengths):
+            return None
+
+        names.append(pds_to_numpy_name(field.full_name()))
+        formats.append((dtype, tuple(array_shape[1:])) if array_shape[1:] else dtype)
+        offsets.append(sum(group_locations) + field['location'] - 1)
+
+    if not names:
+        return None
+
+    return np.dtype({str('names'): names, str('formats'): formats, str('offsets'): offsets,
+                     str('itemsize'): table_structure.meta_data.record['record_length']})
+
+
+def _memmap_table_records(table_structure, dtype='uint8'):
+    """ Memory map the records of a fixed-width (Character or Binary) table.
+
+    Parameters
+    ----------
+    table_structure : TableStructure
+        The PDS4 Table data structure for which the records are to be memory mapped.
+    dtype : str, unicode or np.dtype, optional
+        If 'uint8', each row of the memory map will contain the bytes of a single record. Otherwise,
+        a structured dtype describing each record (see `_get_binary_record_dtype`). Defaults to 'uint8'.
+
+    Returns
+    -------
+    np.memmap
+        A read-only memory map of the records in the table. Its first dimension is the record number.
+    """
+
+    data_filename = table_structure.parent_filename
+    meta_data = table_structure.meta_data
+
+    num_records = meta_data['records']
+    record_length = meta_data.record['record_length']
+
+    if dtype == 'uint8':
+        shape = (num_records, record_length)
+    else:
+        shape = (num_records, )
+
+    try:
+        return np.memmap(data_filename, dtype=dtype, mode='r', offset=meta_data['offset'], shape=shape)
+
+    except (IOError, ValueError) as e:
+        raise six.raise_from(IOError("Unable to read data from file '" + data_filename +
+                                     "' found in label - {0}".format(e)), None)
+
+
+def _read_binary_table_records(table_structure, table_manifest, record_dtype, fields=None):
+    """ Read the data for a Table_Binary directly into a structured array.
+
+    When all fields are requested, the data is read from the file in a single operation into its final
+    buffer, with each record described by *record_dtype*. Otherwise, the requested fields are copied
+    from a memory map of the records into a packed array. In either case, no per-field extraction or
+    conversion is done.
+
+    Parameters
+    ----------
+    table_structure : TableStructure
+        The PDS4 Table data structure for which the data is to be read.
+    table_manifest : TableManifest
+        A manifest describing the structure of the PDS4 table.
+    record_dtype : np.dtype
+        A structured dtype describing each record in the table. See `_get_binary_record_dtype`.
+    fields : list[Meta_Field], optional
+        If given, only these fields (which must be those described by *record_dtype*) are read.
+        Defaults to all fields.
+
+    Returns
+    -------
+    PDS_ndarray
+        A structured array containing the data for all (requested) fields in the table.
+
+    Raises
+    ------
+    ValueError
+        Raised if the data file is too short to contain all records.
+    """
+
+    data_filename = table_structure.parent_filename
+    num_records = table_structure.meta_data['records']
+    start_byte = table_structure.meta_data['offset']
+
+    # Read all fields
+    if fields is None:
+
+        fields = table_manifest.fields()
+        byte_data = table_structure._byte_data
+
+        # Use byte data read-in together with that of other structures, if available. No other structure
+        # holds the same bytes (see `_read_block_byte_data`), therefore the data is a view of it.
+        if byte_data is not None:
+            num_records_read = min(num_records, byte_data.size // record_dtype.itemsize)
+            data = byte_data[0:num_records_read * record_dtype.itemsize].view(record_dtype)
+
+        else:
+
+            try:
+
+                with open(data_filename, 'rb') as file_handler:
+                    file_handler.seek(start_byte)
+
+                    data = np.fromfile(file_handler, dtype=record_dtype, count=num_records)
+
+            except IOError as e:
+                raise six.raise_from(IOError("Unable to read data from file '" + data_filename +
+                                             "' found in label - {0}".format(e)), None)
+
+        if len(data) < num_records:
+            raise ValueError('Table data is shorter ({0} bytes) than expected from its label ({1} bytes).'
+                             .format(len(data) * record_dtype.itemsize, num_records * record_dtype.itemsize))
+
+    # Read only the requested fields
+    else:
+        data = _pack_records(_memmap_table_records(table_structure, dtype=record_dtype))
+
+    return _make_record_table(data, fields)
+
+
+def _pack_records(records):
+    """ Copy records described by a structured dtype into an array having no unused bytes.
+
+    Parameters
+    ----------
+    records : np.ndarray
+        A structured array, whose dtype may have an itemsize larger than the sum of its fields
+        (e.g., a record dtype describing only some fields in a record).
+
+    Returns
+    -------
+    np.ndarray
+        A copy of *records*, having a dtype with the same fields but without any unused bytes.
+    """
+
+    data = np.empty(len(records), dtype=[(name, records.dtype.fields[name][0])
+                                         for name in records.dtype.names])
+
+    for name in records.dtype.names:
+        data[name] = records[name]
+
+    return data
+
+
+def _make_record_table(records, fields):
+    """ Create the data for a table from records described by a structured dtype.
+
+    Parameters
+    ----------
+    records : np.ndarray
+        A structured array, containing the data for *fields*. See `_get_binary_record_dtype`.
+    fields : list[Meta_Field]
+        The meta data for each field in *records*. The shape of each is adjusted in-place to match
+        the number of records.
+
+    Returns
+    -------
+    PDS_ndarray
+        A structured array containing the data for all fields in *records*.
+    """
+
+    data = records.view(np.recarray).view(PDS_array.get_array(masked=False))
+
+    for field in fields:
+        field.shape = (len(records), ) + tuple(field.shape[1:])
+        data.meta_data[pds_to_numpy_name(field.full_name())] = field
+
+    return data
+
+
+def _convert_table_to_native_byteorder(data):
+    """ Convert the data of a table to native byte order, byteswapping it in-place.
+
+    Parameters
+    ----------
+    data : PDS_ndarray or PDS_marray
+        A structured array containing the data for the fields of a table. The ``original_byteorder``
+        attribute of the meta data of each field that is converted is set to its original byte order.
+
+    Returns
+    -------
+    PDS_ndarray or PDS_marray
+        A view of *data*, with all fields in native byte order.
+    """
+
+    for name in data.dtype.names:
+
+        dtype = data.dtype.fields[name][0].base
+
+        if not dtype.isnative:
+            data.meta_data[name].original_byteorder = dtype.byteorder
+
+    return convert_to_native_byteorder(data)
+
+
+def _get_fields_by_name(table_manifest, keys):
+    """ Obtain the fields in a table matching the given field names.
+
+    Parameters
+    ----------
+    table_manifest : TableManifest
+        A manifest describing the structure of the PDS4 table.
+    keys : str, unicode or list[str or unicode]
+        Names of the fields. Each name may be either the full name of a field (see `Meta_Field.full_name`)
+        or its name; in the latter case, the first field having that name is matched.
+
+    Returns
+    -------
+    list[Meta_Field]
+        The matched fields, in the order they appear in *table_manifest*.
+
+    Raises
+    ------
+    ValueError
+        Raised if any of *keys* does not match a field in the table.
+    """
+
+    if isinstance(keys, six.string_types):
+        keys = [keys]
+
+    fields = table_manifest.fields()
+    matched_fields = set()
+
+    for key in keys:
+
+        matches = [field for field in fields if field.full_name() == key] or \
+                  [field for field in fields if field['name'] == key]
+
+        if not matches:
+            raise ValueError("Field '{0}' not found.".format(key))
+
+        matched_fields.add(id(matches[0]))
+
+    return [field for field in fields if id(field) in matched_fields]
+
+
+def new_table(fields, no_scale=False, decode_strings=False, masked=None, copy=True, **structure_kwargs):
+    """ Create a `TableStructure` from PDS-compliant data or meta data.
+
+    Notes
+    -----
+    The data attribute will not be a view of the original *fields* (if they are data arrays), but rather
+    a new array. However, the *fields* passed into this method may still be modified in-place to save
+    memory, see *copy*. If *fields* originated from a single structured ndarray, then a method to get
+    a view of the original data, if conditions are satisfied, is to also pass that single structured
+    ndarray as a kwarg of the name``structure_data``.
+
+    Parameters
+    ----------
+    fields : list[PDS_ndarray, PDS_marray or Meta_Field]
+        A list of either fields with data, which each must contain a valid PDS4 meta_data attribute
+        defining the field, or a list of valid Meta_Field's. If input is data, the base data type will
+        be taken from its actual dtype, rather than from the meta data it must still contain.
+    no_scale : bool, optional
+        If True, and input is a list of fields with data, then the data will scaled according to the
+        scaling_factor and value_offset meta data. If the *fields* is meta data only, then the output
+        data type will be large enough to store the scaled values. If False, no scaling or data type
+        conversions will be done. Defaults to False.
+    decode_strings : bool, optional
+        If True, then fields containing character byte data will be converted to a dtype of unicode.
+        If False, then for character data the obtained dtype will remain byte strings. Defaults to
+        False.
+    masked : bool or None, optional
+        If True, and input is a list of fields with data, then the data will retain any masked values and
+        in additional have numeric Special_Constants values masked. If False, any masked values in the
+        input fields will be unmasked and data assignments will not preserve masked values. If None,
+        masked values in the input will be retained only if any are present. Defaults to None.
+    copy: bool, optional
+        If True, a copy of *fields* is made, ensuring that they do not get modified during processing.
+        If False, then the fields may change if each is an array of data. In either case, the output data
+        will not be a view. Defaults to True.
+    structure_kwargs : dict, optional
+        Keywords that are passed directly to the `TableStructure` constructor.
+
+    Returns
+    -------
+    TableStructure
+        An object representing the PDS4 table structure. The data will contain a structured array that
+        can store values for *fields* (or does store it, if input is a list of fields with data). Other
+        attributes may be specified via *structure_kwargs*.
+    """
+
+    # For each field in the record array, create the dtype needed to initialize it. For each said field,
+    # this will be either a two valued tuple (unique_field_name, numpy_dtype) or a three valued tuple, with
+    # the third value being the shape when the data for that field is non-flat (e.g. for group fields).
+    dtypes = []
+    array_shapes = []
+
+    # Determine and validate that input is a sequence of all Meta_Field, PDS_ndarray or PDS_marray
     input_is_fields = all([PDS_array.isinstance(field) for field in fields])
     input_is_meta_fields = all([isinstance(field, Meta_Field) for field in fields])
 
@@ -748,7 +1372,8 @@ def table_data_size_check(table_structure, quiet=False):
     if num_elements > num_elements_warn:
 
         if not quiet:
-            logger.info("{0} contains a large amount of data. Loading data may take a while..."
+            logger.info("{0} contains a large amount of data. Loading data may take a while... "
+                        "(to limit memory usage, use its 'section' or 'iter_chunks' instead)"
                         .format(table_structure.id))
 
         return True
@@ -756,63 +1381,86 @@ def table_data_size_check(table_structure, quiet=False):
     return False
 
 
-def read_table_data(table_structure, no_scale, decode_strings):
-    """
-    Reads and properly formats the data for a single PDS4 table structure, modifies *table_structure* to
-    contain all extracted fields for said table.
+def _extract_table_fields(table_structure, table_manifest, records, record_idx=None, fields=None):
+    """ Extract and convert the data for each field in a table from its records.
+
+    No post-processing is done (for example, no scaling and no conversion to unicode), see `new_table`.
 
     Parameters
     ----------
     table_structure : TableStructure
-        The PDS4 Table data structure to which the table's data fields should be added.  Should have been
-        initialized via `TableStructure.from_file` method.
-    no_scale : bool
-        Returned data will not be adjusted according to the offset and scaling factor.
-    decode_strings : bool
-        If True, character data types contained in the returned data will be decoded to the ``unicode`` type
-        in Python 2, and to the ``str`` type in Python 3. If False, leaves character types as byte strings.
+        The PDS4 Table data structure that the *records* belong to.
+    table_manifest : TableManifest
+        A manifest describing the structure of the PDS4 table. The shape of each field will be
+        adjusted in-place to match the number of *records*.
+    records : np.ndarray, str or bytes
+        For fixed-width tables, a uint8 array of shape (num_records, record_length), see
+        `_make_record_matrix`. For delimited tables, the byte data of the records, with each record
+        terminated by the record delimiter (see `_tokenize_delimited_records`).
+    record_idx : array_like[int], optional
+        If *records* are only a portion of the table, the record number (in the entire table) of each
+        record. Used to obtain the data for Uniformly_Sampled fields. Defaults to all records.
+    fields : list[Meta_Field], optional
+        If given, only these fields (which must be from *table_manifest*) are extracted. Defaults to all
+        fields.
 
     Returns
     -------
-    None
+    list[PDS_ndarray or PDS_marray]
+        The extracted data for each field, cast to its initial data type.
     """
 
-    # Provide a warning to the user if the data is large and may take a while to read
-    table_data_size_check(table_structure)
-
-    # Obtain the byte data of the table
-    table_byte_data = _read_table_byte_data(table_structure)
-
-    # Obtain a manifest for the table, which describes the table structure (the fields and groups)
-    table_manifest = TableManifest.from_label(table_structure.label)
-
-    # Extract the number of records
-    num_records = table_structure.meta_data['records']
-
     # Stores the initial non-post-processed version of fields
     extracted_fields = []
 
+    # Determine which fields to extract
+    if fields is None:
+        fields = table_manifest.fields()
+
+    selected_fields = set([id(field) for field in fields])
+
     # Special processing for delimited tables
     if table_structure.meta_data.is_delimited():
 
-        # Split the byte data into records
-        table_byte_data = table_byte_data.split(b'\r\n')[0:num_records]
+        # Determine the number of columns (if we split the record by delimiter), from the start of the
+        # record, that contain the requested fields. A column is either a field or, if there's a GROUP,
+        # one of the repetitions of a field.
+        num_columns = 0
+        num_required_columns = 0
 
-        # Obtain adjusted records (to remove quotes) and start bytes (2D array_like, with first dimension
-        # the field number and the second dimension the record number, and the value set to the start byte
-        # of the data for those parameters).
-        table_byte_data, start_bytes = _get_delimited_records_and_start_bytes(table_byte_data,
-                                                                              table_structure, table_manifest)
+        for field in table_manifest.fields(skip_uniformly_sampled=True):
+            num_columns += reduce(lambda x, y: x*y, field.shape[1:], 1)
+
+            if id(field) in selected_fields:
+                num_required_columns = num_columns
+
+        # Obtain the start and stop bytes (2D arrays, with first dimension the column and the second dimension
+        # the record number, and the value set to the start or stop byte of the data for those parameters).
+        records, record_starts, start_bytes, stop_bytes = _tokenize_delimited_records(records, table_structure,
+                                                                                      num_required_columns)
+        num_records = len(record_starts)
 
         # For delimited data, we can split each record by the delimiter. In the loop over fields below,
         # this number represents which column of `start_bytes` has the data for the field being looped over.
         # In tables without GROUP fields, this is equivalent to the field number.
         current_column = 0
 
+    else:
+        num_records = len(records)
+
+    # Adjust the shape of each field for the number of records being extracted (which may be only a
+    # portion of the table)
+    for field in table_manifest.fields():
+        field.shape = (num_records, ) + tuple(field.shape[1:])
+
     # Create data for the Uniformly Sampled fields
     for field in table_manifest.uniformly_sampled_fields():
 
-        created_data = _make_uniformly_sampled_field(table_structure, field)
+        if id(field) not in selected_fields:
+            continue
+
+        created_data = _make_uniformly_sampled_field(table_structure, field, record_idx=record_idx)
+
         extracted_fields.append(PDS_array(created_data, field))
 
     # For each regular field, do initial read-in from byte data and conversion to its actual data type. No
@@ -822,42 +1470,35 @@ def read_table_data(table_structure, no_scale, decode_strings):
         # Stores the shape that that the data for this field will take-on
         array_shape = field.shape
 
-        # Create flat list that will contain the (flat) data for this Field
-        extracted_data = []
+        # Skip fields that were not requested (for delimited tables, skipping their columns)
+        if id(field) not in selected_fields:
+
+            if table_structure.meta_data.is_delimited():
+                current_column += reduce(lambda x, y: x*y, array_shape[1:], 1)
+
+            continue
 
         # Extract the byte data for the field (delimited tables)
         if table_structure.meta_data.is_delimited():
 
-            # Determine number of repetitions there are (each of these is effectively a column in the record)
-            num_group_columns = 0
-            if len(array_shape) > 1:
-                num_group_columns = reduce(lambda x, y: x*y, array_shape[1:]) - 1
-
             # Extract data for the current field
-            _extract_delimited_field_data(extracted_data, table_byte_data,
-                                          start_bytes, current_column, array_shape)
+            extracted_data = _extract_delimited_field_data(records, record_starts, start_bytes, stop_bytes,
+                                                           current_column, array_shape)
 
-            current_column += 1 + num_group_columns
+            # Each repetition is effectively a column in the record
+            current_column += reduce(lambda x, y: x*y, array_shape[1:], 1)
 
         # Extract the byte data for the field (fixed-width tables)
         else:
 
-            # Store the group_location and the group_length divided by the number of repetitions for each
-            # group the field is inside of (added in for loop below)
-            group_locations = []
-            repetition_lengths = []
-
-            parent_idx = table_manifest.index(field)
-            for parent_group in table_manifest.get_parents_by_idx(parent_idx):
-                group_locations.insert(0, parent_group['location'] - 1)
-                repetition_lengths.insert(0, parent_group['length'] // parent_group['repetitions'])
-
-            record_length = table_structure.meta_data.record['record_length']
+            # Obtain the group_location and the group_length divided by the number of repetitions for each
+            # group the field is inside of
+            group_locations, repetition_lengths = _get_group_locations(table_manifest, field)
 
             # Extract data for the current field
-            _extract_fixed_width_field_data(extracted_data, table_byte_data, field['length'],
-                                            field['location'] - 1, record_length,
-                                            array_shape, group_locations, repetition_lengths)
+            extracted_data = _extract_fixed_width_field_data(records, field['length'],
+                                                             field['location'] - 1, array_shape,
+                                                             group_locations, repetition_lengths)
 
         # Cast the byte data for this field into the appropriate data type
         try:
@@ -885,16 +1526,941 @@ def read_table_data(table_structure, no_scale, decode_strings):
         # (cast to its initial data type but without any scaling or other adjustments)
         extracted_fields.append(PDS_array(extracted_data, field))
 
-    # Delete table byte data to save RAM now that it is no longer needed (all fields have been extracted)
-    del table_byte_data
+    return extracted_fields
 
-    # Finish processing (scale and decoding), create the table's structured data array and set fields
-    table_structure.data = new_table(extracted_fields, no_scale=no_scale, decode_strings=decode_strings,
-                                     masked=None, copy=False).data
+
+def _init_delimited_worker(data_filename, meta_data, regular_fields, field_idx):
+    """ Initializes a worker process of `_extract_delimited_fields_parallel`.
+
+    The table is described to each worker only once, and only by the meta data it needs to extract the
+    fields (rather than by its label, which is considerably larger).
+
+    Parameters
+    ----------
+    data_filename : str or unicode
+        Filename of the data file containing the table.
+    meta_data : Meta_TableStructure
+        Meta data of the table structure.
+    regular_fields : list[Meta_Field]
+        Meta data of the fields in the table, excluding Uniformly_Sampled fields.
+    field_idx : list[int]
+        Indexes (in *regular_fields*) of the fields to extract.
+
+    Returns
+    -------
+    None
+    """
+
+    global _delimited_worker_table
+
+    table_structure = TableStructure(structure_meta_data=meta_data, parent_filename=data_filename)
+    table_manifest = TableManifest(items=regular_fields, table_type='Delimited')
+
+    _delimited_worker_table = (table_structure, table_manifest, [regular_fields[i] for i in field_idx])
+
+
+def _extract_delimited_chunk_fields(byte_range):
+    """ Extract and convert the data for the requested fields from a chunk of a delimited table's records.
+
+    Used as the worker of the process pool in `_extract_delimited_fields_parallel` (see also
+    `_init_delimited_worker`). The chunk of records is read by the worker from the data file, and
+    only picklable (non-PDS) arrays are returned.
+
+    Parameters
+    ----------
+    byte_range : tuple[int, int]
+        The start and stop byte, in the data file, of the chunk's records.
+
+    Returns
+    -------
+    list[np.ndarray or np.ma.MaskedArray]
+        The extracted data for each requested field, cast to its initial data type.
+    """
+
+    from .core import read_byte_data
+
+    table_structure, table_manifest, fields = _delimited_worker_table
+    records = read_byte_data(table_structure.parent_filename, *byte_range)
+
+    # Exclude the delimiter of the last record, such that it is not followed by an empty record
+    if records.endswith(b'\r\n'):
+        records = records[:-2]
+
+    extracted_fields = _extract_table_fields(table_structure, table_manifest, records, fields=fields)
+
+    return [data.view(np.ma.MaskedArray) if isinstance(data, np.ma.MaskedArray) else data.view(np.ndarray)
+            for data in extracted_fields]
+
+
+def _concatenate_field_chunks(chunks):
+    """ Concatenate the data extracted for a single field from each chunk of records.
+
+    Parameters
+    ----------
+    chunks : list[np.ndarray or np.ma.MaskedArray]
+        The data of the field for each chunk of records, in order.
+
+    Returns
+    -------
+    np.ndarray or np.ma.MaskedArray
+        The data of the field for all records. Has the data type the field would have had if all records
+        had been converted at once.
+    """
+
+    dtypes = [chunk.dtype for chunk in chunks]
+    dtype = np.result_type(*dtypes)
+
+    # Some integer types do not have a common integer type (e.g. uint64 and int8), in which case the
+    # values are stored as ``object`` (see `get_min_integer_numpy_type`)
+    if all(_dtype.kind in 'iu' for _dtype in dtypes) and dtype.kind not in 'iu':
+        dtype = np.dtype('object')
+
+    if any(isinstance(chunk, np.ma.MaskedArray) for chunk in chunks):
+        return np.ma.concatenate([np.ma.asarray(chunk).astype(dtype) for chunk in chunks])
+
+    return np.concatenate([chunk.astype(dtype, copy=False) for chunk in chunks])
+
+
+def _find_next_record_start(file_handler, position, stop_byte, block_size=2**16):
+    """ Locate the start of the first record following a position in the data file of a delimited table.
+
+    Parameters
+    ----------
+    file_handler : file
+        The data file, opened in binary mode.
+    position : int
+        The byte in the data file after which to search. Must be larger than 0.
+    stop_byte : int
+        The byte in the data file at which the table ends.
+    block_size : int, optional
+        Number of bytes read from the data file at a time. Defaults to 64 KB.
+
+    Returns
+    -------
+    int
+        The start byte of the first record starting after *position*, or *stop_byte* if there is none.
+    """
+
+    # Search from the byte before *position*, so that a record delimiter ending at *position* is found
+    block_start = position - 1
+    file_handler.seek(block_start)
+    previous_byte = b''
+
+    while block_start < stop_byte:
+
+        block = file_handler.read(min(block_size, stop_byte - block_start))
+        if not block:
+            break
+
+        delimiter_idx = (previous_byte + block).find(b'\r\n')
+
+        if delimiter_idx >= 0:
+            return block_start - len(previous_byte) + delimiter_idx + 2
+
+        previous_byte = block[-1:]
+        block_start += len(block)
+
+    return stop_byte
+
+
+def _extract_delimited_fields_parallel(table_structure, table_manifest, max_workers, fields=None,
+                                       min_chunk_size=2**22):
+    """ Extract and convert the data for each field in a delimited table, using multiple processes.
+
+    The records are split into contiguous chunks (at record delimiter boundaries), each of which is
+    read from the data file, tokenized and converted in a separate process. The data of each field is
+    then concatenated in record order, such that the result is the same as that of `_extract_table_fields`.
+    Only the location of each chunk in the data file is sent to the processes, and the table's meta data
+    only once to each process (see `_init_delimited_worker`), such that the byte data of the table need
+    not be held in memory by this process.
+
+    Parameters
+    ----------
+    table_structure : TableStructure
+        The PDS4 Table data structure to extract the fields of.
+    table_manifest : TableManifest
+        A manifest describing the structure of the PDS4 table. The shape of each field will be
+        adjusted in-place to match the number of records.
+    max_workers : int
+        Maximum number of processes to use.
+    fields : list[Meta_Field], optional
+        If given, only these fields (which must be from *table_manifest*) are extracted. Defaults to all
+        fields.
+    min_chunk_size : int, optional
+        Minimum number of bytes in each chunk. Tables too small to split into at least two such chunks
+        are extracted serially. Defaults to 4 MB.
+
+    Returns
+    -------
+    list[PDS_ndarray or PDS_marray]
+        The extracted data for each field, cast to its initial data type.
+    """
+
+    meta_data = table_structure.meta_data
+    data_filename = table_structure.parent_filename
+
+    num_records = meta_data['records']
+    start_byte = meta_data['offset']
+    object_length = meta_data.get('object_length')
+
+    # Determine which fields to extract
+    if fields is None:
+        fields = table_manifest.fields()
+
+    selected_fields = set([id(field) for field in fields])
+    regular_fields = table_manifest.fields(skip_uniformly_sampled=True)
+    field_idx = [i for i, field in enumerate(regular_fields) if id(field) in selected_fields]
+
+    # Locate the end of the table. If its length is not in the label, the byte data is scanned for the
+    # end of the last record (and is not retained).
+    if object_length is not None:
+        stop_byte = start_byte + object_length
+
+    elif field_idx:
+        table_byte_data = np.frombuffer(_read_table_byte_data(table_structure), dtype='uint8')
+        record_stops = _get_delimited_record_offsets(table_byte_data, num_records)[1]
+        stop_byte = start_byte + (record_stops[-1] if len(record_stops) > 0 else 0)
+        del table_byte_data, record_stops
+
+    num_chunks = min(max_workers, (stop_byte - start_byte) // min_chunk_size) if field_idx else 0
+
+    if num_chunks < 2:
+        table_byte_data = _read_table_byte_data(table_structure)
+        return _extract_table_fields(table_structure, table_manifest, table_byte_data, fields=fields)
+
+    import multiprocessing
+
+    # Split the records into contiguous chunks, each starting at the start of a record
+    split_bytes = [start_byte]
+
+    try:
+
+        with open(data_filename, 'rb') as file_handler:
+
+            for i in range(1, num_chunks):
+                split_byte = _find_next_record_start(file_handler,
+                                                     start_byte + (stop_byte - start_byte) * i // num_chunks,
+                                                     stop_byte)
+
+                if split_bytes[-1] < split_byte < stop_byte:
+                    split_bytes.append(split_byte)
+
+    except IOError as e:
+        raise six.raise_from(IOError("Unable to read data from file '" + data_filename +
+                                     "' found in label - {0}".format(e)), None)
+
+    byte_ranges = list(zip(split_bytes, split_bytes[1:] + [stop_byte]))
+
+    # Extract the fields of each chunk
+    initargs = (data_filename, meta_data, regular_fields, field_idx)
+    pool = multiprocessing.Pool(processes=len(byte_ranges), initializer=_init_delimited_worker,
+                                initargs=initargs)
+
+    try:
+        chunk_fields = pool.map(_extract_delimited_chunk_fields, byte_ranges)
+    finally:
+        pool.terminate()
+        pool.join()
+
+    # At most the number of records in the label are extracted. The data of GROUP fields is extracted
+    # flattened, with each record containing one value for each repetition.
+    num_chunk_records = [len(chunk[0]) // reduce(lambda x, y: x*y, regular_fields[field_idx[0]].shape[1:], 1)
+                         for chunk in chunk_fields]
+    num_records = min(num_records, sum(num_chunk_records))
+
+    # Adjust the shape of each field for the number of records extracted
+    for field in table_manifest.fields():
+        field.shape = (num_records, ) + tuple(field.shape[1:])
+
+    # Create data for the Uniformly Sampled fields
+    extracted_fields = [PDS_array(_make_uniformly_sampled_field(table_structure, field), field)
+                        for field in table_manifest.uniformly_sampled_fields() if id(field) in selected_fields]
+
+    # Join the data of each regular field from all chunks, releasing the data of each chunk once joined
+    for i, idx in enumerate(field_idx):
+        num_values = num_records * reduce(lambda x, y: x*y, regular_fields[idx].shape[1:], 1)
+        data = _concatenate_field_chunks([chunk[i] for chunk in chunk_fields])[0:num_values]
+        extracted_fields.append(PDS_array(data, regular_fields[idx]))
+
+        for chunk in chunk_fields:
+            chunk[i] = None
+
+    return extracted_fields
+
+
+def _get_record_idx(idx, num_records):
+    """ Obtain the record numbers selected by an index into the records of a table.
+
+    Parameters
+    ----------
+    idx : int, slice or array_like[int or bool]
+        A record number, a slice of records, an array_like of record numbers or a boolean mask
+        of records. Negative record numbers are counted from the end of the table.
+    num_records : int
+        Number of records in the table.
+
+    Returns
+    -------
+    np.ndarray
+        The (non-negative) record numbers selected by *idx*.
+
+    Raises
+    ------
+    IndexError
+        Raised if *idx* contains a record number that is outside of the table.
+    """
+
+    if isinstance(idx, slice):
+        return np.arange(*idx.indices(num_records))
+
+    record_idx = np.asanyarray(idx)
+
+    if record_idx.dtype == np.bool_:
+
+        if record_idx.shape != (num_records, ):
+            raise IndexError('Boolean index must have the same length ({0}) as the number of records.'
+                             .format(num_records))
+
+        return np.nonzero(record_idx)[0]
+
+    if (record_idx.ndim > 1) or (record_idx.size > 0 and not np.issubdtype(record_idx.dtype, np.integer)):
+        raise IndexError('Only integers, slices and one-dimensional integer or boolean arrays are valid '
+                         'record indexes.')
+
+    record_idx = record_idx.reshape(-1).astype('int64')
+
+    if ((record_idx >= num_records) | (record_idx < -num_records)).any():
+        raise IndexError('Record index is out of bounds for table with {0} records.'.format(num_records))
+
+    record_idx[record_idx < 0] += num_records
+
+    return record_idx
+
+
+def _has_value_dependent_dtype(table_structure, field, no_scale):
+    """ Determine whether the dtype of a field's data depends on the values of the field.
+
+    Such fields are ASCII integers (stored in the smallest integer type that fits all values), integers
+    scaled by an integer scaling_factor or value_offset (likewise), and strings in delimited tables (as
+    long as the longest value). See `pds_to_numpy_type`.
+
+    Parameters
+    ----------
+    table_structure : TableStructure
+        The PDS4 Table data structure that the field belongs to.
+    field : Meta_Field
+        Meta data of the field.
+    no_scale : bool
+        If True, data will not be adjusted according to the offset and scaling factor.
+
+    Returns
+    -------
+    bool
+        True if the dtype of the field depends on its values, False otherwise.
+    """
+
+    data_type = field.get('data_type', 'ASCII_Real')
+
+    if np.issubdtype(pds_to_numpy_type(data_type), np.character):
+        return table_structure.meta_data.is_delimited() and (field.get('length') is None)
+
+    if not is_pds_integer_data(pds_data_type=data_type):
+        return False
+
+    if 'ASCII' in data_type:
+        return True
+
+    scaling_factor = None if no_scale else field.get('scaling_factor')
+    value_offset = None if no_scale else field.get('value_offset')
+
+    has_scaling = (scaling_factor is not None) or (value_offset is not None)
+    has_float_scaling = isinstance(scaling_factor, float) or isinstance(value_offset, float)
+
+    return has_scaling and (not has_float_scaling)
+
+
+def _get_label_dtype(table_structure, field, no_scale, decode_strings):
+    """ Obtain the dtype of a field whose dtype depends on its values, from its meta data alone.
+
+    The returned data type can store any value that the label allows for the field, rather than only
+    the values actually present. ASCII integers can store any integer having as many characters as the
+    field's length (or maximum length, for delimited tables). Integers scaled by an integer scaling_factor
+    or value_offset can store the entire range of their unscaled data type once scaled (similar to
+    `LazyScaledArray.dtype`). Strings in delimited tables are as long as the field's maximum length, or
+    otherwise the maximum record length.
+
+    Parameters
+    ----------
+    table_structure : TableStructure
+        The PDS4 Table data structure that the field belongs to.
+    field : Meta_Field
+        Meta data of the field.
+    no_scale : bool
+        If True, data will not be adjusted according to the offset and scaling factor.
+    decode_strings : bool
+        If True, character data types will be decoded to unicode.
+
+    Returns
+    -------
+    np.dtype or None
+        The data type of the field. None if the data type does not depend on the values of the field, or
+        if the label does not limit those values (strings without a maximum field or record length).
+    """
+
+    if not _has_value_dependent_dtype(table_structure, field, no_scale):
+        return None
+
+    data_type = field.get('data_type', 'ASCII_Real')
+    is_delimited = table_structure.meta_data.is_delimited()
+    field_length = field.get('maximum_length') if is_delimited else field.get('length')
+
+    if np.issubdtype(pds_to_numpy_type(data_type), np.character):
+
+        if field_length is None:
+            field_length = table_structure.meta_data.record.get('maximum_record_length')
+
+        if field_length is None:
+            return None
+
+        return pds_to_numpy_type(data_type, field_length=field_length, decode_strings=decode_strings)
+
+    # Obtain the extrema of the unscaled integers that the field may contain
+    if ('ASCII' in data_type) and (field_length is not None):
+
+        numeric_base = {'ASCII_Numeric_Base2': 2,
+                        'ASCII_Numeric_Base8': 8,
+                        'ASCII_Numeric_Base16': 16,
+                        }.get(data_type, 10)
+
+        min_value = 0 if (data_type == 'ASCII_NonNegative_Integer') else -(numeric_base**(field_length-1) - 1)
+        max_value = numeric_base**field_length - 1
+        dtype = get_min_integer_numpy_type([min_value, max_value])
+
+    else:
+        dtype = pds_to_numpy_type(data_type, include_endian=False)
+
+    if np.issubdtype(dtype, np.integer):
+        data = np.array([np.iinfo(dtype).min, np.iinfo(dtype).max], dtype=dtype)
+    else:
+        data = None
+
+    if no_scale:
+        return dtype
+
+    # Integers are scaled into a data type that can store their entire range
+    return get_scaled_numpy_type(data_type=data_type, data=data, scaling_factor=field.get('scaling_factor'),
+                                 value_offset=field.get('value_offset'))
+
+
+def _get_table_dtypes(table_structure, fields, no_scale, decode_strings, chunk_size=2**24):
+    """ Obtain the dtype of each field whose dtype depends on its values, as when the entire table is read.
+
+    The data type of some fields depends on the values of the field (see `_has_value_dependent_dtype`),
+    such that a portion of the records may have a different data type than the entire table. Such fields
+    are scanned (in chunks, to limit memory usage) to determine the data type the entire table would have.
+    For delimited tables, all fields are scanned to also determine whether any values are null (and
+    therefore whether the entire table would be masked). The results are cached on *table_structure*.
+
+    Parameters
+    ----------
+    table_structure : TableStructure
+        The PDS4 Table data structure that the *fields* belong to.
+    fields : list[Meta_Field]
+        Meta data of the fields.
+    no_scale : bool
+        If True, data will not be adjusted according to the offset and scaling factor.
+    decode_strings : bool
+        If True, character data types will be decoded to unicode.
+    chunk_size : int, optional
+        Approximate number of bytes in each chunk of records scanned. Defaults to 16 MB.
+
+    Returns
+    -------
+    tuple[dict, bool or None]
+        A dict, with keys the NumPy names of the fields (see `pds_to_numpy_name`) and values the dtype
+        of said field in the entire table, for fields whose data type depends on their values. Whether
+        the entire table would be masked, or None if this does not depend on the values (fixed-width
+        tables).
+    """
+
+    meta_data = table_structure.meta_data
+    num_records = meta_data['records']
+    is_delimited = meta_data.is_delimited()
+
+    # Use a separate manifest, since the shape of its fields is adjusted while extracting the data
+    table_manifest = TableManifest.from_label(table_structure.label)
+    regular_fields = dict((pds_to_numpy_name(field.full_name()), field)
+                          for field in table_manifest.fields(skip_uniformly_sampled=True))
+
+    names = [pds_to_numpy_name(field.full_name()) for field in fields]
+    names = [name for name in names if name in regular_fields]
+
+    # Determine which fields need to be scanned
+    cache = table_structure._table_dtypes
+    scan_names = [name for name in names if (name, no_scale, decode_strings) not in cache and
+                  (is_delimited or _has_value_dependent_dtype(table_structure, regular_fields[name], no_scale))]
+
+    if scan_names and (num_records > 0):
+
+        scan_fields = [regular_fields[name] for name in scan_names]
+        summaries = dict((name, [None, None, False]) for name in scan_names)
+
+        # Obtain the records of the table, in chunks
+        if is_delimited:
+            num_bytes = meta_data.get('object_length') or (num_records * 1024)
+            records_per_chunk = max(1, num_records * chunk_size // max(1, num_bytes))
+            chunks = (b'\r\n'.join(records) for records in _iter_delimited_records(table_structure,
+                                                                                     records_per_chunk))
+
+        else:
+            records = _memmap_table_records(table_structure, dtype='uint8')
+            records_per_chunk = max(1, chunk_size // meta_data.record['record_length'])
+            chunks = (records[start:start + records_per_chunk].view(np.ndarray)
+                      for start in range(0, num_records, records_per_chunk))
+
+        # Find the extrema of integer values, and longest string, of each field in each chunk
+        for chunk in chunks:
+
+            extracted_fields = _extract_table_fields(table_structure, table_manifest, chunk, fields=scan_fields)
+
+            for extracted_data in extracted_fields:
+
+                summary = summaries[pds_to_numpy_name(extracted_data.meta_data.full_name())]
+                summary[2] = summary[2] or np.ma.is_masked(extracted_data)
+
+                values = np.ma.getdata(extracted_data)
+
+                if values.size == 0:
+                    continue
+
+                elif np.issubdtype(values.dtype, np.character):
+                    summary[1] = max(summary[1] or 0, values.dtype.itemsize)
+
+                elif is_pds_integer_data(data=values):
+                    min_value, max_value = int(values.min()), int(values.max())
+
+                    summary[0] = min_value if (summary[0] is None) else min(summary[0], min_value)
+                    summary[1] = max_value if (summary[1] is None) else max(summary[1], max_value)
+
+            del extracted_fields
+
+        # Determine the data type of each field from its summary, as `new_table` would from its data
+        for name in scan_names:
+
+            field = regular_fields[name]
+            min_value, max_value, is_masked = summaries[name]
+            dtype = None
+
+            if (max_value is not None) and _has_value_dependent_dtype(table_structure, field, no_scale):
+
+                if min_value is None:
+                    data = np.zeros(0, dtype='S{0}'.format(max_value))
+                else:
+                    data = np.array([min_value, max_value], dtype='object')
+
+                scale_kwargs = {} if no_scale else {'scaling_factor': field.get('scaling_factor'),
+                                                    'value_offset': field.get('value_offset')}
+
+                dtype = pds_to_numpy_type(field.get('data_type', 'ASCII_Real'), data=data,
+                                          field_length=field.get('length'), decode_strings=decode_strings,
+                                          **scale_kwargs)
+
+            cache[(name, no_scale, decode_strings)] = (dtype, is_masked)
+
+    dtypes = {}
+    masked = None
+
+    for name in names:
+
+        dtype, is_masked = cache.get((name, no_scale, decode_strings), (None, False))
+
+        if dtype is not None:
+            dtypes[name] = dtype
+
+        if is_delimited:
+            masked = masked or is_masked
+
+    return dtypes, masked
+
+
+def _new_table_portion(table_structure, extracted_fields, no_scale, decode_strings, consistent_dtype=False):
+    """ Create the data for a portion of the records in a table, from the extracted data of its fields.
+
+    Fields whose data type depends on their values are given the data type obtained from the label
+    (see `_get_label_dtype`), such that each portion of the table has the same data type. If
+    *consistent_dtype* is True, each field instead has the same data type as when the entire table is
+    read, which requires scanning the entire table once (see `_get_table_dtypes`).
+
+    Parameters
+    ----------
+    table_structure : TableStructure
+        The PDS4 Table data structure that the *extracted_fields* belong to.
+    extracted_fields : list[PDS_ndarray or PDS_marray]
+        The extracted data for each field, see `_extract_table_fields`.
+    no_scale : bool
+        Returned data will not be adjusted according to the offset and scaling factor.
+    decode_strings : bool
+        If True, character data types contained in the returned data will be decoded to unicode.
+    consistent_dtype : bool, optional
+        If True, the returned data has the same data type as the entire table. Defaults to False.
+
+    Returns
+    -------
+    PDS_ndarray or PDS_marray
+        A structured array containing the data for all *extracted_fields*.
+    """
+
+    if consistent_dtype:
+        dtypes, masked = _get_table_dtypes(table_structure, [data.meta_data for data in extracted_fields],
+                                           no_scale, decode_strings)
+
+    # Values in delimited tables may always be null, while in fixed-width tables only Special_Constants
+    # are masked
+    else:
+        dtypes = dict((pds_to_numpy_name(data.meta_data.full_name()),
+                       _get_label_dtype(table_structure, data.meta_data, no_scale, decode_strings))
+                      for data in extracted_fields)
+        masked = table_structure.meta_data.is_delimited() or any(
+            data.meta_data.get('Special_Constants') is not None for data in extracted_fields)
+
+    data = new_table(extracted_fields, no_scale=no_scale, decode_strings=decode_strings,
+                     masked=masked, copy=False).data
+
+    # Cast fields whose data type depends on their values to the data type of the entire table, or the
+    # data type from the label
+    table_dtype = []
+
+    for name in data.dtype.names:
+        dtype = data.dtype.fields[name][0]
+        base_dtype = dtypes.get(name)
+
+        if base_dtype is None:
+            base_dtype = dtype.base
+
+        # Values that do not fit the data type from the label (if it is wrong) are not truncated
+        if not np.can_cast(dtype.base, base_dtype):
+            values = data[name].view(np.ndarray)
+
+            if np.issubdtype(base_dtype, np.integer) and is_pds_integer_data(data=values):
+                extrema = [np.iinfo(base_dtype).min, np.iinfo(base_dtype).max]
+
+                if values.size > 0:
+                    extrema += [int(values.min()), int(values.max())]
+
+                base_dtype = get_min_integer_numpy_type(extrema)
+
+            else:
+                base_dtype = np.promote_types(base_dtype, dtype.base)
+
+        table_dtype.append((name, base_dtype, dtype.shape) if dtype.shape else (name, base_dtype))
+
+    table_dtype = np.dtype(table_dtype)
+
+    if table_dtype == data.dtype:
+        return data
+
+    # The mask is kept as-is, since ``astype`` of masked arrays does not preserve the shape of each field's
+    # mask for fields inside groups
+    cast_data = data.view(np.ndarray).astype(table_dtype).view(np.recarray)
+    array_type = PDS_array.get_array(masked=np.ma.isMaskedArray(data))
+
+    if np.ma.isMaskedArray(data):
+        return array_type(cast_data, data.meta_data, mask=np.ma.getmask(data))
+
+    return array_type(cast_data, data.meta_data)
+
+
+def read_table_section(table_structure, idx, no_scale, decode_strings, fields=None, native_byteorder=False,
+                       consistent_dtype=False):
+    """
+    Reads and properly formats the data for a portion of the records in a single PDS4 table structure.
+
+    For fixed-width tables (Table_Character and Table_Binary), only the selected records are read from
+    the data file (via memory mapping). For delimited tables, the records in the data file cannot be
+    located without reading them, therefore the entire table is read but only the selected records are
+    processed. In either case, only the selected records are converted, scaled and masked.
+
+    Fields whose data type depends on their values are given the data type obtained from the label, see
+    `_get_label_dtype`. If *consistent_dtype* is True, they are instead given the data type of the entire
+    table, which requires scanning the entire table once (see `_get_table_dtypes`).
+
+    Parameters
+    ----------
+    table_structure : TableStructure
+        The PDS4 Table data structure for which a portion of the data is to be read. Should have been
+        initialized via `TableStructure.from_file` method.
+    idx : int, slice or array_like[int or bool]
+        Selection of records to read. May be a record number, a slice of records, an array_like of
+        record numbers or a boolean mask of records.
+    no_scale : bool
+        Returned data will not be adjusted according to the offset and scaling factor.
+    decode_strings : bool
+        If True, character data types contained in the returned data will be decoded to the ``unicode`` type
+        in Python 2, and to the ``str`` type in Python 3. If False, leaves character types as byte strings.
+    fields : list[str or unicode], optional
+        If given, only the fields having these names (full or partial, see `TableStructure.field`) are
+        read. Defaults to all fields.
+    native_byteorder : bool, optional
+        If True, the returned data is converted to native byte order. Defaults to False.
+    consistent_dtype : bool, optional
+        If True, the returned data has the same data type as the entire table. Defaults to False.
+
+    Returns
+    -------
+    PDS_ndarray, PDS_marray, np.record or np.ma.mvoid
+        A structured array containing all (requested) fields for the selected records, or a single
+        record if *idx* is an integer.
+    """
+
+    meta_data = table_structure.meta_data
+    num_records = meta_data['records']
+    record_idx = _get_record_idx(idx, num_records)
+    is_single_record = (not isinstance(idx, slice)) and (np.ndim(idx) == 0)
+
+    # Obtain a manifest for the table, which describes the table structure (the fields and groups)
+    table_manifest = TableManifest.from_label(table_structure.label)
+    selected_fields = None if (fields is None) else _get_fields_by_name(table_manifest, fields)
+
+    if meta_data.is_fixed_width():
+
+        # Records can be read directly for binary tables that can be described by a structured dtype
+        record_dtype = _get_binary_record_dtype(table_structure, table_manifest, no_scale, fields=selected_fields)
+
+        # Memory map the table, with each row in the memory map being a record. Selecting records from
+        # the memory map reads only those records into memory.
+        if record_dtype is None:
+            records = _memmap_table_records(table_structure, dtype='uint8')
+        else:
+            records = _memmap_table_records(table_structure, dtype=record_dtype)
+
+        records = records[record_idx].view(np.ndarray)
+
+        # Records selected from the read-only memory map may themselves be read-only, however they are
+        # byteswapped in-place when converted to native byte order
+        if native_byteorder and (not records.flags.writeable):
+            records = records.copy()
+
+        if record_dtype is not None:
+
+            if selected_fields is None:
+                data = _make_record_table(records, table_manifest.fields())
+            else:
+                data = _make_record_table(_pack_records(records), selected_fields)
+
+            if native_byteorder:
+                data = _convert_table_to_native_byteorder(data)
+
+            return data[0] if is_single_record else data
+
+    else:
+
+        # Locate the records, and join those requested
+        table_byte_data = _read_table_byte_data(table_structure)
+        record_starts, record_stops = _get_delimited_record_offsets(np.frombuffer(table_byte_data, dtype='uint8'),
+                                                                    num_records)
+
+        if len(record_starts) < num_records:
+            raise ValueError('Table data contains fewer records ({0}) than expected from its label ({1}).'
+                             .format(len(record_starts), num_records))
+
+        records = b'\r\n'.join([table_byte_data[record_starts[i]:record_stops[i]] for i in record_idx])
+        del table_byte_data
+
+    extracted_fields = _extract_table_fields(table_structure, table_manifest, records,
+                                             record_idx=record_idx, fields=selected_fields)
+    del records
+
+    # Finish processing (scale and decoding), create the section's structured data array and set fields
+    data = _new_table_portion(table_structure, extracted_fields, no_scale, decode_strings,
+                              consistent_dtype=consistent_dtype)
+
+    if native_byteorder:
+        data = _convert_table_to_native_byteorder(data)
+
+    return data[0] if is_single_record else data
+
+
+def iter_table_chunks(table_structure, records_per_chunk, no_scale, decode_strings, fields=None,
+                      native_byteorder=False, consistent_dtype=False):
+    """
+    Reads and properly formats the data for a single PDS4 table structure, in chunks of records.
+
+    Only a single chunk of records is held in memory at a time (aside from any chunks retained by the
+    caller), such that tables larger than available memory can be processed. The table is read in a
+    single pass, with each chunk having the data type obtained from the label (see `_get_label_dtype`).
+    If *consistent_dtype* is True, each chunk instead has the same data type as the entire table, which
+    requires scanning the entire table once before the first chunk (see `_get_table_dtypes`).
+
+    Parameters
+    ----------
+    table_structure : TableStructure
+        The PDS4 Table data structure for which the data is to be read. Should have been initialized via
+        `TableStructure.from_file` method.
+    records_per_chunk : int
+        Number of records in each yielded chunk. The last chunk may contain fewer records.
+    no_scale : bool
+        Returned data will not be adjusted according to the offset and scaling factor.
+    decode_strings : bool
+        If True, character data types contained in the returned data will be decoded to the ``unicode`` type
+        in Python 2, and to the ``str`` type in Python 3. If False, leaves character types as byte strings.
+    fields : list[str or unicode], optional
+        If given, only the fields having these names (full or partial, see `TableStructure.field`) are
+        read. Defaults to all fields.
+    native_byteorder : bool, optional
+        If True, each chunk is converted to native byte order. Defaults to False.
+    consistent_dtype : bool, optional
+        If True, each chunk has the same data type as the entire table. Defaults to False.
+
+    Yields
+    ------
+    PDS_ndarray or PDS_marray
+        A structured array containing all (requested) fields for a chunk of records.
+    """
+
+    num_records = table_structure.meta_data['records']
+
+    # Fixed-width tables can be read in chunks by locating the records of each chunk in the data file
+    if table_structure.meta_data.is_fixed_width():
+
+        for start_record in range(0, num_records, records_per_chunk):
+            yield read_table_section(table_structure, slice(start_record, start_record + records_per_chunk),
+                                     no_scale=no_scale, decode_strings=decode_strings, fields=fields,
+                                     native_byteorder=native_byteorder, consistent_dtype=consistent_dtype)
+
+    # Delimited tables are read in blocks, from which the records of each chunk are split
+    else:
+
+        start_record = 0
+
+        for records in _iter_delimited_records(table_structure, records_per_chunk):
+
+            num_chunk_records = len(records)
+            records = b'\r\n'.join(records)
+
+            # The shape of the fields in the manifest is adjusted while extracting each chunk
+            table_manifest = TableManifest.from_label(table_structure.label)
+            selected_fields = None if (fields is None) else _get_fields_by_name(table_manifest, fields)
+
+            record_idx = np.arange(start_record, start_record + num_chunk_records)
+            start_record += num_chunk_records
+
+            extracted_fields = _extract_table_fields(table_structure, table_manifest, records,
+                                                     record_idx=record_idx, fields=selected_fields)
+            del records
+
+            data = _new_table_portion(table_structure, extracted_fields, no_scale, decode_strings,
+                                      consistent_dtype=consistent_dtype)
+
+            if native_byteorder:
+                data = _convert_table_to_native_byteorder(data)
+
+            yield data
+
+
+def read_table_data(table_structure, no_scale, decode_strings, fields=None, max_workers=None,
+                    native_byteorder=False):
+    """
+    Reads and properly formats the data for a single PDS4 table structure, modifies *table_structure* to
+    contain all extracted fields for said table.
+
+    Parameters
+    ----------
+    table_structure : TableStructure
+        The PDS4 Table data structure to which the table's data fields should be added.  Should have been
+        initialized via `TableStructure.from_file` method.
+    no_scale : bool
+        Returned data will not be adjusted according to the offset and scaling factor.
+    decode_strings : bool
+        If True, character data types contained in the returned data will be decoded to the ``unicode`` type
+        in Python 2, and to the ``str`` type in Python 3. If False, leaves character types as byte strings.
+    fields : list[str or unicode], optional
+        If given, only the fields having these names (full or partial, see `TableStructure.field`) are
+        read; all other fields are not extracted, converted, scaled or decoded. Defaults to all fields.
+    max_workers : int, optional
+        If larger than 1, the records of large delimited tables are split into chunks that are tokenized
+        and converted in parallel by up to this many processes. Defaults to None, parsing serially.
+    native_byteorder : bool, optional
+        If True, fields in non-native byte order are converted to native byte order, byteswapping them
+        in-place, and the byte order of each is recorded in the ``original_byteorder`` attribute of its
+        meta data. Defaults to False.
+
+    Returns
+    -------
+    None
+    """
+
+    # Obtain a manifest for the table, which describes the table structure (the fields and groups)
+    table_manifest = TableManifest.from_label(table_structure.label)
+    selected_fields = None if (fields is None) else _get_fields_by_name(table_manifest, fields)
+
+    # Binary tables whose records can be described by a single structured dtype are read directly
+    # into their final array, without extracting and converting each field
+    record_dtype = _get_binary_record_dtype(table_structure, table_manifest, no_scale, fields=selected_fields)
+
+    if record_dtype is not None:
+        table_structure.data = _read_binary_table_records(table_structure, table_manifest, record_dtype,
+                                                          fields=selected_fields)
+
+        if native_byteorder:
+            table_structure.data = _convert_table_to_native_byteorder(table_structure.data)
+
+        return
+
+    # Provide a warning to the user if the data is large and may take a while to read
+    table_data_size_check(table_structure)
+
+    # Extract the number of records
+    num_records = table_structure.meta_data['records']
+
+    # Whether delimited tables are parsed by multiple processes, each reading a portion of the byte data
+    is_parallel = table_structure.meta_data.is_delimited() and (max_workers is not None) and (max_workers > 1)
+
+    # The byte data is tokenized into records and values when extracting the fields (delimited tables)
+    if is_parallel:
+        table_byte_data = records = None
+
+    elif table_structure.meta_data.is_delimited():
+        table_byte_data = _read_table_byte_data(table_structure)
+        records = table_byte_data
+
+    # View the byte data as a 2D matrix, with the first dimension the record number and the second
+    # dimension the byte within the record (fixed-width tables). When only some fields are requested,
+    # the records are memory mapped such that only the bytes for those fields need to be read.
+    else:
+
+        if selected_fields is None:
+            record_length = table_structure.meta_data.record['record_length']
+            table_byte_data = _read_table_byte_data(table_structure)
+            records = _make_record_matrix(table_byte_data, num_records, record_length)
+
+        else:
+            table_byte_data = None
+            records = _memmap_table_records(table_structure, dtype='uint8')
+
+    # Extract and convert the data for each field
+    if is_parallel:
+        extracted_fields = _extract_delimited_fields_parallel(table_structure, table_manifest, max_workers,
+                                                              fields=selected_fields)
+
+    else:
+        extracted_fields = _extract_table_fields(table_structure, table_manifest, records,
+                                                 fields=selected_fields)
+
+    # Delete table byte data (and any view of it) to save RAM now that it is no longer needed
+    # (all fields have been extracted)
+    del table_byte_data, records
+
+    # Finish processing (scale and decoding), create the table's structured data array and set fields
+    table_structure.data = new_table(extracted_fields, no_scale=no_scale, decode_strings=decode_strings,
+                                     masked=None, copy=False).data
+
+    if native_byteorder:
+        table_structure.data = _convert_table_to_native_byteorder(table_structure.data)
 
 
 def read_table(full_label, table_label, data_filename,
-               lazy_load=False, no_scale=False, decode_strings=False):
+               lazy_load=False, no_scale=False, decode_strings=False, fields=None, max_workers=None,
+               native_byteorder=False):
     """ Create the `TableStructure`, containing label, data and meta data for a PDS4 Table from a file.
 
     Used for all forms of PDS4 Tables (i.e., Table_Character, Table_Binary and Table_Delimited).
@@ -917,6 +2483,13 @@ def read_table(full_label, table_label, data_filename,
         If True, strings data types contained in the returned data will be decoded to
         the ``unicode`` type in Python 2, and to the ``str`` type in Python 3. If False,
         leaves string types as byte strings. Defaults to False.
+    fields : list[str or unicode], optional
+        If given, only the fields having these names (full or partial) are read. Defaults to all fields.
+    max_workers : int, optional
+        If larger than 1, large delimited tables are parsed in parallel by up to this many processes.
+        Defaults to None, parsing serially.
+    native_byteorder : bool, optional
+        If True, fields are converted to native byte order when read. Defaults to False.
 
     Returns
     -------
@@ -936,6 +2509,7 @@ def read_table(full_label, table_label, data_filename,
     # Create the data structure for this table
     table_structure = TableStructure.from_file(data_filename, table_label, full_label,
                                                lazy_load=lazy_load, no_scale=no_scale,
-                                               decode_strings=decode_strings)
+                                               decode_strings=decode_strings, fields=fields,
+                                               max_workers=max_workers, native_byteorder=native_byteorder)
 
     return table_structure
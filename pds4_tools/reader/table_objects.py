@@ -41,9 +41,29 @@ class TableStructure(Structure):
     Inherits all Attributes and Parameters from `Structure`. Overrides `info` method to implement it.
     """
 
+    def __init__(self, *args, **kwargs):
+
+        super(TableStructure, self).__init__(*args, **kwargs)
+
+        # Controls which fields (all if None) will be read-in via `from_file`
+        self._fields = None
+
+        # Stores the data of fields read-in individually, prior to the data of the entire table being read-in
+        self._field_cache = {}
+
+        # Controls the number of processes (serial if None) used to parse delimited data via `from_file`
+        self._max_workers = None
+
+        # Controls whether data is converted to native byte order via `from_file`
+        self._native_byteorder = False
+
+        # Stores the data type that fields, whose data type depends on their values, have in the entire table
+        self._table_dtypes = {}
+
     @classmethod
     def from_file(cls, data_filename, structure_label, full_label,
-                  lazy_load=False, no_scale=False, decode_strings=False):
+                  lazy_load=False, no_scale=False, decode_strings=False, fields=None, max_workers=None,
+                  native_byteorder=False):
         """ Create a table structure from relevant labels and file for the data.
 
         Parameters
@@ -63,6 +83,16 @@ class TableStructure(Structure):
         lazy_load : bool, optional
             If True, does not read-in the data of this structure until the first attempt to access it.
             Defaults to False.
+        fields : list[str or unicode], optional
+            If given, only the fields having these names (full or partial, see `field`) are read-in.
+            Defaults to all fields.
+        max_workers : int, optional
+            If larger than 1, the records of large delimited tables are split into chunks that are
+            parsed in parallel by up to this many processes. Defaults to None, parsing serially.
+        native_byteorder : bool, optional
+            If True, fields stored in non-native byte order are byteswapped (in-place) to native byte
+            order when read. The byte order each was stored in is recorded in the ``original_byteorder``
+            attribute of its meta data. Defaults to False.
 
         Returns
         -------
@@ -79,6 +109,9 @@ class TableStructure(Structure):
                               parent_filename=data_filename)
         table_structure._no_scale = no_scale
         table_structure._decode_strings = decode_strings
+        table_structure._fields = fields
+        table_structure._max_workers = max_workers
+        table_structure._native_byteorder = native_byteorder
 
         # Attempt to access the data property such that the data gets read-in (if not on lazy-load)
         if not lazy_load:
@@ -244,8 +277,13 @@ class TableStructure(Structure):
 
                 field_names = []
 
-                full_field_names = [field.meta_data.full_name() for field in self.fields]
-                partial_field_names = [field.meta_data['name'] for field in self.fields]
+                if self.data_loaded:
+                    full_field_names = [field.meta_data.full_name() for field in self.fields]
+                    partial_field_names = [field.meta_data['name'] for field in self.fields]
+
+                else:
+                    full_field_names = [full_name for full_name, name in self._field_names]
+                    partial_field_names = [name for full_name, name in self._field_names]
 
                 # Try searching by partial name if no full name is found
                 for _key in key:
@@ -257,6 +295,13 @@ class TableStructure(Structure):
                     else:
                         field_names.append(_key)
 
+                # Read only the selected fields if the data for the table has not been read-in
+                if not self.data_loaded:
+                    from .data_types import pds_to_numpy_name
+
+                    data = self.read_fields(field_names)
+                    return data[[pds_to_numpy_name(name) for name in field_names]]
+
                 return self.data[field_names]
 
         # Allow all other searches (slice, specific indexes, etc)
@@ -279,13 +324,17 @@ class TableStructure(Structure):
 
         return num_fields
 
-    def field(self, key, repetition=0, all=False):
+    def field(self, key, repetition=0, all=False, lazy=False):
         """ Get data for specific field in table.
 
         In the case of GROUP fields, the key can include the full location for disambiguation,
         (e.g. *key* = 'GROUP_1, GROUP_0, field_name'). See `info` method for full locations of all
         fields.
 
+        If the data for the table has not yet been read-in (e.g. on lazy-load), then only the requested
+        field(s) are read-in. Each such field is cached, such that it is read only once; the data of
+        the entire table is only read-in once `data` is accessed.
+
         Parameters
         ----------
         key : str, unicode, int or slice
@@ -299,10 +348,14 @@ class TableStructure(Structure):
             If there are multiple fields with the same name, setting to True indicates that
             all fields should be returned in a ``list``. If set, and no match is found
             then an empty list will be returned. Defaults to False.
+        lazy : bool, optional
+            If True, Uniformly_Sampled fields are returned as a `UniformlySampledArray`, which computes
+            the values of only the records it is indexed with, such that the entire field is never
+            created. Other fields are unaffected. Defaults to False.
 
         Returns
         -------
-        PDS_ndarray or PDS_marray
+        PDS_ndarray, PDS_marray or UniformlySampledArray
             The data for the field(s).
 
         Raises
@@ -315,10 +368,18 @@ class TableStructure(Structure):
         Examples
         --------
             See :func:`TableStructure.__getitem__` method examples.
+
+            For a Uniformly_Sampled field with many records,
+
+            >>> table_struct.field('Time', lazy=True)[-1000:]
         """
 
         return_fields = []
 
+        # Read-in only the requested field(s) if the data for the table has not been read-in
+        if (not self.data_loaded) or lazy:
+            return self._lazy_field(key, repetition=repetition, all=all, lazy=lazy)
+
         # Search by index or slice
         if isinstance(key, six.integer_types) or isinstance(key, slice):
             return self.fields[key]
@@ -365,10 +426,251 @@ class TableStructure(Structure):
         """
 
         from .read_tables import read_table_data
-        read_table_data(self, no_scale=self._no_scale, decode_strings=self._decode_strings)
+        read_table_data(self, no_scale=self._no_scale, decode_strings=self._decode_strings,
+                        fields=self._fields, max_workers=self._max_workers,
+                        native_byteorder=self._native_byteorder)
+
+        # Fields read-in individually are no longer needed once all data has been read-in
+        self._field_cache.clear()
 
         return self.data
 
+    @threaded_cached_property
+    def section(self):
+        """ A section of the records in the PDS4 table data structure.
+
+        This property is implemented as a thread-safe cacheable attribute. See docstring of ``.data``
+        for more info.
+
+        Returns
+        -------
+        TableSection
+            An object that allows access to a subset of the records in the table without reading the
+            entire table into memory.
+
+        Examples
+        --------
+        >>> table_struct.section[-1000:]
+        >>> table_struct.section[[0, 10, 20]]
+        """
+
+        return TableSection(self, no_scale=self._no_scale, decode_strings=self._decode_strings,
+                            fields=self._fields, native_byteorder=self._native_byteorder)
+
+    def read_fields(self, keys):
+        """ Read the data for only some of the fields in the table.
+
+        Only the requested fields are extracted, converted, scaled and decoded; for delimited tables,
+        each record is additionally only split until the last requested field. The data of this table
+        structure is not modified.
+
+        Parameters
+        ----------
+        keys : str, unicode or list[str or unicode]
+            Names (full or partial, see `field`) of the fields to read.
+
+        Returns
+        -------
+        PDS_ndarray or PDS_marray
+            A structured array containing only the requested fields, in the order they appear in the table.
+
+        Raises
+        ------
+        ValueError
+            Raised if any of *keys* does not match a field in the table.
+
+        Examples
+        --------
+        >>> table_struct.read_fields(['Field_Name', 'Other_Field_Name'])
+        """
+
+        if isinstance(keys, six.string_types):
+            keys = [keys]
+
+        # Data that has already been read-in is selected from directly
+        if self.data_loaded:
+            return self[list(keys)]
+
+        from .read_tables import read_table_data
+
+        # Read the fields into a temporary structure, such that this structure's data is not set
+        table_structure = self.__class__(structure_meta_data=self.meta_data, structure_label=self.label,
+                                         full_label=self.full_label, parent_filename=self.parent_filename)
+        read_table_data(table_structure, no_scale=self._no_scale, decode_strings=self._decode_strings,
+                        fields=keys, max_workers=self._max_workers, native_byteorder=self._native_byteorder)
+
+        return table_structure.data
+
+    def iter_chunks(self, records_per_chunk=None, consistent_dtype=False):
+        """ Iterate over the records in the table, in chunks.
+
+        Each chunk is read, converted, scaled and masked as the data would be via ``.data``, however only
+        a single chunk needs to be held in memory at a time. This allows processing tables much larger
+        than the available memory.
+
+        Notes
+        -----
+        If the data for this table has already been read-in, then each chunk will be a view of that data.
+
+        Otherwise the table is read in a single pass. The data type of some fields (e.g. ASCII and scaled
+        integers, and strings in delimited tables) depends on the values of that field when read via
+        ``.data``. In each chunk, such fields are instead given a data type from the label, which can store
+        any value the label allows, such that all chunks have the same data type. If *consistent_dtype* is
+        True, each chunk has the same data type as ``.data``, at the cost of scanning the entire table once
+        before the first chunk.
+
+        Parameters
+        ----------
+        records_per_chunk : int, optional
+            Number of records in each chunk. The last chunk may contain fewer records. Defaults to
+            a number of records such that each chunk contains approximately 10 million elements.
+        consistent_dtype : bool, optional
+            If True, each chunk has the same data type as ``.data``. Defaults to False.
+
+        Yields
+        ------
+        PDS_ndarray or PDS_marray
+            A structured array containing all fields for a chunk of records.
+
+        Raises
+        ------
+        ValueError
+            Raised if *records_per_chunk* is not a positive integer.
+
+        Examples
+        --------
+        >>> for chunk in table_struct.iter_chunks(100000):
+        >>>     total += chunk['Field_Name'].sum()
+        """
+
+        if records_per_chunk is None:
+            num_fields = self.meta_data.dimensions()[0]
+            records_per_chunk = max(1, 10**7 // max(1, num_fields))
+
+        if records_per_chunk < 1:
+            raise ValueError('Records per chunk must be a positive integer; got {0}.'.format(records_per_chunk))
+
+        # Data that has already been read-in is iterated over directly
+        if self.data_loaded:
+
+            for start_record in range(0, len(self.data), records_per_chunk):
+                yield self.data[start_record:start_record + records_per_chunk]
+
+        else:
+
+            from .read_tables import iter_table_chunks
+
+            for chunk in iter_table_chunks(self, records_per_chunk, no_scale=self._no_scale,
+                                           decode_strings=self._decode_strings, fields=self._fields,
+                                           native_byteorder=self._native_byteorder,
+                                           consistent_dtype=consistent_dtype):
+                yield chunk
+
+    @threaded_cached_property
+    def _field_names(self):
+        """ Names of the fields in the table, obtained from its label.
+
+        This property is implemented as a thread-safe cacheable attribute. See docstring of ``.data``
+        for more info.
+
+        Returns
+        -------
+        list[tuple]
+            The full name and the name of each field that will be read-in, in the same order as the
+            fields in ``.data``.
+        """
+
+        from .read_tables import _get_fields_by_name
+
+        table_manifest = TableManifest.from_label(self.label)
+
+        if self._fields is None:
+            selected_fields = table_manifest.fields()
+        else:
+            selected_fields = _get_fields_by_name(table_manifest, self._fields)
+
+        # Uniformly sampled fields are created prior to other fields when reading the data
+        selected_ids = set([id(field) for field in selected_fields])
+        fields = table_manifest.uniformly_sampled_fields() + table_manifest.fields(skip_uniformly_sampled=True)
+
+        return [(field.full_name(), field['name']) for field in fields if id(field) in selected_ids]
+
+    def _lazy_field(self, key, repetition=0, all=False, lazy=False):
+        """ Get data for specific field in table, reading-in only that field.
+
+        Each field read-in is cached until the data for the entire table is read-in.
+
+        Parameters
+        ----------
+        key : str, unicode, int or slice
+            Selection for desired field. See `field`.
+        repetition : int, optional
+            See `field`.
+        all : bool, optional
+            See `field`.
+        lazy : bool, optional
+            See `field`.
+
+        Returns
+        -------
+        PDS_ndarray, PDS_marray or UniformlySampledArray
+            The data for the field(s).
+
+        Raises
+        ------
+        IndexError
+            Raised if *key* is a larger integer than there are fields in the table.
+        ValueError
+            Raised if *key* is a name that does not match any field.
+        """
+
+        from .data_types import pds_to_numpy_name
+
+        uni_sampled_fields = {}
+
+        if lazy:
+            table_manifest = TableManifest.from_label(self.label)
+            uni_sampled_fields = dict((field.full_name(), field) for field in
+                                      table_manifest.uniformly_sampled_fields())
+
+        def read_field(full_name):
+
+            if full_name in uni_sampled_fields:
+                return UniformlySampledArray(self, uni_sampled_fields[full_name])
+
+            elif self.data_loaded:
+                return self.data[pds_to_numpy_name(full_name)]
+
+            if full_name not in self._field_cache:
+                data = self.read_fields([full_name])
+                self._field_cache.setdefault(full_name, data[pds_to_numpy_name(full_name)])
+
+            return self._field_cache[full_name]
+
+        full_names = [full_name for full_name, name in self._field_names]
+
+        # Search by index or slice
+        if isinstance(key, six.integer_types):
+            return read_field(full_names[key])
+
+        elif isinstance(key, slice):
+            return [read_field(full_name) for full_name in full_names[key]]
+
+        # Search by name (full or partial)
+        return_names = [full_name for full_name, name in self._field_names if key in (full_name, name)]
+
+        # Return result
+        if len(return_names) > repetition and not all:
+            return read_field(return_names[repetition])
+
+        elif all:
+            return [read_field(full_name) for full_name in return_names]
+
+        if repetition > 0:
+            raise ValueError("Field '{0}' (repetition {1}) not found.".format(key, repetition))
+        else:
+            raise ValueError("Field '{0}' not found.".format(key))
+
     @property
     def fields(self):
         """
@@ -430,6 +732,193 @@ class TableStructure(Structure):
         return table_structure
 
 
+class TableSection(object):
+    """ Stores and allows retrieval of a section of the records in a table.
+
+    Used to read, convert and scale (if necessary) a subset of the records of a PDS4 table. Usually this
+    would be used for a table that is too large to hold entirely in memory.
+
+    Notes
+    -----
+    For fixed-width tables (Table_Character and Table_Binary) only the selected records are read from
+    the data file. Delimited tables must be read in their entirety to locate the selected records,
+    however only those records are converted.
+
+    The data type of some fields (e.g. ASCII and scaled integers, and strings in delimited tables) is
+    determined from the values of that field when the entire table is read. In a section, such fields are
+    instead given a data type from the label, which can store any value the label allows, such that all
+    sections have the same data type. If *consistent_dtype* is True, each section has the same data type
+    as the entire table; such fields are then scanned once (in chunks) when the first section is read.
+
+    Parameters
+    ----------
+    table_structure : TableStructure
+        A PDS4 table structure, created via `TableStructure.from_file`.
+    no_scale : bool, optional
+        If True, returned data will not be adjusted according to the offset and scaling factor.
+        Defaults to False.
+    decode_strings : bool, optional
+        If True, strings data types contained in the returned data will be decoded to
+        the ``unicode`` type in Python 2, and to the ``str`` type in Python 3. If False,
+        leaves string types as byte strings. Defaults to False.
+    fields : list[str or unicode], optional
+        If given, only the fields having these names (full or partial) are read. Defaults to all fields.
+    native_byteorder : bool, optional
+        If True, returned data is converted to native byte order. Defaults to False.
+    consistent_dtype : bool, optional
+        If True, returned data has the same data type as the entire table. Defaults to False.
+
+    Attributes
+    ----------
+    consistent_dtype : bool
+        If True, returned data has the same data type as the entire table.
+
+    Examples
+    --------
+    >>> table_struct.section.consistent_dtype = True
+    >>> table_struct.section[-1000:]
+    """
+
+    def __init__(self, table_structure, no_scale=False, decode_strings=False, fields=None,
+                 native_byteorder=False, consistent_dtype=False):
+
+        self._structure = table_structure
+        self._no_scale = no_scale
+        self._decode_strings = decode_strings
+        self._fields = fields
+        self._native_byteorder = native_byteorder
+        self.consistent_dtype = consistent_dtype
+
+    def __getitem__(self, idx):
+        """ Obtain a portion of the records in the table.
+
+        Parameters
+        ----------
+        idx : int, slice or array_like
+            A record number, a slice of records, an array-like of record numbers or a boolean mask
+            of records.
+
+        Returns
+        -------
+        PDS_ndarray, PDS_marray, np.record or np.ma.mvoid
+            A structured array containing all fields for the selected records, or a single record if
+            *idx* is an integer.
+        """
+
+        from .read_tables import read_table_section
+
+        return read_table_section(self._structure, idx, no_scale=self._no_scale,
+                                  decode_strings=self._decode_strings, fields=self._fields,
+                                  native_byteorder=self._native_byteorder,
+                                  consistent_dtype=self.consistent_dtype)
+
+    def __len__(self):
+        """
+        Returns
+        -------
+        int
+            Number of records in the table.
+        """
+
+        return self._structure.meta_data['records']
+
+
+class UniformlySampledArray(object):
+    """ A Uniformly_Sampled field whose values are computed only when indexed.
+
+    Used for Uniformly_Sampled fields that have too many records to create in memory. Indexing with
+    a record number, a slice of records, an array-like of record numbers or a boolean mask of records
+    computes the values of only those records.
+
+    Parameters
+    ----------
+    table_structure : TableStructure
+        The PDS4 table structure containing the field.
+    meta_data : Meta_FieldUniformlySampled
+        Meta data of the Uniformly_Sampled field.
+
+    Attributes
+    ----------
+    meta_data : Meta_FieldUniformlySampled
+        Meta data of the Uniformly_Sampled field.
+    """
+
+    def __init__(self, table_structure, meta_data):
+
+        self._structure = table_structure
+        self.meta_data = meta_data
+
+    def __getitem__(self, idx):
+        """ Obtain the values of the field for a portion of the records in the table.
+
+        Parameters
+        ----------
+        idx : int, slice or array_like
+            A record number, a slice of records, an array-like of record numbers or a boolean mask
+            of records.
+
+        Returns
+        -------
+        PDS_ndarray, float or int
+            The values of the field for the selected records, or a single value if *idx* is an integer.
+        """
+
+        from .data import PDS_array
+        from .read_tables import _make_uniformly_sampled_field, _get_record_idx
+
+        record_idx = _get_record_idx(idx, len(self))
+        data = _make_uniformly_sampled_field(self._structure, self.meta_data, record_idx=record_idx)
+
+        if (not isinstance(idx, slice)) and (np.ndim(idx) == 0):
+            return data[0]
+
+        return PDS_array(data, self.meta_data)
+
+    def __len__(self):
+        """
+        Returns
+        -------
+        int
+            Number of records in the table.
+        """
+
+        return self._structure.meta_data['records']
+
+    def __array__(self, dtype=None):
+        """ Create the values of the field for all records.
+
+        Returns
+        -------
+        np.ndarray
+        """
+
+        return np.asarray(self[:], dtype=dtype)
+
+    @property
+    def shape(self):
+        """
+        Returns
+        -------
+        tuple
+            Shape of the field.
+        """
+
+        return (len(self), )
+
+    @property
+    def dtype(self):
+        """
+        Returns
+        -------
+        np.dtype
+            Data type of the values of the field.
+        """
+
+        from .read_tables import _get_uniformly_sampled_dtype
+
+        return _get_uniformly_sampled_dtype(self.meta_data, quiet=True)
+
+
 class Meta_TableStructure(Meta_Structure):
     """ Meta data about a PDS4 table data structure.
 
@@ -1510,6 +1999,9 @@ class Meta_Field(Meta_TableElement):
     shape : tuple[int]
         The dimensions of the field's data. For fields not inside groups, this will be equivalent to
         the number of records.
+    original_byteorder : str, unicode or None
+        If the data was converted to native byte order on read-in, the byte order ('<' or '>') it is
+        stored in. Otherwise None.
 
     Notes
     -----
@@ -1546,6 +2038,7 @@ class Meta_Field(Meta_TableElement):
         super(Meta_Field, self).__init__(*args, **kwds)
 
         self.shape = None
+        self.original_byteorder = None
 
     @classmethod
     def from_label(cls, field_xml):
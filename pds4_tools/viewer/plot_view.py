@@ -2896,13 +2896,13 @@ class _Series(object):
         # Select the RowNumber axis
         elif axis_selection == 'row':
 
-            num_rows = len(self.structure.fields[0])
+            num_rows = len(self.structure.field(0))
             data = np.arange(num_rows)
 
         # Select an axis from the fields in the table
         else:
 
-            data = self.structure.fields[axis_selection]
+            data = self.structure.field(axis_selection)
 
             if masked:
 
@@ -0,0 +1,124 @@
+""" Benchmark of reading PDS4 delimited tables, comparing serial parsing against parsing by multiple processes.
+
+Synthetic delimited tables are generated with an increasing number of records, by repeating the records
+of the Product_DelimitedTable test table. Each is read via ``pds4_read``, first serially and then with
+*max_workers* processes, and the time taken and speedup are reported. The speedup depends on the number
+of CPU cores available.
+
+Usage: python -m tests.benchmark_delimited [max_workers [num_records ...]]
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import io
+import os
+import re
+import sys
+import shutil
+import tempfile
+import timeit
+import multiprocessing
+
+from pds4_tools import pds4_read
+
+DEFAULT_NUM_RECORDS = (100000, 400000, 1600000)
+
+# Directory containing the test labels
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+
+def make_table(directory, num_records):
+    """ Create a synthetic PDS4 delimited table, and its label.
+
+    Parameters
+    ----------
+    directory : str or unicode
+        Directory in which to write the label and data file.
+    num_records : int
+        Number of records in the table.
+
+    Returns
+    -------
+    unicode
+        Filename, including path, of the label.
+    """
+
+    with io.open(os.path.join(DATA_DIR, 'Product_DelimitedTable.xml'), 'r', encoding='utf-8') as file_handler:
+        label = file_handler.read()
+
+    with open(os.path.join(DATA_DIR, 'delim_data.csv'), 'rb') as file_handler:
+        records = file_handler.read().rstrip(b'\r\n').split(b'\r\n')
+
+    data_filename = 'delim_data_{0}.csv'.format(num_records)
+    label_filename = os.path.join(directory, 'Product_DelimitedTable_{0}.xml'.format(num_records))
+
+    with open(os.path.join(directory, data_filename), 'wb') as file_handler:
+
+        for i in range(0, num_records):
+            file_handler.write(records[i % len(records)] + b'\r\n')
+
+    label = label.replace('delim_data.csv', data_filename)
+    label = re.sub('<records>[0-9]+</records>', '<records>{0}</records>'.format(num_records), label)
+    label = re.sub('<file_size unit="byte">[0-9]+</file_size>', '', label)
+    label = re.sub('<md5_checksum>[0-9a-f]+</md5_checksum>', '', label)
+
+    with io.open(label_filename, 'w', encoding='utf-8') as file_handler:
+        file_handler.write(label)
+
+    return label_filename
+
+
+def benchmark(filename, max_workers=None, repeat=3):
+    """ Time reading the data of a table.
+
+    Parameters
+    ----------
+    filename : str or unicode
+        Filename, including path, of the label.
+    max_workers : int, optional
+        Maximum number of processes used to parse the table. Defaults to serial parsing.
+    repeat : int, optional
+        Number of times to read the table; the fastest time is used. Defaults to 3.
+
+    Returns
+    -------
+    float
+        The time taken to read the table in seconds.
+    """
+
+    def read():
+        structures = pds4_read(filename, lazy_load=True, max_workers=max_workers, quiet=True)
+        structures[0].data
+
+    return min(timeit.repeat(read, number=1, repeat=repeat))
+
+
+def main(argv):
+
+    max_workers = int(argv[0]) if argv else multiprocessing.cpu_count()
+    num_records = [int(arg) for arg in argv[1:]] if len(argv) > 1 else DEFAULT_NUM_RECORDS
+    directory = tempfile.mkdtemp()
+
+    try:
+
+        print('{0:>10} {1:>8} {2:>12} {3:>14} {4:>8}'.format(
+            'records', 'workers', 'serial (s)', 'parallel (s)', 'speedup'))
+
+        for num in num_records:
+            filename = make_table(directory, num)
+
+            serial_time = benchmark(filename)
+            parallel_time = benchmark(filename, max_workers=max_workers)
+
+            print('{0:>10} {1:>8} {2:>12.2f} {3:>14.2f} {4:>8.2f}'.format(
+                num, max_workers, serial_time, parallel_time, serial_time / parallel_time))
+
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,158 @@
+""" Benchmark of reading PDS4 labels, showing how read time scales with label size and XML parser.
+
+Synthetic labels, similar to large collection or inventory labels, are generated with an increasing
+number of elements. Each is read via ``Label.from_file``, and the time taken per element is reported;
+for reading to be linear in label size, this time should remain roughly constant. The test labels
+are read as well. Each label is read with every available parser backend (ElementTree, and lxml if
+it is installed).
+
+Usage: python -m tests.benchmark_label [num_elements ...]
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import io
+import os
+import sys
+import glob
+import shutil
+import tempfile
+import timeit
+
+from pds4_tools.reader.label_objects import Label
+from pds4_tools.reader.read_label import get_parser_backend
+
+# Number of elements in each File_Area_Inventory-like group of the synthetic labels
+ELEMENTS_PER_GROUP = 8
+
+DEFAULT_NUM_ELEMENTS = (1000, 4000, 16000, 64000)
+
+# Directory containing the test labels
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+
+
+def get_parser_backends():
+    """
+    Returns
+    -------
+    list[unicode]
+        The parser backends available for reading labels.
+    """
+
+    backends = []
+
+    for backend in ('etree', 'lxml'):
+
+        try:
+            backends.append(get_parser_backend(backend))
+        except ValueError:
+            pass
+
+    return backends
+
+
+def make_label(num_elements):
+    """ Create a synthetic PDS4 label.
+
+    Parameters
+    ----------
+    num_elements : int
+        Approximate number of elements in the label.
+
+    Returns
+    -------
+    unicode
+        The label.
+    """
+
+    groups = []
+
+    for i in range(0, max(1, num_elements // ELEMENTS_PER_GROUP)):
+        groups.append(
+            '    <Member_Entry role="  primary  " type="member">\n'
+            '      <lidvid_reference>  urn:nasa:pds:bundle:collection:product_{0}::1.0  </lidvid_reference>\n'
+            '      <title>\n'
+            '          Product   {0}\n'
+            '      </title>\n'
+            '      <description>\n'
+            '          A multi-line description\n'
+            '          of product {0}.\n'
+            '      </description>\n'
+            '      <disp:Display_Direction>\n'
+            '        <disp:horizontal_display_axis> Sample </disp:horizontal_display_axis>\n'
+            '      </disp:Display_Direction>\n'
+            '    </Member_Entry>\n'.format(i))
+
+    return ('<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<Product_Collection xmlns="http://pds.nasa.gov/pds4/pds/v1"\n'
+            '                    xmlns:disp="http://pds.nasa.gov/pds4/disp/v1">\n'
+            '  <Inventory>\n'
+            '{0}'
+            '  </Inventory>\n'
+            '</Product_Collection>\n'.format(''.join(groups)))
+
+
+def benchmark(filename, parser_backend='auto', repeat=3):
+    """ Time reading a label.
+
+    Parameters
+    ----------
+    filename : str or unicode
+        Filename, including path, of the label.
+    parser_backend : str or unicode, optional
+        The XML parser used to read the label. Defaults to auto.
+    repeat : int, optional
+        Number of times to read the label; the fastest time is used. Defaults to 3.
+
+    Returns
+    -------
+    tuple[int, float]
+        Number of elements in the label, and the time taken to read it in seconds.
+    """
+
+    label = Label.from_file(filename, parser_backend=parser_backend)
+    num_read_elements = sum(1 for _ in label.getroot().iter())
+
+    read_time = min(timeit.repeat(lambda: Label.from_file(filename, parser_backend=parser_backend),
+                                  number=1, repeat=repeat))
+
+    return num_read_elements, read_time
+
+
+def main(argv):
+
+    num_elements = [int(arg) for arg in argv] if argv else DEFAULT_NUM_ELEMENTS
+    directory = tempfile.mkdtemp()
+
+    try:
+
+        filenames = sorted(glob.glob(os.path.join(DATA_DIR, '*.xml')))
+
+        for num in num_elements:
+            filename = os.path.join(directory, 'label_{0}.xml'.format(num))
+            filenames.append(filename)
+
+            with io.open(filename, 'w', encoding='utf-8') as file_handler:
+                file_handler.write(make_label(num))
+
+        print('{0:>24} {1:>8} {2:>10} {3:>12} {4:>16}'.format(
+            'label', 'parser', 'elements', 'time (ms)', 'us per element'))
+
+        for filename in filenames:
+
+            for backend in get_parser_backends():
+                num_read_elements, read_time = benchmark(filename, parser_backend=backend)
+
+                print('{0:>24} {1:>8} {2:>10} {3:>12.1f} {4:>16.2f}'.format(
+                    os.path.basename(filename), backend, num_read_elements, read_time * 1e3,
+                    read_time * 1e6 / num_read_elements))
+
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
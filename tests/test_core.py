@@ -4,14 +4,19 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 
+import os
 import sys
+import time
+import pickle
+import threading
+import multiprocessing
 import xml.etree.ElementTree as ET
 
 from . import PDS4ToolsTestCase
 
-from pds4_tools import pds4_read
-from pds4_tools.reader.data import PDS_ndarray, PDS_marray
-from pds4_tools.reader.array_objects import ArrayStructure
+from pds4_tools import pds4_read, pds4_read_many
+from pds4_tools.reader.data import PDS_array, PDS_ndarray, PDS_marray
+from pds4_tools.reader.array_objects import ArrayStructure, Meta_ArrayStructure
 from pds4_tools.reader.table_objects import TableStructure, TableManifest
 from pds4_tools.reader.label_objects import Label
 
@@ -25,6 +30,22 @@ except ImportError:
     from ..extern.ordered_dict import OrderedDict
 
 
+def _failing_read_product(path, read_kwargs):
+    """ Replaces ``_read_product`` in `TestStructureList.test_read_many_failed_workers`.
+
+    The worker process exits for af.xml, an unpicklable result is returned for test_array_data_types.xml,
+    and a product without structures is returned otherwise.
+    """
+
+    if path.endswith('af.xml'):
+        os._exit(1)
+
+    elif path.endswith('test_array_data_types.xml'):
+        return path, [lambda: None], None
+
+    return path, [], None
+
+
 class TestStructureList(PDS4ToolsTestCase):
 
     def setup(self):
@@ -74,6 +95,181 @@ class TestStructureList(PDS4ToolsTestCase):
 
         assert len(self.structures) == 14
 
+    def test_concurrent_read(self):
+
+        from pds4_tools.reader.core import _read_structures_data
+
+        # Test structures read concurrently are in label order and match those read serially
+        structures = pds4_read(self.data('af.xml'), max_workers=4, quiet=True)
+
+        assert [structure.id for structure in structures] == [structure.id for structure in self.structures]
+
+        for structure, expected in zip(structures, self.structures):
+            assert structure.data_loaded
+            assert np.array_equal(structure.data, expected.data)
+
+        # Test that an error reading one structure does not prevent reading the others
+        structures = pds4_read(self.data('af.xml'), lazy_load=True, quiet=True)
+        structures[3].parent_filename = self.data('non_existent.dat')
+
+        _read_structures_data(structures, max_workers=4)
+
+        assert not structures[3].data_loaded
+        assert all(structure.data_loaded for i, structure in enumerate(structures) if i != 3)
+
+        with pytest.raises(IOError):
+            structures[3].data
+
+        # Test that structures sharing a single data file are read-in by multiple threads
+        from pds4_tools.reader import read_arrays, read_headers, read_tables
+
+        readers = [(read_arrays, 'read_array_data', read_arrays.read_array_data),
+                   (read_headers, 'read_header_data', read_headers.read_header_data),
+                   (read_tables, 'read_table_data', read_tables.read_table_data)]
+        threads = []
+
+        def record_thread(read_data):
+
+            def read_data_in_thread(*args, **kwargs):
+                threads.append(threading.current_thread())
+                time.sleep(0.05)
+
+                return read_data(*args, **kwargs)
+
+            return read_data_in_thread
+
+        for module, name, read_data in readers:
+            setattr(module, name, record_thread(read_data))
+
+        try:
+            structures = pds4_read(self.data('af.xml'), max_workers=4, quiet=True)
+
+        finally:
+            for module, name, read_data in readers:
+                setattr(module, name, read_data)
+
+        assert len(threads) == len(structures)
+        assert len(set(threads)) > 1
+        assert threading.current_thread() not in threads
+
+    def test_coalesced_read(self):
+
+        from pds4_tools.reader.core import _get_coalesced_blocks, _iter_coalesced_byte_data
+
+        # Test byte data of structures in the same data file is read together, one block at a time, into
+        # a single buffer of which each structure is given a view, that is released once the block has been
+        # read-in
+        structures = pds4_read(self.data('af.xml'), lazy_load=True, quiet=True)
+        blocks = list(_get_coalesced_blocks(structures))
+
+        assert len(blocks) == 1
+
+        for block in _iter_coalesced_byte_data(structures):
+
+            buffer = block[0]._byte_data.base
+            assert buffer is not None
+
+            for structure in block:
+                assert (structure._byte_data.base is buffer) and structure._byte_data.flags.writeable
+
+            for structure, expected in zip(block, self.structures):
+
+                if structure.is_header():
+                    assert structure.data == expected.data
+                else:
+                    assert np.array_equal(structure.data, expected.data)
+
+        assert all(structure._byte_data is None for structure in structures)
+
+        # Test byte ranges are only merged when separated by at most the maximum gap size
+        blocks = _get_coalesced_blocks(structures, max_gap_size=0)
+        assert len(blocks) == 7
+        assert [structure for block in blocks for structure in block] == list(structures)
+
+        # Test byte data is read only when its block is reached, and structures larger than the maximum
+        # block size are read as usual
+        structures = pds4_read(self.data('af.xml'), lazy_load=True, quiet=True)
+        blocks = _iter_coalesced_byte_data(structures, max_block_size=30000)
+
+        block = next(blocks)
+        assert (block == [structures[0]]) and (structures[0]._byte_data is None)
+        assert structures[2]._byte_data is None
+
+        block = next(blocks)
+        assert (block == [structures[1]]) and (structures[1]._byte_data is None)
+
+        block = next(blocks)
+        assert structures[2] in block
+        assert structures[2]._byte_data is not None
+
+    def test_read_many(self):
+
+        paths = [self.data('af.xml'), self.data('test_array_data_types.xml')]
+
+        # Test products read in parallel match those read by pds4_read, in any order
+        results = dict(pds4_read_many(paths, max_workers=2))
+        assert sorted(results.keys()) == sorted(paths)
+
+        for path in paths:
+
+            expected = pds4_read(path, quiet=True)
+            assert [structure[0:2] for structure in results[path]] == [(structure.id, structure.type)
+                                                                        for structure in expected]
+
+            for (_, _, data, meta_data), structure in zip(results[path], expected):
+                assert np.array_equal(data, structure.data)
+                assert list(meta_data.items()) == list(structure.meta_data.items())
+
+        # Test lazy_load returns only meta data, and that results can be pickled
+        results = list(pds4_read_many(paths[0:1], max_workers=1, lazy_load=True))
+        assert results[0][1][1][2] is None
+        assert results[0][1][1][3]['local_identifier'] == self.structures[1].id
+        pickle.loads(pickle.dumps(results))
+
+        # Test on_error handling
+        paths = [self.data('non_existent.xml')] + paths
+
+        with pytest.raises(IOError):
+            list(pds4_read_many(paths, max_workers=2, max_pending=1))
+
+        results = list(pds4_read_many(paths, max_workers=2, on_error='skip'))
+        assert len(results) == 2
+
+        results = dict(pds4_read_many(paths, max_workers=2, on_error='return'))
+        assert isinstance(results[paths[0]], IOError)
+
+        with pytest.raises(ValueError):
+            list(pds4_read_many(paths, on_error='ignore'))
+
+    def test_read_many_failed_workers(self):
+
+        from pds4_tools.reader import core
+
+        # Workers must inherit the replaced reader below
+        start_method = getattr(multiprocessing, 'get_start_method', lambda: 'fork')()
+        if (start_method != 'fork') or sys.platform.startswith('win'):
+            pytest.skip('Requires worker processes to be forked.')
+
+        paths = [self.data('af.xml'), self.data('test_array_data_types.xml'),
+                 self.data('Product_DelimitedTable.xml')]
+
+        read_product = core._read_product
+        core._read_product = _failing_read_product
+
+        # Test that products whose worker exits, or whose result cannot be pickled, are reported as failed
+        try:
+            results = dict(pds4_read_many(paths, max_workers=2, on_error='return'))
+
+            with pytest.raises(RuntimeError):
+                list(pds4_read_many(paths[0:1], max_workers=2))
+
+        finally:
+            core._read_product = read_product
+
+        assert isinstance(results[paths[0]], RuntimeError)
+        assert isinstance(results[paths[1]], Exception)
+        assert results[paths[2]] == []
+
 
 class TestArrayStructure(PDS4ToolsTestCase):
 
@@ -117,6 +313,96 @@ class TestArrayStructure(PDS4ToolsTestCase):
         _check_array_equal(data[10, 5, 6:11], [9284,  6546,  7293,  8380, 10138], 'int32')
         _check_array_equal(data[-1, -1, -5:], [21028, 25200, 22548, 18596, 20444], 'int32')
 
+    def test_section_cache(self):
+
+        structure = self.structure
+        section = structure.section
+        section.set_cache(max_bytes=2**20, tile_shape=(4, 4, 16))
+
+        # Test that sections assembled from tiles match the data, including sections selected via
+        # integers, negative steps and spanning multiple tiles
+        indexes = [(slice(2, 9), slice(None), slice(5, 30)), (-1, slice(None, None, -3), 7),
+                   (slice(20, 0, -2), 5), (3, 4, 35), slice(None)]
+
+        for idx in indexes:
+            assert np.array_equal(section[idx], structure.data[idx])
+
+        assert isinstance(section[0:2], PDS_ndarray)
+        assert section[0:2].meta_data is structure.meta_data
+
+        # Test repeated access is served from the cache
+        misses = section.cache.misses
+        section[2:9, :, 5:30]
+
+        assert section.cache.misses == misses
+        assert section.cache.hits > 0
+
+        # Test least recently used tiles are discarded once the memory budget is exceeded
+        section.set_cache(max_bytes=4*4*16*4*2, tile_shape=(4, 4, 16))
+        assert np.array_equal(section[:], structure.data)
+        assert section.cache.nbytes <= section.cache.max_bytes
+        assert 0 < len(section.cache) < section.cache.misses
+
+        # Test disabling the cache
+        section.set_cache(max_bytes=0)
+        assert section.cache is None
+        assert np.array_equal(section[1:3], structure.data[1:3])
+
+    def test_stats(self):
+
+        structure = self.structure
+        data = structure.data.astype('float64')
+
+        # Test statistics of the entire array, and of each index of an axis, streamed in small chunks
+        stats = structure.stats(chunk_bytes=1000)
+
+        assert stats['count'] == data.size
+        assert np.isclose(stats['mean'], data.mean()) and np.isclose(stats['std'], data.std())
+        assert (stats['min'] == data.min()) and (stats['max'] == data.max())
+        assert np.array_equal(stats['histogram'][0], np.histogram(data, bins=256)[0])
+        assert abs(stats['percentiles'][50] - np.median(data)) < (data.max() - data.min()) * 1e-3
+
+        stats = structure.stats(axis=2, chunk_bytes=1000, bins=None, max_workers=2)
+
+        assert np.allclose(stats['mean'], data.mean(axis=(0, 1)))
+        assert np.allclose(stats['max'], data.max(axis=(0, 1)))
+        assert 'histogram' not in stats
+
+        # Test chunks smaller than a single index of the first axis, which are split along trailing axes
+        for axis in (None, 0, 1, 2):
+
+            stats = structure.stats(axis=axis, chunk_bytes=2000, percentiles=None)
+            axes = None if (axis is None) else tuple(i for i in range(0, data.ndim) if i != axis)
+
+            assert np.allclose(stats['mean'], data.mean(axis=axes))
+            assert np.allclose(stats['std'], data.std(axis=axes))
+            assert np.array_equal(stats['min'], data.min(axis=axes))
+
+        # Test that blocks cover the array once, and fit within the memory budget where possible
+        from pds4_tools.reader.array_objects import _get_block_slices
+
+        for shape, max_bytes in (((4, 5, 6), 1000), ((4, 5, 6), 100), ((4, 5, 6), 10), ((4, 5, 6), 1)):
+
+            covered = np.zeros(shape, dtype='int64')
+
+            for block_slice in _get_block_slices(shape, 4, max_bytes):
+                covered[block_slice] += 1
+                assert covered[block_slice].size * 4 <= max(4, max_bytes)
+
+            assert (covered == 1).all()
+
+        # Test that Special_Constants and NaNs are excluded
+        meta_data = Meta_ArrayStructure(structure.meta_data)
+        meta_data['Element_Array'] = {'data_type': 'IEEE754MSBDouble', 'scaling_factor': 2}
+        meta_data['Special_Constants'] = {'missing_constant': -1}
+
+        data = PDS_array(np.array([[1, -1], [np.nan, 3]]), meta_data)
+        structure = ArrayStructure(structure_data=data, structure_meta_data=meta_data)
+        stats = structure.stats()
+
+        assert (stats['count'], stats['nan_count'], stats['masked_count']) == (2, 1, 1)
+        assert (stats['min'], stats['max'], stats['mean']) == (1, 3, 2)
+
 
 class TestTableStructure(PDS4ToolsTestCase):
 
@@ -246,6 +532,265 @@ class TestTableStructure(PDS4ToolsTestCase):
         self.structure.data
         assert self.structure.data_loaded
 
+    def test_section(self):
+
+        # Test fixed-width tables (with and without group fields and scaling, and with ASCII integers whose
+        # data type depends on their values) and a delimited table
+        structures = [self.structure,
+                      pds4_read(self.data('af.xml'), lazy_load=True, quiet=True)[9],
+                      pds4_read(self.data('colors.xml'), lazy_load=True, quiet=True)[0],
+                      pds4_read(self.data('test_table_data_types.xml'), lazy_load=True, quiet=True)[0],
+                      pds4_read(self.data('Product_DelimitedTable.xml'), lazy_load=True, quiet=True)[0]]
+
+        for structure in structures:
+
+            section = structure.section
+            num_records = len(section)
+
+            # Test that only the section was read
+            assert not structure.data_loaded
+
+            mask = np.arange(num_records) % 3 == 0
+            idxs = [slice(-3, None), slice(None, None, -2), [0, -1, num_records // 2], mask]
+
+            # Test that sections have the same data type as each other, or as the entire table if requested
+            # (in the delimited table, some values of the MODE field are longer than its label allows)
+            section_dtypes = set(section[idx].dtype for idx in idxs)
+            assert (len(section_dtypes) == 1) or structure.meta_data.is_delimited()
+
+            section.consistent_dtype = True
+
+            for idx in idxs:
+                section_data = section[idx]
+                data = structure.data[idx]
+
+                assert isinstance(section_data, type(data))
+                assert section_data.dtype == data.dtype
+
+                for name in data.dtype.names:
+                    assert np.array_equal(section_data[name], data[name])
+
+            # Test retrieval of a single record
+            name = structure.data.dtype.names[0]
+            assert np.array_equal(section[-1][name], structure.data[-1][name])
+
+            # Test proper error type on retrieval attempt of non-existent record
+            with pytest.raises(IndexError):
+                section[num_records]
+
+    def test_section_records_read(self):
+
+        from pds4_tools.reader import read_tables
+
+        extract_table_fields = read_tables._extract_table_fields
+        num_extracted = []
+
+        def count_extracted(table_structure, table_manifest, records, *args, **kwargs):
+            is_delimited = not isinstance(records, np.ndarray)
+            num_extracted.append(records.count(b'\r\n') + 1 if is_delimited else len(records))
+
+            return extract_table_fields(table_structure, table_manifest, records, *args, **kwargs)
+
+        # Test that, unless requested, reading a section or iterating over chunks does not scan the entire
+        # table, including for fields whose data type depends on their values
+        read_tables._extract_table_fields = count_extracted
+
+        try:
+            for filename in ['colors.xml', 'test_table_data_types.xml', 'Product_DelimitedTable.xml']:
+
+                structure = pds4_read(self.data(filename), lazy_load=True, quiet=True)[0]
+                num_records = len(structure.section)
+
+                del num_extracted[:]
+                structure.section[-2:]
+                assert sum(num_extracted) == 2
+
+                del num_extracted[:]
+                chunks = list(structure.iter_chunks(5))
+                assert sum(num_extracted) == num_records
+                assert (len(set(chunk.dtype for chunk in chunks)) == 1) or structure.meta_data.is_delimited()
+
+                structure.section.consistent_dtype = True
+
+                del num_extracted[:]
+                structure.section[-2:]
+                assert sum(num_extracted) == num_records + 2
+
+        finally:
+            read_tables._extract_table_fields = extract_table_fields
+
+        # Test that sections and chunks have the data type obtained from the label, unless values do not
+        # fit in it
+        structure.section.consistent_dtype = False
+        records = [structure.section[idx:idx + 1] for idx in range(0, num_records)]
+
+        for data in records + chunks:
+            assert data['INDEX'].dtype == np.dtype('U6')
+            assert data['GROUP_0, ELECTRON COUNTS'].dtype == np.dtype('int32')
+            assert data['MODE'].dtype in (np.dtype('U7'), np.dtype('U8'))
+
+    def test_iter_chunks(self):
+
+        from pds4_tools.reader import read_tables
+
+        # Test fixed-width tables and a delimited table
+        filenames = ['af.xml', 'colors.xml', 'Product_DelimitedTable.xml']
+
+        for filename in filenames:
+
+            structure = pds4_read(self.data(filename), stream=True, quiet=True)[-1]
+            assert not structure.data_loaded
+
+            chunks = list(structure.iter_chunks(7))
+            assert not structure.data_loaded
+
+            # Test each chunk matches the equivalent records in the full table
+            assert [len(chunk) for chunk in chunks[:-1]] == [7] * (len(chunks) - 1)
+            assert sum([len(chunk) for chunk in chunks]) == len(structure.data)
+
+            for i, chunk in enumerate(chunks):
+                for name in chunk.dtype.names:
+                    assert np.array_equal(chunk[name], structure.data[name][i*7:(i+1)*7])
+
+            # Test chunks are views of already loaded data
+            assert list(structure.iter_chunks(1000))[0].base is not None
+
+        # Test joined chunks are identical to the full table, including for fields whose data type depends
+        # on their values (e.g. ASCII integers, and strings in delimited tables)
+        for filename in ['test_table_data_types.xml', 'colors.xml', 'Product_DelimitedTable.xml']:
+
+            structure = pds4_read(self.data(filename), stream=True, quiet=True)[0]
+            chunks = list(structure.iter_chunks(1, consistent_dtype=True))
+
+            data = structure.data
+            joined_data = np.ma.concatenate(chunks) if np.ma.isMaskedArray(data) else np.concatenate(chunks)
+
+            assert joined_data.dtype == data.dtype
+            assert all(chunk.dtype == data.dtype for chunk in chunks)
+
+            for name in data.dtype.names:
+                assert np.array_equal(joined_data[name], data[name])
+
+        # Test that splitting records is unaffected by how the data file is read for delimited tables
+        structure = pds4_read(self.data('Product_DelimitedTable.xml'), lazy_load=True, quiet=True)[0]
+        records = read_tables._read_table_byte_data(structure).split(b'\r\n')[0:20]
+
+        for block_size in (1, 2, 13):
+            chunks = list(read_tables._iter_delimited_records(structure, 3, block_size=block_size))
+            assert [len(chunk) for chunk in chunks] == [3] * 6 + [2]
+            assert sum(chunks, []) == records
+
+        with pytest.raises(ValueError):
+            list(structure.iter_chunks(0))
+
+    def test_lazy_field(self):
+
+        for filename in ['af.xml', 'colors.xml', 'Product_DelimitedTable.xml']:
+
+            structure = pds4_read(self.data(filename), lazy_load=True, quiet=True)[-1]
+            lazy_structure = pds4_read(self.data(filename), lazy_load=True, quiet=True)[-1]
+
+            # Test fields are read individually, and cached, without reading the entire table
+            fields = [lazy_structure.field(0), lazy_structure.field(-1)]
+            name = fields[0].meta_data['name']
+
+            assert lazy_structure.field(name) is fields[0]
+            assert np.array_equal(lazy_structure[name], structure[name])
+            assert not lazy_structure.data_loaded
+
+            for i, field in zip([0, -1], fields):
+                assert field.dtype == structure.field(i).dtype
+                assert np.array_equal(field, structure.field(i))
+
+            # Test retrieval of multiple fields by name, in the requested order
+            names = [fields[-1].meta_data.full_name(), name]
+            assert lazy_structure[names].dtype.names == structure[names].dtype.names
+            assert not lazy_structure.data_loaded
+
+        with pytest.raises(ValueError):
+            lazy_structure.field('Not a Field')
+
+        with pytest.raises(IndexError):
+            lazy_structure.field(len(structure.fields))
+
+    def test_read_fields(self):
+
+        # Test a binary table that can be read via a record dtype, a binary table that cannot,
+        # a character table and a delimited table
+        tables = [('af.xml', 9), ('af.xml', 3), ('colors.xml', 0), ('Product_DelimitedTable.xml', 0)]
+
+        for filename, structure_idx in tables:
+
+            structure = pds4_read(self.data(filename), lazy_load=True, quiet=True)[structure_idx]
+            names = [field.meta_data.full_name() for field in structure.fields]
+            selected_names = [names[-1], names[0]]
+
+            structure = pds4_read(self.data(filename), lazy_load=True, quiet=True)[structure_idx]
+            data = structure.read_fields(selected_names)
+            assert not structure.data_loaded
+
+            # Test only the selected fields are read, in table order, and match the full table
+            assert list(data.dtype.names) == [names[0], names[-1]]
+
+            for name in data.dtype.names:
+                assert np.array_equal(data[name], structure.data[name])
+
+        with pytest.raises(ValueError):
+            structure.read_fields(['Not a Field'])
+
+        # Test fields requested via pds4_read
+        for filename in ['colors.xml', 'Product_DelimitedTable.xml']:
+
+            structure = pds4_read(self.data(filename), quiet=True)[0]
+            names = list(structure.data.dtype.names)
+            fields = {structure.id: [names[2], names[1]]}
+
+            structure = pds4_read(self.data(filename), fields=fields, quiet=True)[0]
+            assert list(structure.data.dtype.names) == names[1:3]
+            assert list(structure.section[0:2].dtype.names) == names[1:3]
+
+    def test_uniformly_sampled(self):
+
+        from math import log10
+        from pds4_tools.reader import read_tables
+        from pds4_tools.reader.table_objects import TableManifest, UniformlySampledArray
+
+        structure = pds4_read(self.data('manifest_tester.xml'), lazy_load=True, quiet=True)[0]
+        meta_data = TableManifest.from_label(structure.label).uniformly_sampled_fields()[0]
+        num_records = structure.meta_data['records']
+
+        # Test each scale, including integers exceeding 8 bytes, against values computed one at a time
+        samplings = [('Linear', 0.5, 0.1, [0.5 + j*0.1 for j in range(num_records)]),
+                     ('Logarithmic', 2, 1.5, [2 * 1.5**j for j in range(num_records)]),
+                     ('Exponential', 1, 3.0, [log10(10 + j*3.0) for j in range(num_records)]),
+                     ('Linear', 2**70, 3, [2**70 + j*3 for j in range(num_records)])]
+
+        for scale, first_value, interval, expected in samplings:
+
+            meta_data['scale'] = scale
+            meta_data['first_value'] = first_value
+            meta_data['last_value'] = expected[-1]
+            meta_data['interval'] = interval
+            meta_data['base'] = 10
+
+            data = read_tables._make_uniformly_sampled_field(structure, meta_data)
+            assert np.allclose(data.astype('float64'), np.asarray(expected, dtype='float64'))
+
+            # Test the lazy version of the field
+            lazy_data = UniformlySampledArray(structure, meta_data)
+
+            assert lazy_data.dtype == data.dtype
+            assert lazy_data.shape == data.shape
+            assert lazy_data[-1] == data[-1]
+            assert np.array_equal(lazy_data[10:20], data[10:20])
+            assert np.array_equal(lazy_data[[5, 2]], data[[5, 2]])
+            assert np.array_equal(lazy_data, data)
+
+        assert data.dtype == 'object'
+        assert data[-1] == expected[-1]
+
+        assert isinstance(structure.field('Test_Col', lazy=True), UniformlySampledArray)
+
 
 class TestCharacterTable(PDS4ToolsTestCase):
 
@@ -328,6 +873,74 @@ class TestDelimitedTable(PDS4ToolsTestCase):
         assert len(structure.data.dtype) == 6
         assert len(structure.data) == 20
 
+    def test_tokenize(self):
+
+        from pds4_tools.reader import read_tables
+
+        structure = self.structure
+        structure.meta_data['field_delimiter'] = 'Semicolon'
+
+        records = b'a;"b;c";1\r\n"d";e"f;g"\r\n\r\n;"h"'
+        byte_data, record_starts, start_bytes, stop_bytes = read_tables._tokenize_delimited_records(
+                                                                              records, structure, 3)
+
+        # Test values, including those enclosed by quotes and missing values, for each column
+        values = [read_tables._extract_delimited_field_data(byte_data, record_starts, start_bytes,
+                                                            stop_bytes, column, (4, )).tolist()
+                  for column in range(0, 3)]
+
+        assert values == [[b'a', b'd', b'', b''],
+                          [b'b;c', b'e"f', b'', b'h'],
+                          [b'1', b'g"', b'', b'']]
+
+        # Test tokenizing in blocks
+        block_tokens = read_tables._tokenize_delimited_records(records, structure, 3, block_size=4)
+
+        assert np.array_equal(block_tokens[2], start_bytes)
+        assert np.array_equal(block_tokens[3], stop_bytes)
+
+    def test_parallel(self):
+
+        from pds4_tools.reader import read_tables
+        from pds4_tools.reader.table_objects import TableManifest
+
+        structure = self.structure
+        table_byte_data = read_tables._read_table_byte_data(structure)
+
+        serial_fields = read_tables._extract_table_fields(structure, TableManifest.from_label(structure.label),
+                                                          table_byte_data)
+
+        # Test that the fields parsed in chunks by multiple processes match those parsed serially
+        for max_workers in (2, 3, 7, 50):
+
+            parallel_fields = read_tables._extract_delimited_fields_parallel(
+                structure, TableManifest.from_label(structure.label), max_workers, min_chunk_size=1)
+
+            assert len(parallel_fields) == len(serial_fields)
+
+            for serial_field, parallel_field in zip(serial_fields, parallel_fields):
+
+                assert parallel_field.dtype == serial_field.dtype
+                assert parallel_field.shape == serial_field.shape
+                assert np.array_equal(np.ma.getdata(parallel_field), np.ma.getdata(serial_field))
+                assert np.array_equal(np.ma.getmaskarray(parallel_field), np.ma.getmaskarray(serial_field))
+
+        # Test extracting only some of the fields
+        table_manifest = TableManifest.from_label(structure.label)
+        fields = table_manifest.fields()[1::2]
+
+        parallel_fields = read_tables._extract_delimited_fields_parallel(
+            structure, table_manifest, 3, fields=fields, min_chunk_size=1)
+
+        assert len(parallel_fields) == len(fields)
+
+        for serial_field, parallel_field in zip(serial_fields[1::2], parallel_fields):
+            assert np.array_equal(np.ma.getdata(parallel_field), np.ma.getdata(serial_field))
+
+        # Test reading the table via pds4_read
+        structures = pds4_read(self.data('Product_DelimitedTable.xml'), max_workers=2, quiet=True)
+        assert np.array_equal(structures[0].data, structure.data)
+
 
 class TestBinaryTable(PDS4ToolsTestCase):
 
@@ -356,6 +969,74 @@ class TestBinaryTable(PDS4ToolsTestCase):
         assert len(structure.data.dtype) == 9
         assert len(structure.data) == 21
 
+    def test_record_dtype(self):
+
+        from pds4_tools.reader import read_tables
+
+        # Table having only binary numeric fields is read directly via a record dtype
+        structure = pds4_read(self.data('af.xml'), lazy_load=True, quiet=True)[9]
+        table_manifest = TableManifest.from_label(structure.label)
+        record_dtype = read_tables._get_binary_record_dtype(structure, table_manifest, no_scale=False)
+
+        assert record_dtype.itemsize == structure.meta_data.record['record_length']
+        assert structure.data.flags.writeable
+        assert structure.data.meta_data[structure.data.dtype.names[0]] is not None
+
+        # Test values and shape of a deeply nested field
+        assert structure.field(0).shape == (21, 3, 10, 5)
+        _check_array_equal(structure.field(0)[11, 2, 5, 2:5], [-0.52061242, -0.51312923, -0.50972084], 'float64')
+        _check_array_equal(structure.field(-1)[0, 0:3], [98.82191017, 98.29215015, 97.7588184], 'float64')
+
+        # Table containing a string field cannot be read via a record dtype
+        structure = self.structure
+        table_manifest = TableManifest.from_label(structure.label)
+        assert read_tables._get_binary_record_dtype(structure, table_manifest, no_scale=False) is None
+
+    def test_native_byteorder(self):
+
+        structures = pds4_read(self.data('af.xml'), lazy_load=True, quiet=True, native_byteorder=True)
+
+        # Test tables read via a record dtype and via field extraction
+        for structure in (structures[9], structures[3]):
+
+            data = structure.data
+
+            assert data.dtype.isnative
+            assert data.meta_data[data.dtype.names[0]].original_byteorder == '>'
+
+        _check_array_equal(structures[3].field(-1)[-5:], [2603, 2602, 2603, 2603, 2604], 'int16')
+        _check_array_equal(structures[9].field(-1)[0, 0:3], [98.82191017, 98.29215015, 97.7588184], 'float64')
+
+        # Test tables containing GROUP fields, whose subarray dtypes are not checked by ``dtype.isnative``
+        structures = pds4_read(self.data('test_group_fields.xml'), lazy_load=True, quiet=True)
+        native_structures = pds4_read(self.data('test_group_fields.xml'), lazy_load=True, quiet=True,
+                                      native_byteorder=True)
+
+        for structure, native_structure in zip(structures, native_structures):
+
+            data = native_structure.data
+
+            for name in data.dtype.names:
+                assert data.dtype.fields[name][0].base.isnative
+                assert np.array_equal(data[name], structure.data[name])
+
+        # Test sections and chunks, read via a record dtype and via field extraction
+        structures = pds4_read(self.data('af.xml'), lazy_load=True, quiet=True, native_byteorder=True)
+
+        for structure in (structures[9], structures[3], structures[11]):
+
+            section = structure.section[2:5]
+            chunks = list(structure.iter_chunks(3))
+
+            for data in [section] + chunks:
+
+                for name in data.dtype.names:
+                    assert data.dtype.fields[name][0].base.isnative
+
+            for name in structure.data.dtype.names:
+                assert np.array_equal(section[name], structure.data[name][2:5])
+                assert np.array_equal(np.concatenate([chunk[name] for chunk in chunks]), structure.data[name])
+
 
 class TestGroupFields(PDS4ToolsTestCase):
 
@@ -605,6 +1286,63 @@ class TestLabel(PDS4ToolsTestCase):
 
     # def test_findtext(self):
 
+    def test_element_map(self):
+
+        # Test found elements in both roots correspond, for either default root
+        for default_root, prefix in (('convenient', ''), ('unmodified', 'pds:')):
+
+            self.label.default_root = default_root
+            found = (self.label.findall('.//{0}Field_Binary'.format(prefix)) +
+                     [self.label.find('.//{0}Table_Binary'.format(prefix))])
+
+            for element in found:
+                unmodified = element.getroot(unmodified=True)
+                convenient = element.getroot(unmodified=False)
+
+                assert unmodified.tag.endswith('}' + convenient.tag)
+                assert element.getroot(unmodified=None) is (unmodified if default_root == 'unmodified'
+                                                             else convenient)
+
+        # Test the element map is built on first use for labels not read from file, and shared with
+        # found elements
+        label = self.label.copy()
+        assert label._element_map is None
+
+        field = label.find('.//Field_Binary', unmodified=False)
+        assert field._element_map is label._element_map
+        assert xml_equal(field.getroot(unmodified=True), self.label.find('.//pds:Field_Binary',
+                                                                         unmodified=True).getroot())
+
+        # Test elements added after the element map was built are found
+        label.getroot(unmodified=False).append(ET.Element('new_element'))
+        label.getroot(unmodified=True).append(ET.Element('{http://pds.nasa.gov/pds4/pds/v1}new_element'))
+
+        new_element = label.find('new_element', unmodified=False)
+        assert new_element.getroot(unmodified=True).tag.endswith('}new_element')
+
+    def test_match_cache(self):
+
+        # Test resolved searches are cached, and shared with found elements
+        file_area = self.label.find('.//pds:File_Area_Observational', unmodified=True)
+        assert file_area._match_cache is self.label._match_cache
+
+        file_name1 = file_area.findtext('pds:File/pds:file_name', unmodified=True)
+        file_name2 = file_area.findtext('pds:File/pds:file_name', unmodified=True)
+        assert file_name1 == file_name2 == self.label.findtext('.//file_name', unmodified=False)
+
+        resolved_match = '{http://pds.nasa.gov/pds4/pds/v1}File/{http://pds.nasa.gov/pds4/pds/v1}file_name'
+        assert self.label._match_cache[('pds:File/pds:file_name', None, True)] == resolved_match
+
+        # Test searches with the same prefix for different namespaces are cached separately
+        namespaces = {'fake_prefix': 'http://pds.nasa.gov/pds4/disp/v1'}
+        assert self.label.find('.//fake_prefix:label_keyword', namespaces=namespaces) is None
+        assert self.label.find('.//fake_prefix:label_keyword') is not None
+
+        # Test unknown prefixes raise an error each time
+        for i in range(0, 2):
+            with pytest.raises(SyntaxError):
+                self.label.find('.//unknown_prefix:title')
+
     def test_unicode(self):
 
         # Test unicode element tag and text
@@ -634,6 +1372,52 @@ class TestLabel(PDS4ToolsTestCase):
                                   'http://pds.nasa.gov/pds4/fake_prefix/v1': 'fake_prefix',
                                   'http://www.w3.org/2001/XMLSchema-instance': 'xsi'}
 
+    def test_from_file(self):
+
+        from pds4_tools.reader.read_label import read_label
+
+        # Test the convenient root, derived from the unmodified root, matches the label read with
+        # whitespace stripped and default prefixes enforced
+        filename = self.data('test_label.xml')
+        convenient_root, convenient_map = read_label(filename, strip_extra_whitespace=True,
+                                                     enforce_default_prefixes=True,
+                                                     include_namespace_map=True, decode_py2=True)
+
+        assert xml_equal(self.label.getroot(unmodified=False), convenient_root)
+        assert self.label.get_namespace_map(unmodified=False) == convenient_map
+
+        # Test the unmodified root is left unmodified
+        unmodified_root = read_label(filename, strip_extra_whitespace=False, enforce_default_prefixes=False,
+                                     decode_py2=True)
+
+        assert xml_equal(self.label.getroot(unmodified=True), unmodified_root)
+
+    def test_parser_backend(self):
+
+        from pds4_tools.reader.read_label import get_parser_backend
+
+        # Test unknown parser backends raise an error
+        with pytest.raises(ValueError):
+            Label.from_file(self.data('test_label.xml'), parser_backend='unknown_parser')
+
+        assert get_parser_backend('etree') == 'etree'
+        assert get_parser_backend('auto') in ('etree', 'lxml')
+
+        # Test labels read via lxml are identical to those read via ElementTree
+        pytest.importorskip('lxml')
+
+        for filename in ('test_label.xml', 'af.xml', 'test_table_data_types.xml'):
+            etree_label = Label.from_file(self.data(filename), parser_backend='etree')
+            lxml_label = Label.from_file(self.data(filename), parser_backend='lxml')
+
+            for unmodified in (True, False):
+                lxml_root = lxml_label.getroot(unmodified=unmodified)
+
+                assert isinstance(lxml_root, ET.Element)
+                assert xml_equal(lxml_root, etree_label.getroot(unmodified=unmodified))
+                assert lxml_label.get_namespace_map(unmodified=unmodified) == \
+                       etree_label.get_namespace_map(unmodified=unmodified)
+
     def test_to_dict(self):
 
         target_ident = self.label.find('.//Target_Identification')
@@ -895,6 +1679,29 @@ class TestTableDataTypes(PDS4ToolsTestCase):
         overflow_base16 = [17396744073709550582, 36893488147419103231, 73786976294838206465]
         _check_array_equal(table['Overflow ASCII_Numeric_Base16'], overflow_base16, 'object')
 
+    def test_ascii_integer_parsing(self):
+
+        from pds4_tools.reader.data_types import data_type_convert_table_ascii
+
+        # Test whitespace, signs and 64-bit limits
+        data = np.array([b' 12 ', b'-9223372036854775808', b'+7', b'\t-0'])
+        _check_array_equal(data_type_convert_table_ascii('ASCII_Integer', data),
+                           [12, -9223372036854775808, 7, 0], 'int64')
+
+        data = np.array([b'  ff', b'FFFFFFFFFFFFFFFF', b'0x10'])
+        _check_array_equal(data_type_convert_table_ascii('ASCII_Numeric_Base16', data),
+                           [255, 18446744073709551615, 16], 'uint64')
+
+        # Test values exceeding 64-bits are parsed into Python integers
+        data = np.array([b'-1' + b'0' * 64, b'101'])
+        _check_array_equal(data_type_convert_table_ascii('ASCII_Numeric_Base2', data),
+                           [-2**64, 5], 'object')
+
+        # Test invalid values
+        for value in [b'1 2', b'-', b'', b'12a']:
+            with pytest.raises(ValueError):
+                data_type_convert_table_ascii('ASCII_Integer', np.array([b'1', value]))
+
     def test_scaling(self):
 
         table = self.table
@@ -1018,6 +1825,85 @@ class TestArrayDataTypes(PDS4ToolsTestCase):
         # Test Float Scaling/Offset
         _check_array_equal(structures['Float Scaling/Offset'].data, [-3.2e+48, 3.2e+48, 1234.0], 'float64')
 
+    def test_read_into(self):
+
+        from pds4_tools.reader.read_arrays import _read_array_data_into
+
+        structures = self.structures
+
+        # Test that data scaled in-place, one element at a time, matches the expected values
+        data = _read_array_data_into(structures['Integer Scaling/Offset 1'], no_scale=False, chunk_size=1)
+        _check_array_equal(data, [987654540100, -987654539900, 100], 'int64')
+
+        data = _read_array_data_into(structures['Float Scaling/Offset'], no_scale=False, chunk_size=2)
+        _check_array_equal(data, [-3.2e+48, 3.2e+48, 1234.0], 'float64')
+
+        data = _read_array_data_into(structures['Float Scaling/Offset'], no_scale=True)
+        assert data.dtype == '>f4'
+
+    def test_native_byteorder(self):
+
+        structures = pds4_read(self.data('test_array_data_types.xml'), native_byteorder=True, quiet=True)
+
+        for name in ('SignedMSB2', 'UnsignedMSB8', 'SignedLSB4'):
+            assert structures[name].data.dtype.isnative
+            assert np.array_equal(structures[name].data, self.structures[name].data)
+
+        assert structures['SignedMSB2'].meta_data.original_byteorder == '>'
+        assert structures['SignedByte'].meta_data.original_byteorder is None
+
+        # Test lazily scaled arrays
+        structures = pds4_read(self.data('test_array_data_types.xml'), native_byteorder=True, scale_mode='lazy',
+                               quiet=True)
+
+        assert structures['UnsignedMSB4'].data[0:2].dtype.isnative
+        _check_array_equal(structures['UnsignedMSB4'].data[:], [50349235, 3994967214, 243414], 'uint32')
+
+    def test_lazy_scaling(self):
+
+        from pds4_tools.reader.array_objects import LazyScaledArray
+
+        structures = pds4_read(self.data('test_array_data_types.xml'), scale_mode='lazy', quiet=True)
+
+        # Test that unscaled data is not wrapped
+        assert not isinstance(structures['SignedMSB2'].data, LazyScaledArray)
+
+        # Test that scaled data is scaled on access
+        scaled_integers1 = [987654540100, -987654539900, 100]
+        data = structures['Integer Scaling/Offset 1'].data
+
+        assert isinstance(data, LazyScaledArray)
+        assert data._data.dtype == '>i2'
+        assert data.shape == (3, )
+
+        _check_array_equal(data[:], scaled_integers1, 'int64')
+        _check_array_equal(data[1:], scaled_integers1[1:], 'int64')
+        assert data[0] == scaled_integers1[0]
+
+        # Test ufuncs, operators and reductions
+        data._chunk_size = 2
+        _check_array_equal(data + 1, [value + 1 for value in scaled_integers1], 'int64')
+        _check_array_equal(np.negative(data), [-value for value in scaled_integers1], 'int64')
+
+        assert data.max() == max(scaled_integers1)
+        assert data.sum() == sum(scaled_integers1)
+
+        _check_array_equal(structures['Float Scaling/Offset'].data[:], [-3.2e+48, 3.2e+48, 1234.0], 'float64')
+
+    def test_bitmask(self):
+
+        from pds4_tools.reader.read_arrays import _apply_bitmask
+
+        # Test signed and unsigned data, with values of special constants left unmodified
+        data = np.array([-1, 0x7F0F, -32768, 255, -1], dtype='>i2')
+        _apply_bitmask(data, '0000111111110000', special_constants={'missing_constant': -32768,
+                                                                   'valid_maximum': 255}, chunk_size=2)
+        _check_array_equal(data, [0x0FF0, 0x0F00, -32768, 0xF0, 0x0FF0], 'int16')
+
+        data = np.array([2**64 - 1, 1], dtype='uint64')
+        _apply_bitmask(data, '0' + '1' * 62 + '0')
+        _check_array_equal(data, [2**63 - 2, 0], 'uint64')
+
 
 def _check_array_equal(unknown_array, known_array, known_typecode):
 